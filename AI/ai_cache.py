@@ -0,0 +1,114 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+from console import Console
+
+
+class AICache:
+    """
+    Content-addressed cache of AI analyses, persisted as JSON.
+    Keys are a hash of the normalized text plus a prompt/model fingerprint,
+    entries are evicted least-recently-used once max_entries is reached.
+    """
+
+    def __init__(self, path: Optional[str], fingerprint: str, max_entries: int = 20000):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path:
+            self._load()
+
+    @staticmethod
+    def make_fingerprint(*parts: Any) -> str:
+        """Fingerprint of everything that changes the AI answer (prompt, model, ...)"""
+        joined = "\x00".join(str(part) for part in parts)
+        return hashlib.sha256(joined.encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join((text or "").lower().split())
+
+    def key(self, text: str) -> str:
+        data = f"{self.fingerprint}\x00{self.normalize(text)}".encode("utf-8")
+        return hashlib.sha256(data).hexdigest()[:32]
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            # Stored oldest first, so insertion order is the LRU order
+            for key, analysis in data.get("entries", []):
+                self._entries[key] = dict(analysis)
+            self._evict()
+            Console.debug(f"🗃️ AI cache loaded {len(self._entries)} entries from {self.path}")
+        except Exception as e:
+            Console.warning(f"⚠️ Failed to load AI cache {self.path}: {e}")
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        """Cached analysis for text (a copy), or None"""
+        key = self.key(text)
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return json.loads(json.dumps(analysis))
+
+    def put(self, text: str, analysis: Dict[str, Any]):
+        key = self.key(text)
+        with self._lock:
+            self._entries[key] = dict(analysis)
+            self._entries.move_to_end(key)
+            self._evict()
+            self._dirty = True
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def save(self):
+        """Write the cache to disk when it changed"""
+        if not self.path:
+            return
+        # Only the snapshot holds the lock, lookups keep going while it is written
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"fingerprint": self.fingerprint, "entries": list(self._entries.items())}
+            self._dirty = False
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+        except Exception as e:
+            with self._lock:
+                self._dirty = True
+            Console.warning(f"⚠️ Failed to save AI cache {self.path}: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hitRate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,238 @@
+import asyncio
+import json
+import random
+import time
+from typing import Any, Awaitable, Iterable, List, Optional
+
+import aiohttp
+
+from config import Env
+from AI.http_transport import RETRY_STATUSES
+from AI.streaming import JsonObjectStream, iter_sse_data
+
+
+class AsyncZ_AI:
+    """
+    Asyncio chat client for Z.AI API, mirrors Z_AI.chat / chat_multi.
+    One aiohttp session (shared keep-alive pool) per client, call close() when done.
+    """
+
+    def __init__(self):
+        self.api_key = Env.AI_API_KEY
+        self.endpoint = Env.AI_ENDPOINT
+        self.model = Env.AI_MODEL
+        self.temperature = Env.AI_TEMPERATURE
+        self.max_tokens = Env.AI_MAX_TOKENS
+        if not self.api_key or not self.endpoint or not self.model:
+            raise ValueError("Missing AI_API_KEY, AI_ENDPOINT, or AI_MODEL in .env")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "cancelled": 0,
+            "latencyTotal": 0.0,
+            "latencyMax": 0.0,
+        }
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Session is created lazily so it binds to the running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=Env.AI_POOL_SIZE),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=Env.AI_CONNECT_TIMEOUT, sock_read=Env.AI_READ_TIMEOUT
+                ),
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Accept-Language": "en-US,en",
+                    "Content-Type": "application/json",
+                },
+            )
+        return self._session
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after:
+            try:
+                return min(Env.AI_BACKOFF_MAX, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        ceiling = min(Env.AI_BACKOFF_MAX, Env.AI_BACKOFF_BASE * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    async def _request(self, payload, with_usage=False, on_delta=None):
+        """
+        Send request with retries (408/429/5xx and connection errors).
+        Returns content, or (content, usage) with with_usage=True.
+        Cancellation propagates and closes the in-flight response.
+        """
+        url = f"{self.endpoint}/chat/completions"
+        stream = payload.get("stream", False)
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                async with self._get_session().post(url, data=json.dumps(payload)) as response:
+                    if response.status in RETRY_STATUSES and attempt < Env.AI_MAX_RETRIES:
+                        delay = self._retry_delay(attempt, response.headers.get("Retry-After"))
+                    else:
+                        response.raise_for_status()
+                        if stream:
+                            content, usage = await self._read_stream(response, on_delta)
+                        else:
+                            content, usage = self._read_message(await response.json())
+                        self._record_latency(started)
+                        return (content, usage) if with_usage else content
+            except asyncio.CancelledError:
+                self._stats["cancelled"] += 1
+                raise
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= Env.AI_MAX_RETRIES:
+                    return self._error(e, with_usage)
+                delay = self._retry_delay(attempt, None)
+            except Exception as e:
+                return self._error(e, with_usage)
+
+            self._record_latency(started)
+            self._stats["retries"] += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _error(self, error, with_usage):
+        content = f"[ERROR] {str(error)}"
+        return (content, {}) if with_usage else content
+
+    def _record_latency(self, started: float):
+        latency = time.perf_counter() - started
+        self._stats["requests"] += 1
+        self._stats["latencyTotal"] += latency
+        self._stats["latencyMax"] = max(self._stats["latencyMax"], latency)
+
+    def _read_message(self, data):
+        """
+        Content and usage of a non-streamed answer.
+        """
+        usage = data.get("usage") or {}
+        choices = data.get("choices")
+        if choices and isinstance(choices, list) and len(choices) > 0:
+            message = choices[0].get("message")
+            if message and "content" in message:
+                return message["content"], usage
+        return "[ERROR] Unexpected response format", usage
+
+    async def _read_stream(self, response, on_delta=None):
+        """
+        Read a server-sent events answer, return (content, usage).
+        """
+        lines = []
+        result_chunks = []
+        usage = {}
+        async for raw in response.content:
+            lines.append(raw.rstrip(b"\n"))
+            # Parse as soon as an event is complete (blank line)
+            if lines[-1].strip():
+                continue
+            for event in iter_sse_data(lines):
+                try:
+                    chunk = json.loads(event)
+                except json.JSONDecodeError:
+                    continue
+                usage = chunk.get("usage") or usage
+                choices = chunk.get("choices") or []
+                delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                if delta:
+                    result_chunks.append(delta)
+                    if on_delta:
+                        on_delta(delta)
+            lines = []
+        return "".join(result_chunks), usage
+
+    async def chat(self, message, temperature=None, max_tokens=None, stream=False):
+        """
+        Send a message to Z.AI chat API and return the response.
+        """
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        payload = {
+            "model": self.model,
+            "messages": [{"role": "user", "content": message}],
+            "temperature": temp,
+            "max_tokens": tokens,
+            "stream": stream,
+        }
+        return await self._request(payload)
+
+    async def chat_multi(self, messages, stream=False, with_usage=False, on_object=None):
+        """
+        Send a multi-turn conversation (list of messages) to Z.AI chat API.
+        Same options as Z_AI.chat_multi.
+        """
+        on_delta = None
+        if on_object is not None:
+            stream = True
+            objects = JsonObjectStream()
+
+            def on_delta(delta):
+                for item in objects.feed(delta):
+                    on_object(item)
+
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            "stream": stream,
+        }
+        return await self._request(payload, with_usage=with_usage, on_delta=on_delta)
+
+    @staticmethod
+    async def gather_bounded(
+        coroutines: Iterable[Awaitable[Any]], limit: int
+    ) -> List[Any]:
+        """
+        Run coroutines with at most `limit` in flight, results in input order.
+        If the caller is cancelled or one coroutine raises, the rest are cancelled.
+        """
+        semaphore = asyncio.Semaphore(max(1, limit))
+
+        async def run(coroutine):
+            try:
+                async with semaphore:
+                    return await coroutine
+            finally:
+                # Cancelled while waiting for the semaphore: never started
+                if asyncio.iscoroutine(coroutine):
+                    coroutine.close()
+
+        tasks = [asyncio.ensure_future(run(coroutine)) for coroutine in coroutines]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def stats(self):
+        """
+        Request counters (latency, retries, cancelled calls).
+        """
+        stats = dict(self._stats)
+        stats["latencyAvg"] = (
+            round(stats["latencyTotal"] / stats["requests"], 3) if stats["requests"] else 0.0
+        )
+        stats["latencyTotal"] = round(stats["latencyTotal"], 3)
+        stats["latencyMax"] = round(stats["latencyMax"], 3)
+        return stats
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
@@ -0,0 +1,229 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Status codes worth another attempt
+RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker is open.
+    """
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter: `rate` requests per second, bursts up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Block until a token is available, return the seconds waited.
+        """
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for
+    `reset_timeout` seconds, then lets a single trial call through (half-open).
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed" or self.failure_threshold <= 0:
+                return True
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = "half-open"
+                return True
+            # Half-open: the trial call is still running
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self.state = "closed"
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "half-open" or (
+                self.failure_threshold > 0 and self._failures >= self.failure_threshold
+            ):
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class HttpTransport:
+    """
+    Pooled keep-alive HTTP transport with timeouts, retries (exponential
+    backoff with jitter, honoring Retry-After), rate limiting and a circuit breaker.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 120.0,
+        max_retries: int = 3,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        rate_limit: float = 0.0,
+        burst: int = 1,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        pool_size: int = 10,
+    ):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rate_limiter = TokenBucket(rate_limit, burst)
+        self.circuit = CircuitBreaker(failure_threshold, reset_timeout)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "successes": 0,
+            "failures": 0,
+            "retries": 0,
+            "rejected": 0,  # Refused by the open circuit breaker
+            "rateLimitedSeconds": 0.0,
+            "latencyTotal": 0.0,
+            "latencyMax": 0.0,
+        }
+
+    def _count(self, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """
+        Server-provided Retry-After when present, otherwise full-jitter backoff.
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(self.backoff_max, max(0.0, float(retry_after)))
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after).timestamp()
+                    return min(self.backoff_max, max(0.0, retry_at - time.time()))
+                except (TypeError, ValueError):
+                    pass
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """
+        POST with retries. Raises CircuitOpenError when the breaker is open and
+        requests exceptions (HTTPError included) once retries are exhausted.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            if not self.circuit.allow():
+                self._count(rejected=1)
+                raise CircuitOpenError("AI endpoint circuit breaker is open")
+
+            self._count(rateLimitedSeconds=self.rate_limiter.acquire())
+            started = time.perf_counter()
+            response = None
+            try:
+                response = self.session.post(url, **kwargs)
+                retryable = response.status_code in RETRY_STATUSES
+                error = None
+            except (requests.ConnectionError, requests.Timeout) as e:
+                retryable = True
+                error = e
+            except Exception:
+                # ChunkedEncodingError, TooManyRedirects, ...: still resolve a
+                # half-open trial, otherwise the breaker would stay half-open
+                self.circuit.record_failure()
+                self._count(requests=1, failures=1)
+                raise
+            latency = time.perf_counter() - started
+
+            with self._lock:
+                self._stats["requests"] += 1
+                self._stats["latencyTotal"] += latency
+                self._stats["latencyMax"] = max(self._stats["latencyMax"], latency)
+
+            if not retryable:
+                # 4xx other than 408/429 are the caller's fault, not the endpoint's
+                self.circuit.record_success()
+                self._count(successes=1 if response.ok else 0)
+                response.raise_for_status()
+                return response
+
+            self.circuit.record_failure()
+            self._count(failures=1)
+            if attempt >= self.max_retries:
+                if error is not None:
+                    raise error
+                response.raise_for_status()
+
+            delay = self._retry_delay(attempt, response)
+            if response is not None:
+                response.close()
+            self._count(retries=1)
+            attempt += 1
+            time.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Counters for latency, retries and rejected calls.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["latencyAvg"] = (
+            round(stats["latencyTotal"] / stats["requests"], 3) if stats["requests"] else 0.0
+        )
+        stats["latencyTotal"] = round(stats["latencyTotal"], 3)
+        stats["latencyMax"] = round(stats["latencyMax"], 3)
+        stats["rateLimitedSeconds"] = round(stats["rateLimitedSeconds"], 3)
+        stats["circuit"] = self.circuit.state
+        return stats
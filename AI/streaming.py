@@ -0,0 +1,82 @@
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+
+def iter_sse_data(lines: Iterable[Union[bytes, str]]) -> Iterator[str]:
+    """
+    Server-sent events parser: yields the data payload of every event.
+    Multi-line data fields are joined with newlines, comments are skipped
+    and the OpenAI-style "[DONE]" payload ends the stream.
+    """
+    data: List[str] = []
+    for raw in lines:
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        line = line.rstrip("\r")
+        if not line:
+            # Blank line dispatches the event
+            if data:
+                payload = "\n".join(data)
+                data = []
+                if payload == "[DONE]":
+                    return
+                yield payload
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "data":
+            data.append(value)
+
+    if data:
+        payload = "\n".join(data)
+        if payload != "[DONE]":
+            yield payload
+
+
+class JsonObjectStream:
+    """
+    Incremental extractor of top-level JSON objects from streamed text,
+    e.g. the items of a JSON array or JSON lines. feed() returns the objects
+    completed by the new text, so each one can be used before the rest arrives.
+    """
+
+    def __init__(self):
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, text: str) -> List[Dict[str, Any]]:
+        objects = []
+        for char in text:
+            if self._depth > 0:
+                self._buffer.append(char)
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = self._depth > 0
+            elif char == "{":
+                if self._depth == 0:
+                    self._buffer = [char]
+                self._depth += 1
+            elif char == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        item = json.loads("".join(self._buffer))
+                        if isinstance(item, dict):
+                            objects.append(item)
+                    except json.JSONDecodeError:
+                        pass
+                    self._buffer = []
+        return objects
@@ -1,6 +1,7 @@
-import requests
 import json
 from config import Env
+from AI.http_transport import HttpTransport
+from AI.streaming import JsonObjectStream, iter_sse_data
 
 
 class Z_AI:
@@ -16,10 +17,33 @@ class Z_AI:
         self.max_tokens = Env.AI_MAX_TOKENS
         if not self.api_key or not self.endpoint or not self.model:
             raise ValueError("Missing AI_API_KEY, AI_ENDPOINT, or AI_MODEL in .env")
+        # Shared keep-alive connection pool with retries, rate limit and circuit breaker
+        self.transport = HttpTransport(
+            connect_timeout=Env.AI_CONNECT_TIMEOUT,
+            read_timeout=Env.AI_READ_TIMEOUT,
+            max_retries=Env.AI_MAX_RETRIES,
+            backoff_base=Env.AI_BACKOFF_BASE,
+            backoff_max=Env.AI_BACKOFF_MAX,
+            rate_limit=Env.AI_RATE_LIMIT,
+            burst=Env.AI_RATE_BURST,
+            failure_threshold=Env.AI_CIRCUIT_FAILURES,
+            reset_timeout=Env.AI_CIRCUIT_RESET,
+            pool_size=Env.AI_POOL_SIZE,
+        )
 
-    def _request(self, payload, stream=False):
+    def _request(self, payload, stream=False, with_usage=False, on_delta=None):
         """
         Private method to send request to Z.AI endpoint.
+        With with_usage=True returns (content, usage) where usage is the
+        token usage reported by the API ({} when unavailable).
+        """
+        content, usage = self._request_with_usage(payload, stream=stream, on_delta=on_delta)
+        return (content, usage) if with_usage else content
+
+    def _request_with_usage(self, payload, stream=False, on_delta=None):
+        """
+        Send the request, return (content, usage).
+        When streaming, on_delta is called with every content delta as it arrives.
         """
         url = f"{self.endpoint}/chat/completions"
         headers = {
@@ -28,31 +52,49 @@ class Z_AI:
             "Content-Type": "application/json",
         }
         try:
-            response = requests.post(
+            response = self.transport.post(
                 url, headers=headers, data=json.dumps(payload), stream=stream
             )
-            response.raise_for_status()
             if stream:
-                # For streaming, collect all chunks and return as string
-                result_chunks = []
-                for line in response.iter_lines():
-                    if line:
-                        result_chunks.append(line.decode("utf-8"))
-                return "".join(result_chunks)
+                return self._read_stream(response, on_delta)
             else:
                 data = response.json()
+                usage = data.get("usage") or {}
                 # Safe access to content string
                 try:
                     choices = data.get("choices")
                     if choices and isinstance(choices, list) and len(choices) > 0:
                         message = choices[0].get("message")
                         if message and "content" in message:
-                            return message["content"]
-                    return "[ERROR] Unexpected response format"
+                            return message["content"], usage
+                    return "[ERROR] Unexpected response format", usage
                 except Exception as e:
-                    return f"[ERROR] {str(e)}"
+                    return f"[ERROR] {str(e)}", usage
         except Exception as e:
-            return f"[ERROR] {str(e)}"
+            return f"[ERROR] {str(e)}", {}
+
+    def _read_stream(self, response, on_delta=None):
+        """
+        Read a server-sent events response, return (content, usage).
+        """
+        result_chunks = []
+        usage = {}
+        try:
+            for event in iter_sse_data(response.iter_lines()):
+                try:
+                    chunk = json.loads(event)
+                except json.JSONDecodeError:
+                    continue
+                usage = chunk.get("usage") or usage
+                choices = chunk.get("choices") or []
+                delta = (choices[0].get("delta") or {}).get("content") if choices else None
+                if delta:
+                    result_chunks.append(delta)
+                    if on_delta:
+                        on_delta(delta)
+        finally:
+            response.close()
+        return "".join(result_chunks), usage
 
     def chat(self, message, temperature=None, max_tokens=None, stream=False):
         """
@@ -69,10 +111,23 @@ class Z_AI:
         }
         return self._request(payload, stream=stream)
 
-    def chat_multi(self, messages, stream=False):
+    def chat_multi(self, messages, stream=False, with_usage=False, on_object=None):
         """
         Send a multi-turn conversation (list of messages) to Z.AI chat API.
+        With with_usage=True returns (content, usage).
+        With on_object the response is streamed and on_object is called with
+        every top-level JSON object (e.g. each item of a JSON array answer)
+        as soon as it is complete.
         """
+        on_delta = None
+        if on_object is not None:
+            stream = True
+            objects = JsonObjectStream()
+
+            def on_delta(delta):
+                for item in objects.feed(delta):
+                    on_object(item)
+
         payload = {
             "model": self.model,
             "messages": messages,
@@ -80,4 +135,12 @@ class Z_AI:
             "max_tokens": self.max_tokens,
             "stream": stream,
         }
-        return self._request(payload, stream=stream)
+        return self._request(
+            payload, stream=stream, with_usage=with_usage, on_delta=on_delta
+        )
+
+    def stats(self):
+        """
+        Transport counters (latency, retries, rejected calls).
+        """
+        return self.transport.stats()
@@ -0,0 +1,748 @@
+#!/usr/bin/env python3
+"""
+Async CDP Facebook Scraper
+Asyncio variant of CDPFacebookScraper on playwright.async_api
+Extraction of the next batch overlaps with AI analysis and persistence of the previous one
+"""
+
+import asyncio
+import random
+import time
+from config import Env
+from console import Console
+from typing import List, Dict, Any, Optional
+from playwright.async_api import async_playwright
+from cdp_facebook_scraper import CDPFacebookScraper
+from AI.async_z_ai import AsyncZ_AI
+
+
+class AsyncCDPFacebookScraper(CDPFacebookScraper):
+    """
+    Async Facebook scraper with the same public surface as CDPFacebookScraper.
+    Page-independent cleaning, dedup and stats logic is inherited unchanged.
+    Private page/IO steps are separate *_async coroutines instead of overrides,
+    so inherited sync code calling the sync name never gets a coroutine back.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._playwright = None
+        self._pending_batch: Optional[asyncio.Task] = None
+        # Analysis runs on the event loop instead of a worker thread
+        self.async_ai: Optional[AsyncZ_AI] = AsyncZ_AI() if self.ai else None
+
+    async def init(self):
+        """Initialize browser with CDP enabled for mobile simulation"""
+        Console.log("🚀 Memulai Async CDP Facebook Scraper (Mobile Mode)...")
+        # Launch browser with CDP enabled for mobile simulation
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(
+            headless=Env.HEADLESS,
+            slow_mo=Env.SLOW_MO_MS,
+            args=self.LAUNCH_ARGS,
+        )
+        # Create context with mobile user agent
+        self.context = await self.browser.new_context(
+            user_agent=self.USER_AGENT,
+            viewport=self.VIEWPORT,
+        )
+        self.page = await self.context.new_page()
+        # Get CDP session
+        self.cdp_session = await self.context.new_cdp_session(self.page)
+        # Enable CDP domains
+        await self.cdp_session.send("Page.enable")
+        await self.cdp_session.send("Network.enable")
+        await self.cdp_session.send("Runtime.enable")
+        # Set stealth properties
+        await self._setup_stealth_async()
+        Console.success(
+            "✅ Async CDP Browser berhasil diinisialisasi dengan stealth mode (Mobile iPhone Portrait)"
+        )
+
+    async def _setup_stealth_async(self):
+        """Setup stealth properties to avoid detection"""
+        try:
+            stealth_script = self._get_script("stealth_script.js")
+            if not stealth_script:
+                # Fallback to simple script if main script is not available
+                await self.page.add_init_script(
+                    self._get_script("stealth_fallback.js")
+                )
+                Console.success("✅ Fallback stealth script loaded from external file")
+                return
+            await self.page.add_init_script(stealth_script)
+            Console.success("✅ Stealth script loaded from external file")
+
+            # Set extra headers for mobile
+            await self.page.set_extra_http_headers(self.EXTRA_HTTP_HEADERS)
+
+            # Block images, fonts dan media di browser untuk mempercepat loading
+            await self._setup_resource_blocking_async()
+
+            # Intercept and modify requests
+            async def handle_route(route):
+                request = route.request
+                self.request_stats["intercepted"] += 1
+                if self._should_abort_request(request):
+                    await route.abort()
+                    return
+                await route.continue_(headers=self._route_headers(request))
+
+            # Only facebook.com requests need header changes, the rest bypass Python
+            await self.page.route(self.ROUTED_URL_PATTERN, handle_route)
+
+            Console.success(
+                "✅ Stealth mode berhasil diaktifkan dengan pengaturan lengkap"
+            )
+
+        except Exception as error:
+            Console.warning(f"⚠️ Warning: Stealth setup tidak sempurna: {error}")
+
+    async def _setup_resource_blocking_async(self):
+        """Block heavy resources inside the browser through the CDP session"""
+        try:
+            await self.cdp_session.send(
+                "Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS}
+            )
+
+            # Counting only listens to events, it never holds a request
+            def on_request(request):
+                self.request_stats["total"] += 1
+
+            def on_request_failed(request):
+                if "ERR_BLOCKED_BY_CLIENT" in (request.failure or ""):
+                    self.request_stats["blocked"] += 1
+
+            self.page.on("request", on_request)
+            self.page.on("requestfailed", on_request_failed)
+            Console.success(
+                f"✅ Resource blocking aktif di browser ({len(self.BLOCKED_URL_PATTERNS)} pola URL)"
+            )
+        except Exception as error:
+            Console.warning(f"⚠️ Resource blocking via CDP gagal: {error}")
+
+    async def login(self) -> bool:
+        """Login to Facebook with CDP mobile mode"""
+        try:
+            Console.log(
+                "🔐 Mencoba login ke Facebook dengan CDP (Mobile iPhone Portrait)..."
+            )
+            # Open Facebook mobile login page
+            await self.page.goto(
+                "https://m.facebook.com/login",
+                wait_until="domcontentloaded",
+                timeout=60000,
+            )
+            # Wait for login form to appear
+            await self.page.wait_for_load_state("networkidle", timeout=10000)
+
+            # Try multiple selectors for email field
+            if not await self._fill_first_field(
+                self.EMAIL_SELECTORS, Env.FACEBOOK_EMAIL, "📧 Email", simulate=True
+            ):
+                Console.error("❌ Tidak dapat menemukan field email")
+                return False
+
+            # Try multiple selectors for password field
+            if not await self._fill_first_field(
+                self.PASSWORD_SELECTORS, Env.FACEBOOK_PASSWORD, "🔑 Password"
+            ):
+                Console.error("❌ Tidak dapat menemukan field password")
+                return False
+
+            # Wait for page to be ready for login button interaction
+            await self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+
+            # Try to click login button
+            try:
+                login_button = await self.page.wait_for_selector(
+                    '[role="button"]:has-text("Login")', timeout=5000
+                )
+                await login_button.click()
+                Console.success("✅ Tombol login diklik")
+            except Exception:
+                Console.error("❌ Tidak dapat menemukan tombol login")
+                return False
+
+            # Wait for login process with network activity check
+            Console.log("⏳ Menunggu proses login...")
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=60000)
+            except Exception:
+                # Fallback if networkidle doesn't work
+                await self.page.wait_for_load_state("domcontentloaded", timeout=60000)
+
+            # Handle post-login dialogs and skip buttons
+            await self._handle_post_login_dialog_async("Lain Kali")
+
+            if await self._check_login_status_async():
+                self.is_logged_in = True
+                Console.success("✅ Login berhasil dengan CDP (Mobile iPhone)!")
+                return True
+
+            Console.error("❌ Login gagal, cek kredensial atau ada captcha/verifikasi")
+            await self._save_screenshot("login_failed.png")
+            return False
+
+        except Exception as error:
+            Console.error(f"❌ Error saat login: {error}")
+            await self._save_screenshot("login_error.png")
+            return False
+
+    async def _fill_first_field(
+        self, selectors: List[str], value: str, label: str, simulate: bool = False
+    ) -> bool:
+        """Type value into the first selector that appears"""
+        for selector in selectors:
+            try:
+                await self.page.wait_for_selector(selector, timeout=5000)
+                Console.debug(f"{label} field ditemukan dengan selector: {selector}")
+
+                if simulate:
+                    # Simulate human behavior before input
+                    await self._simulate_human_behavior_async()
+
+                # Clear and input with natural delay
+                await self.page.click(selector)
+                await self.page.keyboard.press("Control+a")
+                await self.page.keyboard.press("Delete")
+                await self.page.keyboard.type(value, delay=random.randint(15, 25))
+                Console.success(f"{label} berhasil diinput")
+                return True
+            except Exception:
+                Console.warning(
+                    f"⚠️ Selector {selector} tidak ditemukan, mencoba yang lain..."
+                )
+        return False
+
+    async def _save_screenshot(self, path: str):
+        """Screenshot for debugging"""
+        try:
+            await self.page.screenshot(path=path, full_page=True)
+            Console.info(f"📸 Screenshot disimpan sebagai {path}")
+        except Exception:
+            Console.warning("⚠️ Gagal menyimpan screenshot")
+
+    async def _simulate_human_behavior_async(self):
+        """Simulate human behavior with random mouse movements and scroll"""
+        try:
+            viewport = self.page.viewport_size
+            for _ in range(3):
+                x = random.randint(0, viewport["width"])
+                y = random.randint(0, viewport["height"])
+                await self.page.mouse.move(x, y)
+                await asyncio.sleep(random.uniform(0.2, 0.7))
+
+            await self.page.evaluate(self._get_script("random_scroll.js"))
+            await asyncio.sleep(random.uniform(0.5, 1.5))
+        except Exception:
+            # Ignore errors in human simulation
+            pass
+
+    async def _handle_post_login_dialog_async(self, text: str):
+        Console.debug("🔄 Menangani dialog dan tombol setelah login...")
+        try:
+            selector = f'[role="button"]:has-text("{text}")'
+            button = await self.page.wait_for_selector(selector, timeout=5000)
+            if button and await button.is_visible():
+                await button.click()
+                Console.success(f"✅ Berhasil klik tombol: {selector}")
+                await self.page.wait_for_timeout(1000)
+        except Exception as e:
+            Console.warning(f"⚠️ Error handling text parameter: {e}")
+        finally:
+            await self.page.wait_for_timeout(5000)
+
+    async def _check_login_status_async(self) -> bool:
+        """Check if login was successful"""
+        try:
+            login_button = await self.page.query_selector(
+                '[role="button"]:has-text("Login")'
+            )
+            indicators = [
+                '[role="button"][aria-label*="Facebook Menu"]',
+                '[role=button][aria-label="Facebook logo"]',
+                '[role=button][aria-label*="Go to profile"]',
+                '[role=button][aria-label="Search Facebook"]',
+            ]
+            for selector in indicators:
+                if not login_button and await self.page.query_selector(selector):
+                    return True
+            return False
+        except Exception:
+            return False
+
+    async def scrape_status(
+        self,
+        target_url: Optional[str] = None,
+        continuous: bool = False,
+        loop_interval: int = 300,
+    ) -> List[Dict[str, Any]]:
+        """Scrape status posts from Facebook feed with optional continuous mode"""
+        if not self.is_logged_in:
+            Console.error("❌ Harus login terlebih dahulu")
+            return []
+
+        if continuous:
+            return await self._scrape_status_continuous_async(target_url, loop_interval)
+        return await self._scrape_status_single_async(target_url)
+
+    async def _scrape_status_continuous_async(
+        self, target_url: Optional[str] = None, loop_interval: int = 300
+    ) -> List[Dict[str, Any]]:
+        """Continuous scraping, analysis/persistence of a batch overlaps the next scrape"""
+        if Env.PIPELINE_ENABLED:
+            Console.warning(
+                "⚠️ PIPELINE_ENABLED is ignored with ENGINE=async, batches already overlap the next scrape"
+            )
+        self._resume_from_checkpoint()
+        Console.log("🔄 Starting async continuous scraping mode...")
+        # Analysis runs after dedup here, so streamed results can be stored right away
+        if self.on_post_analyzed is None:
+            self.on_post_analyzed = self._persist_analyzed_post
+
+        try:
+            while True:
+                try:
+                    self.loop_count += 1
+                    Console.log(f"🔄 Loop iteration #{self.loop_count}")
+
+                    # AI analysis is deferred to the background batch task
+                    new_posts = await self._scrape_status_single_async(
+                        target_url, analyze=False
+                    )
+
+                    if new_posts:
+                        unique_new_posts = self._filter_duplicate_posts(new_posts)
+                        if unique_new_posts:
+                            self._pending_batch = asyncio.create_task(
+                                self._analyze_and_persist(
+                                    unique_new_posts,
+                                    self.loop_count,
+                                    self._pending_batch,
+                                )
+                            )
+                        else:
+                            Console.info(
+                                "ℹ️ No new unique posts found in this iteration"
+                            )
+                    else:
+                        Console.warning("⚠️ No posts scraped in this iteration")
+
+                    Console.log(
+                        f"⏳ Waiting {loop_interval} seconds before next iteration..."
+                    )
+                    await asyncio.sleep(loop_interval)
+
+                except asyncio.CancelledError:
+                    Console.log("⏹️ Continuous scraping stopped")
+                    break
+                except Exception as error:
+                    Console.error(f"❌ Error in continuous scraping: {error}")
+                    Console.log(f"⏳ Waiting {loop_interval} seconds before retry...")
+                    await asyncio.sleep(loop_interval)
+        finally:
+            await self._flush_pending_batch()
+
+        return self.all_scraped_posts
+
+    async def _analyze_and_persist(
+        self,
+        posts: List[Dict[str, Any]],
+        loop_number: int,
+        previous: Optional[asyncio.Task],
+    ) -> None:
+        """Analyze one batch off the event loop, then persist it in loop order"""
+        try:
+            if self.ai:
+                Console.log(
+                    f"🤖 Starting batch AI sentiment analysis for loop #{loop_number}..."
+                )
+                await self._batch_analyze_sentiment_async(posts)
+
+            # Persistence must follow loop order even if analysis finished early
+            if previous:
+                await previous
+
+            self._accept_posts(posts)
+            Console.success(
+                f"✅ Added {len(posts)} new unique posts. Total: {self.running_stats.total} posts"
+            )
+            await asyncio.to_thread(self._save_posts_append, posts, loop_number)
+        except Exception as error:
+            Console.error(f"❌ Error processing loop #{loop_number}: {error}")
+
+    async def _flush_pending_batch(self) -> None:
+        """Wait for the last analysis/persistence task before returning"""
+        if self._pending_batch and not self._pending_batch.done():
+            Console.log("⏳ Waiting for pending analysis and save to finish...")
+            try:
+                await self._pending_batch
+            except asyncio.CancelledError:
+                Console.warning("⚠️ Pending batch was cancelled before it was saved")
+        self._pending_batch = None
+
+    async def _scrape_status_single_async(
+        self, target_url: Optional[str] = None, analyze: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Scrape status posts from Facebook feed - single iteration"""
+        try:
+            url = target_url or "https://m.facebook.com/"
+            Console.debug(f"📱 Membuka halaman: {url}")
+
+            # Refresh mode starts every loop from the top of a fresh, small DOM
+            refresh_until_known = Env.REFRESH_UNTIL_KNOWN and bool(self.known_post_keys)
+            if refresh_until_known or self.page.url != url:
+                await self.page.goto(url, wait_until="networkidle", timeout=30000)
+
+            # Wait for initial content to load
+            try:
+                await self.page.wait_for_selector(
+                    '[data-mcomponent="MContainer"], [role="main"], [data-testid="post_message"]',
+                    timeout=10000,
+                )
+            except Exception:
+                Console.warning(
+                    "⚠️ Initial content selector not found, using load state wait"
+                )
+                await self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+
+            # Wait for additional content to settle
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=10000)
+            except Exception:
+                Console.warning(
+                    "⚠️ Network idle timeout, continuing with available content"
+                )
+
+            incremental = Env.COLLECT_MODE == "incremental"
+            if incremental:
+                self._collected_posts = []
+                await self._install_post_collector_async()
+
+            # Scroll to load more posts
+            await self._auto_scroll_async(stop_on_known=refresh_until_known)
+
+            if incremental:
+                await self._drain_post_collector_async()
+                posts = await self._extract_posts_with_advanced_cleaning_async(
+                    self._collected_posts, analyze=analyze
+                )
+            else:
+                posts = await self._extract_posts_with_advanced_cleaning_async(
+                    analyze=analyze
+                )
+
+            Console.success(f"✅ Berhasil scrape {len(posts)} clean status")
+            self._log_request_stats()
+            self.posts = posts
+            self.cleaned_posts = posts
+            return posts
+
+        except Exception as error:
+            Console.error(f"❌ Error saat scraping status: {error}")
+            return []
+
+    async def _auto_scroll_async(self, stop_on_known: bool = False):
+        """Auto-scroll to load more posts, one evaluate per step"""
+        Console.debug("📜 Melakukan auto-scroll untuk memuat lebih banyak post...")
+
+        max_posts = Env.MAX_POSTS_TO_SCRAPE
+        loaded_posts = 0
+        previous_height = 0
+        scroll_attempts = 0
+        scroll_steps = 0
+        max_scroll_attempts = 25
+
+        scroll_step_js = self._get_script("scroll_step.js")
+        scroll_started = time.perf_counter()
+        step_waits: List[Dict[str, Any]] = []
+
+        while loaded_posts < max_posts and scroll_attempts < max_scroll_attempts:
+            delay = random.randint(1000, 2000) + Env.SCRAPE_DELAY_MS
+            step_started = time.perf_counter()
+            try:
+                step = await self.page.evaluate(
+                    scroll_step_js, {"delay": delay, "quietMs": Env.SCROLL_QUIET_MS}
+                )
+            except Exception as error:
+                Console.warning(f"⚠️ Scroll step failed: {error}")
+                break
+            step_ms = (time.perf_counter() - step_started) * 1000
+            scroll_steps += 1
+            step_waits.append({"ms": step["waitedMs"], "reason": step["reason"]})
+
+            new_posts = max(step["postCount"] - loaded_posts, 0)
+            loaded_posts = step["postCount"]
+            Console.debug(
+                f"⏱️ Scroll step {scroll_steps}: {step_ms:.0f} ms (waited {step['waitedMs']} ms, {step['reason']}), +{new_posts} posts"
+            )
+
+            # Check if we've reached the bottom
+            if step["scrollHeight"] == previous_height:
+                scroll_attempts += 1
+            else:
+                scroll_attempts = 0
+            previous_height = step["scrollHeight"]
+
+            if Env.COLLECT_MODE == "incremental":
+                await self._drain_post_collector_async()
+
+            if stop_on_known and await self._reached_known_posts_async(
+                first_step=scroll_steps == 1
+            ):
+                break
+
+            # If scrolled 3 times without change, stop
+            if scroll_attempts >= 3:
+                Console.info(
+                    "📄 Sudah mencapai akhir halaman atau tidak ada content baru"
+                )
+                break
+
+        self._summarize_scroll(scroll_started, scroll_steps, loaded_posts, step_waits)
+
+    async def _install_post_collector_async(self) -> None:
+        """Install MutationObserver collector that buffers new posts in the page"""
+        try:
+            stats = await self.page.evaluate(
+                self._get_composed_script("post_collector.js"),
+                {
+                    "maxBuffer": Env.COLLECT_MAX_BUFFER,
+                    "knownKeys": self._known_keys_payload(),
+                },
+            )
+            Console.debug(
+                f"👀 Post collector ready ({(stats or {}).get('buffered', 0)} buffered)"
+            )
+        except Exception as error:
+            Console.warning(f"⚠️ Failed to install post collector: {error}")
+
+    async def _drain_post_collector_async(self) -> int:
+        """Drain buffered posts from the in-page collector in batches"""
+        drained = 0
+        try:
+            started = time.perf_counter()
+            drain_js = self._get_script("drain_post_collector.js")
+            while True:
+                result = await self.page.evaluate(drain_js, Env.COLLECT_DRAIN_BATCH)
+                if result is None:
+                    # Page navigated or reloaded, collector has to be reinstalled
+                    await self._install_post_collector_async()
+                    result = await self.page.evaluate(
+                        drain_js, Env.COLLECT_DRAIN_BATCH
+                    )
+                    if result is None:
+                        break
+
+                batch_size = self._store_drained_batch(result)
+                drained += batch_size
+                if not batch_size or result.get("remaining", 0) == 0:
+                    break
+
+            self._log_drain(drained, started)
+        except Exception as error:
+            Console.warning(f"⚠️ Failed to drain post collector: {error}")
+        return drained
+
+    async def _reached_known_posts_async(self, first_step: bool) -> bool:
+        """Check whether the loaded feed already shows a run of known posts"""
+        try:
+            result = await self.page.evaluate(
+                self._get_composed_script("known_run.js"),
+                {"knownKeys": list(self.known_post_keys) if first_step else None},
+            )
+            max_run = result.get("maxRun", 0) if result else 0
+            if max_run >= Env.KNOWN_STOP_RUN:
+                Console.info(
+                    f"🛑 Found {max_run} known posts in a row after {result.get('posts', 0)} posts, stop scrolling"
+                )
+                return True
+        except Exception as error:
+            Console.warning(f"⚠️ Failed to check known posts: {error}")
+        return False
+
+    async def _extract_posts_advanced_async(self) -> List[Dict[str, Any]]:
+        """Extract posts from all containers in a single page.evaluate round-trip"""
+        if Env.EXTRACT_MODE == "legacy":
+            Console.debug("ℹ️ Async engine always uses batch extraction")
+        try:
+            started = time.perf_counter()
+            result = await self.page.evaluate(
+                self._get_composed_script("extract_posts_batch.js"),
+                {"knownKeys": self._known_keys_payload()},
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            return self._read_batch_extraction(result, elapsed_ms)
+        except Exception as error:
+            Console.error(f"❌ Error saat batch extract posts: {error}")
+            return []
+
+    async def _extract_posts_with_advanced_cleaning_async(
+        self,
+        raw_posts: Optional[List[Dict[str, Any]]] = None,
+        analyze: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Extract posts with advanced cleaning and filtering"""
+        try:
+            Console.debug("🧹 Starting advanced post extraction with cleaning...")
+
+            if raw_posts is None:
+                raw_posts = await self._extract_posts_advanced_async()
+            Console.info(f"📝 Extracted {len(raw_posts)} raw posts")
+
+            if not raw_posts:
+                Console.warning("⚠️  No raw posts found")
+                return []
+
+            candidates = self._prefilter_raw_posts(raw_posts)
+
+            # Resolve every author-less post in a single page call
+            missing = self._candidates_without_author(candidates)
+            if missing:
+                authors = await self._extract_authors_bulk_async([c["text"] for c in missing])
+                self._apply_authors(missing, authors)
+
+            cleaned_posts = self._build_clean_posts(candidates)
+
+            if analyze and self.ai and cleaned_posts:
+                Console.log("🤖 Starting batch AI sentiment analysis...")
+                await self._batch_analyze_sentiment_async(cleaned_posts)
+
+            self.cleaned_posts = cleaned_posts
+            Console.success(
+                f"\n🎉 Advanced cleaning complete! Found {len(cleaned_posts)} clean posts out of {len(raw_posts)} raw posts."
+            )
+            return cleaned_posts
+
+        except Exception as error:
+            Console.error(f"❌ Error in advanced post extraction: {error}")
+            return []
+
+    async def _batch_analyze_sentiment_async(self, posts: List[Dict[str, Any]]) -> None:
+        """Batch analyze sentiment with all chunks in flight on the event loop"""
+        try:
+            posts_to_analyze = self._posts_needing_analysis(posts)
+            if not posts_to_analyze:
+                return
+
+            # Split so every chunk's answer fits in AI_MAX_TOKENS
+            chunks = self._chunk_posts_for_ai(posts_to_analyze)
+            Console.log(
+                f"🤖 Analyzing {len(posts_to_analyze)} posts in {len(chunks)} chunks ({Env.AI_CONCURRENCY} concurrent)..."
+            )
+
+            chunk_analyses = await AsyncZ_AI.gather_bounded(
+                [self._analyze_chunk_async(i, chunk) for i, chunk in enumerate(chunks)],
+                Env.AI_CONCURRENCY,
+            )
+
+            self._apply_chunk_analyses(posts_to_analyze, chunks, chunk_analyses)
+            stats = self.async_ai.stats()
+            Console.debug(
+                f"🌐 Async AI: {stats['requests']} requests, avg {stats['latencyAvg']}s (max {stats['latencyMax']}s), "
+                f"{stats['retries']} retries, {stats['cancelled']} cancelled"
+            )
+
+        except asyncio.CancelledError:
+            Console.warning("⚠️ Batch sentiment analysis cancelled")
+            self._mark_analysis_failed(posts)
+            raise
+        except Exception as e:
+            Console.error(f"❌ Batch sentiment analysis failed: {e}")
+            self._mark_analysis_failed(posts)
+
+    async def _analyze_chunk_async(
+        self, chunk_index: int, posts: List[Dict[str, Any]]
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Async _analyze_chunk: one request per chunk, re-request missing IDs"""
+        items = {str(i + 1): post for i, post in enumerate(posts)}
+        pending = dict(items)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for attempt in range(1 + Env.AI_MISSING_RETRIES):
+            if not pending:
+                break
+            if attempt:
+                Console.warning(
+                    f"🔁 Re-requesting {len(pending)} missing analyses of chunk {chunk_index + 1}: {', '.join(pending)}"
+                )
+
+            response = await self._request_chunk_analyses_async(chunk_index, pending)
+            if response is None:
+                if attempt == 0:
+                    return None
+                break
+
+            analyses = self._parse_batch_response(response, list(pending))
+            results.update(analyses)
+            pending = {item_id: post for item_id, post in pending.items() if item_id not in analyses}
+
+        return [results.get(item_id) for item_id in items]
+
+    async def _request_chunk_analyses_async(
+        self, chunk_index: int, items: Dict[str, Dict[str, Any]]
+    ) -> Optional[str]:
+        """One async chat_multi call for ID-keyed items"""
+        messages = self._build_chunk_messages(items)
+
+        started = time.perf_counter()
+        on_object = None
+        if Env.AI_STREAM:
+            # Hand out each analysis as soon as its JSON object has streamed in
+            def on_object(item: Dict[str, Any]) -> None:
+                self._on_streamed_analysis(chunk_index, items, item, started)
+
+        response, usage = await self.async_ai.chat_multi(
+            messages, with_usage=True, on_object=on_object
+        )
+        return self._check_chunk_response(
+            chunk_index, items, response, usage, time.perf_counter() - started
+        )
+
+    async def _extract_authors_bulk_async(self, post_texts: List[str]) -> List[str]:
+        """Resolve authors for many post texts with a single page.evaluate"""
+        if not post_texts:
+            return []
+        try:
+            authors = await self.page.evaluate(
+                self._get_script("resolve_authors_bulk.js"),
+                [text[:100] for text in post_texts],
+            )
+            resolved = [
+                author.strip() if isinstance(author, str) else ""
+                for author in (authors or [])
+            ]
+            return resolved + [""] * (len(post_texts) - len(resolved))
+        except Exception as error:
+            Console.error(f"❌ Error extracting authors in bulk: {error}")
+            return [""] * len(post_texts)
+
+    async def save_posts(
+        self,
+        posts: List[Dict[str, Any]],
+        filename: str = "output/facebook_posts_cdp.json",
+    ):
+        """Save posts off the event loop - single save mode"""
+        await asyncio.to_thread(CDPFacebookScraper.save_posts, self, posts, filename)
+
+    async def close(self):
+        """Close browser and cleanup"""
+        await self._flush_pending_batch()
+        if self.loop_count:
+            self._save_checkpoint()
+        await asyncio.to_thread(self._close_writer)
+        self.scraped_post_hashes.close()
+        if self.sqlite_store:
+            self.sqlite_store.close()
+        if self.async_ai:
+            await self.async_ai.close()
+        if self.browser:
+            try:
+                await self.browser.close()
+                Console.success("🔒 Browser berhasil ditutup")
+            except Exception as error:
+                Console.warning(f"⚠️ Error saat menutup browser: {error}")
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
@@ -7,16 +7,41 @@ Mobile iPhone Portrait simulation for better compatibility
 
 import time
 import re
+import threading
 import os
 import random
 import json
+from concurrent.futures import ThreadPoolExecutor
 from config import Env
 from console import Console
 from AI.z_ai import Z_AI
+from AI.ai_cache import AICache
+from pipeline import PipelineStage, ScrapePipeline
+from noise_classifier import NOISE_PATTERNS, POST_CONTENT_PATTERNS, NoiseClassifier
+from near_duplicate import NearDuplicateIndex
+from dedup_store import DedupStore
+from sqlite_store import SQLiteStore, SQLiteDedupSet, SQLiteAICache
+from writer import BackgroundWriter
+from running_stats import RunningStats
+from lexicon_sentiment import LexiconSentiment
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
-from utils import read_js_script, save_to_file, save_cleaning_report, save_to_csv
+from utils import (
+    read_js_script,
+    post_text_key,
+    save_to_file,
+    save_json_snapshot,
+    save_cleaning_report,
+    saved_file_paths,
+    append_to_csv,
+    append_jsonl,
+    save_jsonl,
+    read_jsonl,
+    truncate_torn_line,
+    save_checkpoint,
+    load_checkpoint,
+)
 
 
 class CDPFacebookScraper:
@@ -24,6 +49,111 @@ class CDPFacebookScraper:
     Advanced Facebook scraper using CDP with stealth mode and mobile simulation
     """
 
+    # Append-only cumulative store, the JSON snapshot is produced by export_cumulative()
+    CUMULATIVE_JSONL = "output/facebook_posts_cdp_cumulative.jsonl"
+    CUMULATIVE_CSV = "output/facebook_posts_cdp_cumulative.csv"
+    CUMULATIVE_JSON = "output/facebook_posts_cdp_cumulative.json"
+
+    # Browser and context settings for iPhone 8 portrait simulation
+    LAUNCH_ARGS = [
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-blink-features=AutomationControlled",
+        "--disable-web-security",
+        "--disable-features=VizDisplayCompositor",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--disable-default-apps",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--disable-javascript-harmony-shipping",
+        "--disable-background-timer-throttling",
+        "--disable-backgrounding-occluded-windows",
+        "--disable-renderer-backgrounding",
+        "--disable-features=TranslateUI",
+        "--disable-ipc-flooding-protection",
+        "--enable-features=NetworkService,NetworkServiceLogging",
+        "--force-color-profile=srgb",
+        "--metrics-recording-only",
+        "--no-zygote",
+        "--disable-gpu",
+        "--disable-software-rasterizer",
+        "--disable-background-networking",
+        "--disable-sync",
+        "--disable-translate",
+        "--hide-scrollbars",
+        "--mute-audio",
+        "--safebrowsing-disable-auto-update",
+        "--ignore-certificate-errors",
+        "--ignore-ssl-errors",
+        "--ignore-certificate-errors-spki-list",
+        # Mobile-specific args (user agent set in context)
+        "--window-size=375,667",
+        "--mobile-emulation=device=iPhone 8",
+        "--enable-touch-events",
+        "--disable-touch-adjustment",
+    ]
+    USER_AGENT = "Mozilla/5.0 (iPhone; CPU iPhone OS 13_2_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.0.3 Mobile/15E148 Safari/604.1"
+    VIEWPORT = {"width": 375, "height": 667}
+    EXTRA_HTTP_HEADERS = {
+        "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
+        "Cache-Control": "max-age=0",
+        "Pragma": "no-cache",
+        "Sec-Ch-Ua": '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
+        "Sec-Ch-Ua-Mobile": "?1",
+        "Sec-Ch-Ua-Platform": '"iOS"',
+        "Sec-Fetch-Dest": "document",
+        "Sec-Fetch-Mode": "navigate",
+        "Sec-Fetch-Site": "none",
+        "Sec-Fetch-User": "?1",
+        "Upgrade-Insecure-Requests": "1",
+        "DNT": "1",
+    }
+
+    # Login form selectors, tried in order
+    EMAIL_SELECTORS = [
+        '[name="email"]',
+        'input[type="email"]',
+        'input[placeholder*="email"]',
+    ]
+    PASSWORD_SELECTORS = [
+        '[name="pass"]',
+        'input[type="password"]',
+        'input[placeholder*="password"]',
+    ]
+
+    # Blocked inside the browser via CDP, these never reach the Python route handler
+    BLOCKED_URL_PATTERNS = [
+        # Images
+        "*.jpg*",
+        "*.jpeg*",
+        "*.png*",
+        "*.gif*",
+        "*.webp*",
+        "*.svg*",
+        "*.ico*",
+        # Fonts
+        "*.woff*",
+        "*.ttf*",
+        "*.otf*",
+        # Media
+        "*.mp4*",
+        "*.webm*",
+        "*.m3u8*",
+        "*.mp3*",
+        "*.m4a*",
+        "*://scontent*.fbcdn.net/*",
+        "*://video*.fbcdn.net/*",
+        # Websockets
+        "ws://*",
+        "wss://*",
+    ]
+    # Only these requests still need Python for header modification
+    ROUTED_URL_PATTERN = re.compile(r"^https?://([a-z0-9-]+\.)*facebook\.com/")
+
     def __init__(self):
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
@@ -32,25 +162,89 @@ class CDPFacebookScraper:
         self.is_logged_in = False
         self.posts: List[Dict[str, Any]] = []
         self.cleaned_posts: List[Dict[str, Any]] = []
-        self.all_scraped_posts: List[Dict[str, Any]] = (
-            []
-        )  # Global storage for all iterations
-        self.scraped_post_hashes: set = set()  # To track duplicates across iterations
+        self._all_posts: List[Dict[str, Any]] = []  # Global storage for all iterations
+        self._history_offset = 0  # Resumed JSONL bytes not loaded into _all_posts yet
+        self.running_stats = RunningStats()  # Report stats of all_scraped_posts, updated per post
+        # Optional SQLite sink, also serves the dedup set and the AI cache
+        self.sqlite_store: Optional[SQLiteStore] = (
+            SQLiteStore(Env.SQLITE_PATH) if Env.SQLITE_PATH else None
+        )
+        self.scraped_post_hashes = (
+            SQLiteDedupSet(self.sqlite_store)
+            if self.sqlite_store
+            else DedupStore(Env.DEDUP_STORE_PATH or None)
+        )  # To track duplicates across iterations and restarts
+        self.known_post_keys: Dict[str, None] = {}  # Ordered text keys sent to the page
+        self.near_duplicates: Optional[NearDuplicateIndex] = (
+            NearDuplicateIndex(Env.NEAR_DUP_THRESHOLD)
+            if Env.NEAR_DUP_THRESHOLD > 0
+            else None
+        )  # LSH index over every post kept across iterations
+        self.near_duplicates_merged = 0  # Posts merged into an earlier near-duplicate
+        self._near_dup_ids: Dict[str, int] = {}  # Post hash -> index id, until the post is saved
+        self._near_dup_exported = 0  # Index items of saved posts in the checkpoint sidecar
+        self._checkpoint_keys: Dict[str, None] = {}  # Text keys of saved posts, for the checkpoint
+        self._checkpoint_loop = 0  # Latest loop whose posts were saved
         self.loop_count = 0
+        # Saves run on a background thread, flushed by close()
+        self.writer = BackgroundWriter(Env.BACKGROUND_WRITER)
+        self.pipeline: Optional[ScrapePipeline] = None
+        self._script_cache: Dict[str, str] = {}  # JS scripts already read from disk
+        self._collected_posts: List[Dict[str, Any]] = []  # Drained from in-page collector
+        self.last_scroll_stats: Dict[str, Any] = {}  # Timing of the latest auto-scroll
+        # Called with (post, analysis) as each streamed analysis arrives (AI_STREAM),
+        # continuous pipeline/async modes default it to _persist_analyzed_post
+        self.on_post_analyzed: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+        # Streamed records already appended, by post hash, until their loop is saved
+        self._streamed_records: Dict[str, Dict[str, Any]] = {}
+        self._streamed_lock = threading.Lock()
+        self.request_stats: Dict[str, int] = {
+            "total": 0,  # All requests started by the page
+            "intercepted": 0,  # Went through the Python route handler
+            "blocked": 0,  # Blocked inside the browser via CDP
+        }
 
         # Initialize AI analyzer
         try:
             self.ai = Z_AI()
             self.prompt = self._load_prompt()
+            cache_fingerprint = AICache.make_fingerprint(
+                self.prompt, self.ai.model, self.ai.temperature
+            )
+            if self.sqlite_store:
+                self.ai_cache = SQLiteAICache(
+                    self.sqlite_store, cache_fingerprint, Env.AI_CACHE_MAX_ENTRIES
+                )
+            else:
+                self.ai_cache = AICache(
+                    Env.AI_CACHE_PATH or None,
+                    cache_fingerprint,
+                    Env.AI_CACHE_MAX_ENTRIES,
+                )
             Console.success("✅ AI analyzer initialized")
         except Exception as e:
             Console.warning(f"⚠️ AI analyzer failed to initialize: {e}")
             self.ai = None
             self.prompt = ""
+            self.ai_cache = None
+
+        # Local sentiment fast path, the AI only sees posts it is unsure about
+        self.local_sentiment: Optional[LexiconSentiment] = (
+            LexiconSentiment() if Env.LOCAL_SENTIMENT else None
+        )
 
         # Initialize cleaning patterns
         self._init_cleaning_patterns()
 
+    @property
+    def all_scraped_posts(self) -> List[Dict[str, Any]]:
+        """Posts of every loop, resumed history is read from the JSONL store on first use"""
+        if self._history_offset:
+            history = read_jsonl(self.CUMULATIVE_JSONL, 0, self._history_offset)
+            self._history_offset = 0
+            self._all_posts = self._latest_records(history + self._all_posts)
+        return self._all_posts
+
     def _load_prompt(self) -> str:
         """Load sentiment analysis prompt from prompt.txt"""
         try:
@@ -64,49 +258,12 @@ class CDPFacebookScraper:
 
     def _init_cleaning_patterns(self):
         """Initialize patterns for filtering noise/UI elements"""
-        # Patterns untuk filtering noise/UI elements
-        self.noise_patterns = [
-            # UI elements
-            re.compile(r"^(Like|Comment|Share|Follow|More)$", re.IGNORECASE),
-            re.compile(r"^\d+[KM]?\s*(Comments?|Like|Share|Follow)$", re.IGNORECASE),
-            re.compile(
-                r"^(People You May Know|Suggested for you|See all)$", re.IGNORECASE
-            ),
-            re.compile(r"^\d+\s*mutual friends?$", re.IGNORECASE),
-            re.compile(r"^(Add Friend|Remove|Block|Report)$", re.IGNORECASE),
-            re.compile(r"^(What's on your mind\?|Photo|Video|Live)$", re.IGNORECASE),
-            re.compile(r"^(Home|Search|Notifications|Menu|Profile)$", re.IGNORECASE),
-            re.compile(r"^(News Feed|Stories|Groups|Pages|Events)$", re.IGNORECASE),
-            # Navigation and interaction elements
-            re.compile(r"^(󰍸|󰍹|󰍺|󰞋)"),  # Facebook reaction icons
-            re.compile(r"^[\U0001F300-\U0001F6FF]+$"),  # Emoji-only content
-            re.compile(r"^\d+$"),  # Numbers only (like counts)
-            re.compile(r"^\d+[KM]$"),  # Like counts (1K, 2M, etc)
-            re.compile(r"^(󱘋|🎥|📷|📸|🎵)"),  # Media icons
-            # Time stamps and metadata
-            re.compile(r"^\d+[hmdHMD]$"),  # 1h, 2d, 3m ago
-            re.compile(r"^(Just now|Yesterday|Today)$", re.IGNORECASE),
-            re.compile(r"^(Sponsored|Promoted|Advertisement)$", re.IGNORECASE),
-            re.compile(r"^(Privacy|Public|Friends|Custom)$", re.IGNORECASE),
-            # Translation metadata
-            re.compile(r"^Translated from \w+$", re.IGNORECASE),
-            re.compile(r"^See translation$", re.IGNORECASE),
-            re.compile(r"^Original text$", re.IGNORECASE),
-            # Generic short noise
-            re.compile(r"^[\.]{3,}$"),  # Three dots or more
-            re.compile(r"^[…]+$"),  # Ellipsis
-            re.compile(r"^[\s\n\r]*$"),  # Whitespace only
-        ]
-
-        # Patterns untuk identifying real post content
+        # Pattern tables live in noise_classifier.py, compiled once here
+        self.noise_patterns = [re.compile(p, f) for p, f in NOISE_PATTERNS]
         self.post_content_patterns = [
-            # Text that looks like real posts (longer than 20 chars, contains meaningful words)
-            re.compile(
-                r"[a-zA-Z]{3,}.*[a-zA-Z]{3,}"
-            ),  # Contains at least 2 words of 3+ letters
-            re.compile(r"[.!?]{1}"),  # Contains sentence endings
-            re.compile(r"[,:;]"),  # Contains punctuation
+            re.compile(p, f) for p, f in POST_CONTENT_PATTERNS
         ]
+        self.noise_classifier = NoiseClassifier()
 
     def init(self):
         """Initialize browser with CDP enabled for mobile simulation"""
@@ -116,50 +273,12 @@ class CDPFacebookScraper:
         self.browser = playwright.chromium.launch(
             headless=Env.HEADLESS,
             slow_mo=Env.SLOW_MO_MS,
-            args=[
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-dev-shm-usage",
-                "--disable-blink-features=AutomationControlled",
-                "--disable-web-security",
-                "--disable-features=VizDisplayCompositor",
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-default-apps",
-                "--disable-extensions",
-                "--disable-plugins",
-                "--disable-javascript-harmony-shipping",
-                "--disable-background-timer-throttling",
-                "--disable-backgrounding-occluded-windows",
-                "--disable-renderer-backgrounding",
-                "--disable-features=TranslateUI",
-                "--disable-ipc-flooding-protection",
-                "--enable-features=NetworkService,NetworkServiceLogging",
-                "--force-color-profile=srgb",
-                "--metrics-recording-only",
-                "--no-zygote",
-                "--disable-gpu",
-                "--disable-software-rasterizer",
-                "--disable-background-networking",
-                "--disable-sync",
-                "--disable-translate",
-                "--hide-scrollbars",
-                "--mute-audio",
-                "--safebrowsing-disable-auto-update",
-                "--ignore-certificate-errors",
-                "--ignore-ssl-errors",
-                "--ignore-certificate-errors-spki-list",
-                # Mobile-specific args (user agent set in context)
-                "--window-size=375,667",
-                "--mobile-emulation=device=iPhone 8",
-                "--enable-touch-events",
-                "--disable-touch-adjustment",
-            ],
+            args=self.LAUNCH_ARGS,
         )
         # Create context with mobile user agent
         self.context = self.browser.new_context(
-            user_agent="Mozilla/5.0 (iPhone; CPU iPhone OS 13_2_3 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/13.0.3 Mobile/15E148 Safari/604.1",
-            viewport={"width": 375, "height": 667},
+            user_agent=self.USER_AGENT,
+            viewport=self.VIEWPORT,
         )
         self.page = self.context.new_page()
         # Get CDP session
@@ -196,51 +315,23 @@ class CDPFacebookScraper:
                 return
 
             # Set extra headers for mobile
-            self.page.set_extra_http_headers(
-                {
-                    "Accept-Language": "id-ID,id;q=0.9,en-US;q=0.8,en;q=0.7",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7",
-                    "Cache-Control": "max-age=0",
-                    "Pragma": "no-cache",
-                    "Sec-Ch-Ua": '"Google Chrome";v="119", "Chromium";v="119", "Not?A_Brand";v="24"',
-                    "Sec-Ch-Ua-Mobile": "?1",
-                    "Sec-Ch-Ua-Platform": '"iOS"',
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Upgrade-Insecure-Requests": "1",
-                    "DNT": "1",
-                }
-            )
+            self.page.set_extra_http_headers(self.EXTRA_HTTP_HEADERS)
+
+            # Block images, fonts dan media di browser untuk mempercepat loading
+            self._setup_resource_blocking()
 
             # Intercept and modify requests
             def handle_route(route):
                 request = route.request
+                self.request_stats["intercepted"] += 1
                 # Skip images, fonts, dan media untuk mempercepat loading
-                if request.resource_type in ["image", "font", "media", "websocket"]:
+                if self._should_abort_request(request):
                     route.abort()
                     return
-                # Modify headers untuk request Facebook mobile
-                if "facebook.com" in request.url:
-                    headers = dict(request.headers)
-                    headers.update(
-                        {
-                            "Referer": "https://m.facebook.com/",
-                            "Origin": "https://m.facebook.com",
-                            "Sec-Fetch-Site": (
-                                "same-origin" if "login" in request.url else "same-site"
-                            ),
-                            "Sec-Fetch-Mode": "cors",
-                            "Sec-Fetch-Dest": "empty",
-                        }
-                    )
-                    route.continue_(headers=headers)
-                else:
-                    route.continue_()
+                route.continue_(headers=self._route_headers(request))
 
-            self.page.route("**/*", handle_route)
+            # Only facebook.com requests need header changes, the rest bypass Python
+            self.page.route(self.ROUTED_URL_PATTERN, handle_route)
 
             Console.success(
                 "✅ Stealth mode berhasil diaktifkan dengan pengaturan lengkap"
@@ -249,6 +340,60 @@ class CDPFacebookScraper:
         except Exception as error:
             Console.warning(f"⚠️ Warning: Stealth setup tidak sempurna: {error}")
 
+    def _should_abort_request(self, request) -> bool:
+        """Heavy resources that slipped past the CDP block list"""
+        return request.resource_type in ["image", "font", "media", "websocket"]
+
+    def _route_headers(self, request) -> Optional[Dict[str, str]]:
+        """Modified headers untuk request Facebook mobile, None keeps the original"""
+        if "facebook.com" not in request.url:
+            return None
+        headers = dict(request.headers)
+        headers.update(
+            {
+                "Referer": "https://m.facebook.com/",
+                "Origin": "https://m.facebook.com",
+                "Sec-Fetch-Site": (
+                    "same-origin" if "login" in request.url else "same-site"
+                ),
+                "Sec-Fetch-Mode": "cors",
+                "Sec-Fetch-Dest": "empty",
+            }
+        )
+        return headers
+
+    def _setup_resource_blocking(self):
+        """Block heavy resources inside the browser through the CDP session"""
+        try:
+            self.cdp_session.send(
+                "Network.setBlockedURLs", {"urls": self.BLOCKED_URL_PATTERNS}
+            )
+
+            # Counting only listens to events, it never holds a request
+            def on_request(request):
+                self.request_stats["total"] += 1
+
+            def on_request_failed(request):
+                if "ERR_BLOCKED_BY_CLIENT" in (request.failure or ""):
+                    self.request_stats["blocked"] += 1
+
+            self.page.on("request", on_request)
+            self.page.on("requestfailed", on_request_failed)
+            Console.success(
+                f"✅ Resource blocking aktif di browser ({len(self.BLOCKED_URL_PATTERNS)} pola URL)"
+            )
+        except Exception as error:
+            Console.warning(f"⚠️ Resource blocking via CDP gagal: {error}")
+
+    def _log_request_stats(self):
+        """Log how many requests went through Python vs. stayed in the browser"""
+        total = self.request_stats["total"]
+        intercepted = self.request_stats["intercepted"]
+        Console.debug(
+            f"🌐 Requests: {total} total | {intercepted} intercepted by Python | "
+            f"{total - intercepted} passed in browser | {self.request_stats['blocked']} blocked via CDP"
+        )
+
     def _setup_stealth_inline(self):
         """Fallback method for stealth setup using external fallback script"""
         try:
@@ -275,14 +420,9 @@ class CDPFacebookScraper:
             self.page.wait_for_load_state("networkidle", timeout=10000)
 
             # Try multiple selectors for email field
-            email_selectors = [
-                '[name="email"]',
-                'input[type="email"]',
-                'input[placeholder*="email"]',
-            ]
             email_found = False
 
-            for selector in email_selectors:
+            for selector in self.EMAIL_SELECTORS:
                 try:
                     self.page.wait_for_selector(selector, timeout=5000)
                     Console.debug(
@@ -315,14 +455,9 @@ class CDPFacebookScraper:
             self.page.wait_for_selector(selector, timeout=5000)
 
             # Try multiple selectors for password field
-            password_selectors = [
-                '[name="pass"]',
-                'input[type="password"]',
-                'input[placeholder*="password"]',
-            ]
             password_found = False
 
-            for selector in password_selectors:
+            for selector in self.PASSWORD_SELECTORS:
                 try:
                     self.page.wait_for_selector(selector, timeout=5000)
                     Console.debug(
@@ -557,6 +692,10 @@ class CDPFacebookScraper:
         self, target_url: Optional[str] = None, loop_interval: int = 300
     ) -> List[Dict[str, Any]]:
         """Continuous scraping with forever loop and deduplication"""
+        self._resume_from_checkpoint()
+        if Env.PIPELINE_ENABLED:
+            return self._scrape_status_pipelined(target_url, loop_interval)
+
         Console.log("🔄 Starting continuous scraping mode...")
 
         while True:
@@ -572,9 +711,9 @@ class CDPFacebookScraper:
                     unique_new_posts = self._filter_duplicate_posts(new_posts)
 
                     if unique_new_posts:
-                        self.all_scraped_posts.extend(unique_new_posts)
+                        self._accept_posts(unique_new_posts)
                         Console.success(
-                            f"✅ Added {len(unique_new_posts)} new unique posts. Total: {len(self.all_scraped_posts)} posts"
+                            f"✅ Added {len(unique_new_posts)} new unique posts. Total: {self.running_stats.total} posts"
                         )
 
                         # Save with append mode
@@ -600,45 +739,124 @@ class CDPFacebookScraper:
 
         return self.all_scraped_posts
 
-    def _scrape_status_single(
-        self, target_url: Optional[str] = None
+    def _scrape_status_pipelined(
+        self, target_url: Optional[str] = None, loop_interval: int = 300
     ) -> List[Dict[str, Any]]:
-        """Scrape status posts from Facebook feed - single iteration"""
+        """Continuous scraping where AI analysis and saving never pause scrolling"""
+        Console.log("🔄 Starting continuous scraping mode (pipeline)...")
+        # Analysis runs after dedup here, so streamed results can be stored right away
+        if self.on_post_analyzed is None:
+            self.on_post_analyzed = self._persist_analyzed_post
+        self.pipeline = self._build_pipeline()
+
         try:
-            url = target_url or "https://m.facebook.com/"
-            Console.debug(f"📱 Membuka halaman: {url}")
+            while True:
+                try:
+                    self.loop_count += 1
+                    Console.log(f"🔄 Loop iteration #{self.loop_count}")
 
-            if self.page.url != url:
-                self.page.goto(url, wait_until="networkidle", timeout=30000)
+                    # Extract and clean run here, analyze and persist on workers
+                    self.pipeline.submit(
+                        {"loop": self.loop_count, "url": target_url, "posts": []}
+                    )
+                    self.pipeline.log_stats()
 
-            # Wait for initial content to load
-            try:
-                self.page.wait_for_selector(
-                    '[data-mcomponent="MContainer"], [role="main"], [data-testid="post_message"]',
-                    timeout=10000,
-                )
-            except Exception:
-                Console.warning(
-                    "⚠️ Initial content selector not found, using load state wait"
-                )
-                self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+                    Console.log(
+                        f"⏳ Waiting {loop_interval} seconds before next iteration..."
+                    )
+                    time.sleep(loop_interval)
 
-            # Wait for additional content to settle
-            try:
-                self.page.wait_for_load_state("networkidle", timeout=10000)
-            except Exception:
-                Console.warning(
-                    "⚠️ Network idle timeout, continuing with available content"
-                )
+                except KeyboardInterrupt:
+                    Console.log("⏹️ Continuous scraping stopped by user")
+                    break
+                except Exception as error:
+                    Console.error(f"❌ Error in continuous scraping: {error}")
+                    Console.log(f"⏳ Waiting {loop_interval} seconds before retry...")
+                    time.sleep(loop_interval)
+        finally:
+            self._close_pipeline()
+
+        return self.all_scraped_posts
+
+    def _build_pipeline(self) -> ScrapePipeline:
+        """extract -> clean on the Playwright thread, analyze -> persist on workers"""
+        return ScrapePipeline(
+            [
+                PipelineStage("extract", self._pipeline_extract),
+                PipelineStage("clean", self._pipeline_clean),
+                PipelineStage(
+                    "analyze",
+                    self._pipeline_analyze,
+                    threaded=True,
+                    queue_size=Env.PIPELINE_QUEUE_SIZE,
+                ),
+                PipelineStage(
+                    "persist",
+                    self._pipeline_persist,
+                    threaded=True,
+                    queue_size=Env.PIPELINE_QUEUE_SIZE,
+                ),
+            ]
+        )
+
+    def _close_pipeline(self) -> None:
+        """Wait until every queued batch is analyzed and saved"""
+        if self.pipeline:
+            Console.log("⏳ Flushing pipeline...")
+            self.pipeline.close()
+            self.pipeline.log_stats()
+            self.pipeline = None
+
+    def _pipeline_extract(self, batch: Dict[str, Any]) -> bool:
+        """Pipeline stage: scroll the feed and pull raw posts"""
+        batch["posts"] = self._scrape_raw_posts(batch["url"])
+        self._log_request_stats()
+        if not batch["posts"]:
+            Console.warning("⚠️ No posts scraped in this iteration")
+        return bool(batch["posts"])
+
+    def _pipeline_clean(self, batch: Dict[str, Any]) -> bool:
+        """Pipeline stage: filter noise, resolve authors and drop known posts"""
+        cleaned_posts = self._extract_posts_with_advanced_cleaning(
+            batch["posts"], analyze=False
+        )
+        batch["posts"] = self._filter_duplicate_posts(cleaned_posts)
+        if not batch["posts"]:
+            Console.info("ℹ️ No new unique posts found in this iteration")
+        return bool(batch["posts"])
+
+    def _pipeline_analyze(self, batch: Dict[str, Any]) -> bool:
+        """Pipeline stage (worker thread): AI sentiment analysis"""
+        if self.ai:
+            Console.log(
+                f"🤖 Starting batch AI sentiment analysis for loop #{batch['loop']}..."
+            )
+            self._batch_analyze_sentiment(batch["posts"])
+        return True
+
+    def _pipeline_persist(self, batch: Dict[str, Any]) -> bool:
+        """Pipeline stage (worker thread): add to global storage and save"""
+        self._accept_posts(batch["posts"])
+        Console.success(
+            f"✅ Added {len(batch['posts'])} new unique posts. Total: {self.running_stats.total} posts"
+        )
+        self._save_posts_append(batch["posts"], batch["loop"])
+        return False
 
-            # Scroll to load more posts
-            self._auto_scroll()
-            Console.log("🔄 Scrolling to load more posts...")
+    def _scrape_status_single(
+        self, target_url: Optional[str] = None, analyze: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Scrape status posts from Facebook feed - single iteration"""
+        try:
+            raw_posts = self._scrape_raw_posts(target_url)
 
             # Scrape status posts with advanced cleaning
-            posts = self._extract_posts_with_advanced_cleaning()
+            posts = self._extract_posts_with_advanced_cleaning(
+                raw_posts, analyze=analyze
+            )
 
             Console.success(f"✅ Berhasil scrape {len(posts)} clean status")
+            self._log_request_stats()
             self.posts = posts
             self.cleaned_posts = posts
             return posts
@@ -647,6 +865,54 @@ class CDPFacebookScraper:
             Console.error(f"❌ Error saat scraping status: {error}")
             return []
 
+    def _scrape_raw_posts(
+        self, target_url: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Open the feed, scroll and return raw (uncleaned) posts"""
+        url = target_url or "https://m.facebook.com/"
+        Console.debug(f"📱 Membuka halaman: {url}")
+
+        # Refresh mode starts every loop from the top of a fresh, small DOM
+        refresh_until_known = Env.REFRESH_UNTIL_KNOWN and bool(self.known_post_keys)
+        if refresh_until_known or self.page.url != url:
+            self.page.goto(url, wait_until="networkidle", timeout=30000)
+
+        # Wait for initial content to load
+        try:
+            self.page.wait_for_selector(
+                '[data-mcomponent="MContainer"], [role="main"], [data-testid="post_message"]',
+                timeout=10000,
+            )
+        except Exception:
+            Console.warning("⚠️ Initial content selector not found, using load state wait")
+            self.page.wait_for_load_state("domcontentloaded", timeout=5000)
+
+        # Wait for additional content to settle
+        try:
+            self.page.wait_for_load_state("networkidle", timeout=10000)
+        except Exception:
+            Console.warning("⚠️ Network idle timeout, continuing with available content")
+
+        incremental = Env.COLLECT_MODE == "incremental"
+        if incremental:
+            # Harvest posts in-page while scrolling instead of rescanning afterwards
+            self._collected_posts = []
+            self._install_post_collector()
+
+        # Scroll to load more posts
+        self._auto_scroll(stop_on_known=refresh_until_known)
+        Console.log("🔄 Scrolling to load more posts...")
+
+        if incremental:
+            self._drain_post_collector()
+            return self._collected_posts
+        return self._extract_posts_advanced()
+
+    def _accept_posts(self, posts: List[Dict[str, Any]]) -> None:
+        """Add analyzed unique posts to global storage and the running stats"""
+        self._all_posts.extend(posts)
+        self.running_stats.add_many(posts)
+
     def _filter_duplicate_posts(
         self, new_posts: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -657,15 +923,30 @@ class CDPFacebookScraper:
             # Create hash from text + author for deduplication
             content_hash = self._create_post_hash(post)
 
-            if content_hash not in self.scraped_post_hashes:
-                self.scraped_post_hashes.add(content_hash)
-                unique_posts.append(post)
-                Console.debug(f"✅ New unique post: \"{post.get('text', '')[:50]}...\"")
-            else:
+            if content_hash in self.scraped_post_hashes:
                 Console.debug(
                     f"⏭️ Duplicate post filtered: \"{post.get('text', '')[:50]}...\""
                 )
+                continue
+            self.scraped_post_hashes.add(content_hash)
 
+            # Same post seen before, truncated, re-shared or with emoji/whitespace edits
+            if self.near_duplicates is not None:
+                match, item_id = self.near_duplicates.check_and_add(post.get("text", ""))
+                if match is not None:
+                    self.near_duplicates_merged += 1
+                    Console.debug(
+                        f"⏭️ Near-duplicate post merged: \"{post.get('text', '')[:50]}...\""
+                    )
+                    continue
+                if item_id >= 0:
+                    self._near_dup_ids[content_hash] = item_id
+
+            unique_posts.append(post)
+            Console.debug(f"✅ New unique post: \"{post.get('text', '')[:50]}...\"")
+
+        # Hashes are only in memory here, _save_posts_append persists them once saved
+        self._remember_known_posts(new_posts)
         return unique_posts
 
     def _create_post_hash(self, post: Dict[str, Any]) -> str:
@@ -680,102 +961,307 @@ class CDPFacebookScraper:
         hash_string = f"{text}|{author}"
         return hashlib.md5(hash_string.encode("utf-8")).hexdigest()
 
-    def _save_posts_append(self, posts: List[Dict[str, Any]]) -> None:
+    def _save_posts_append(
+        self, posts: List[Dict[str, Any]], loop_number: Optional[int] = None
+    ) -> None:
         """Save posts with append mode to avoid overwriting previous data"""
         try:
             if not posts:
                 return
+            loop_number = loop_number or self.loop_count
 
             # Create output directories if not exists
             os.makedirs("output", exist_ok=True)
             os.makedirs("output/loop_trace", exist_ok=True)
 
             filename_json = (
-                f"output/loop_trace/facebook_posts_cdp_loop_{self.loop_count}.json"
-            )
-            filename_csv = (
-                f"output/loop_trace/facebook_posts_cdp_loop_{self.loop_count}.csv"
+                f"output/loop_trace/facebook_posts_cdp_loop_{loop_number}.json"
             )
 
-            # Save individual loop results
+            # Save individual loop results (JSON, CSV and cleaning report)
             stats = self._calculate_cleaning_stats(posts)
             source = (
                 Env.TARGET_PROFILE_URL
                 if hasattr(Env, "TARGET_PROFILE_URL")
                 else "https://m.facebook.com/me"
             )
+            # Snapshot, the writer thread must not see later changes
+            posts = [dict(post) for post in posts]
+
+            self.writer.submit(
+                save_to_file,
+                posts,
+                stats,
+                filename_json,
+                source,
+                key=filename_json,
+                paths=saved_file_paths(filename_json),
+            )
 
-            save_to_file(posts, stats, filename_json, source)
-            save_to_csv(posts, filename_csv)
+            # Append only this loop's posts to the cumulative store. Streamed posts
+            # are already there, a differing final analysis is appended as a
+            # correction (the last record of a post hash wins)
+            post_hashes = [self._create_post_hash(post) for post in posts]
+            self._append_cumulative(
+                [
+                    post
+                    for post, post_hash in zip(posts, post_hashes)
+                    if self._pop_streamed(post_hash) != post
+                ]
+            )
+            self._save_to_sqlite(posts, loop_number)
 
-            # Also save cumulative results
-            if len(self.all_scraped_posts) > 0:
-                cumulative_filename_json = "output/facebook_posts_cdp_cumulative.json"
-                cumulative_filename_csv = "output/facebook_posts_cdp_cumulative.csv"
+            # Persist fingerprints only after the posts themselves reached the disk
+            self.writer.submit(self.scraped_post_hashes.persist, post_hashes)
 
-                cumulative_stats = self._calculate_cleaning_stats(
-                    self.all_scraped_posts
-                )
-                save_to_file(
-                    self.all_scraped_posts,
-                    cumulative_stats,
-                    cumulative_filename_json,
-                    source,
-                )
-                save_to_csv(self.all_scraped_posts, cumulative_filename_csv)
+            self._save_checkpoint(loop_number, posts, post_hashes)
+            self._save_ai_cache()
 
-                Console.success(
-                    f"💾 Saved loop #{self.loop_count}: {len(posts)} posts | Cumulative: {len(self.all_scraped_posts)} posts"
-                )
+            Console.success(
+                f"💾 Saved loop #{loop_number}: {len(posts)} posts | Cumulative: {self.running_stats.total} posts"
+            )
 
         except Exception as error:
             Console.error(f"❌ Error saving posts: {error}")
 
-    def _auto_scroll(self):
-        """Auto-scroll to load more posts"""
+    def _append_cumulative(self, posts: List[Dict[str, Any]]) -> None:
+        """Queue appends to the cumulative JSONL and CSV"""
+        if not posts:
+            return
+        self.writer.submit(
+            append_jsonl,
+            posts,
+            self.CUMULATIVE_JSONL,
+            paths=[self.CUMULATIVE_JSONL],
+            append=True,
+        )
+        self.writer.submit(
+            append_to_csv,
+            posts,
+            self.CUMULATIVE_CSV,
+            paths=[self.CUMULATIVE_CSV],
+            append=True,
+        )
+
+    def _pop_streamed(self, post_hash: str) -> Optional[Dict[str, Any]]:
+        """Record appended by the stream for this post, if any"""
+        with self._streamed_lock:
+            return self._streamed_records.pop(post_hash, None)
+
+    def _persist_analyzed_post(
+        self, post: Dict[str, Any], analysis: Dict[str, Any]
+    ) -> None:
+        """
+        Append one streamed analysis while the rest of its batch is still generating.
+        SQLite is left to the loop's single upsert, which has the final analysis.
+        """
+        record = dict(post, **analysis)
+        record.pop("needs_analysis", None)
+        with self._streamed_lock:
+            self._streamed_records[self._create_post_hash(post)] = record
+        self._append_cumulative([record])
+
+    def _latest_records(self, posts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """One record per post hash from the cumulative store, the last one wins"""
+        latest: Dict[str, Dict[str, Any]] = {}
+        for post in posts:
+            latest[self._create_post_hash(post)] = post
+        return list(latest.values())
+
+    def _save_checkpoint(
+        self,
+        loop_number: Optional[int] = None,
+        posts: List[Dict[str, Any]] = (),
+        post_hashes: List[str] = (),
+    ) -> None:
+        """
+        Queue the checkpoint after this loop's appends (posts live in the JSONL store).
+        Only the saved batch is added: the shared index and known keys may already
+        hold the next loop's posts, which are not on disk yet.
+        """
+        if not Env.CHECKPOINT_PATH:
+            return
+        if loop_number:
+            self._checkpoint_loop = max(self._checkpoint_loop, loop_number)
+        self._remember_keys(self._checkpoint_keys, posts)
+
+        # Near-duplicate signatures go to an append-only sidecar, recomputing them is slow
+        if self.near_duplicates is not None:
+            item_ids = [
+                self._near_dup_ids.pop(post_hash)
+                for post_hash in post_hashes
+                if post_hash in self._near_dup_ids
+            ]
+            items = self.near_duplicates.export_items(item_ids)
+            sidecar = self._near_dup_checkpoint_path()
+            if self._near_dup_exported == 0:
+                # First export of a run that did not resume starts a new file
+                self.writer.submit(save_jsonl, items, sidecar, key=sidecar, paths=[sidecar])
+            elif items:
+                self.writer.submit(
+                    append_jsonl, items, sidecar, paths=[sidecar], append=True
+                )
+            self._near_dup_exported += len(items)
+
+        with self._streamed_lock:
+            streamed_pending = list(self._streamed_records.values())
+        state = {
+            "savedAt": datetime.now().isoformat(),
+            "loopCount": self._checkpoint_loop,
+            "totalPosts": self.running_stats.total,
+            "nearDuplicatesMerged": self.near_duplicates_merged,
+            "nearDuplicateItems": self._near_dup_exported,
+            "knownPostKeys": list(self._checkpoint_keys),
+            # Stats of every saved post, resume then only reads the store past jsonlOffset
+            "runningStats": self.running_stats.state(),
+            # Streamed records of loops not saved yet, they may sit before jsonlOffset
+            "streamedPending": streamed_pending,
+        }
+        self.writer.submit(
+            self._write_checkpoint,
+            state,
+            key=Env.CHECKPOINT_PATH,
+            paths=[Env.CHECKPOINT_PATH],
+        )
+
+    def _write_checkpoint(self, state: Dict[str, Any]) -> None:
+        """Writer job: every append queued before it is on disk, later ones are not"""
+        state["jsonlOffset"] = (
+            os.path.getsize(self.CUMULATIVE_JSONL)
+            if os.path.exists(self.CUMULATIVE_JSONL)
+            else 0
+        )
+        save_checkpoint(state, Env.CHECKPOINT_PATH)
+
+    def _near_dup_checkpoint_path(self) -> str:
+        return f"{os.path.splitext(Env.CHECKPOINT_PATH)[0]}_near_duplicates.jsonl"
+
+    def _resume_from_checkpoint(self) -> bool:
+        """
+        Restore loop count, stats and dedup state saved by a previous run.
+        Only posts written after the checkpoint are read, older ones stay in the
+        JSONL store until all_scraped_posts is first used.
+        """
+        if not Env.RESUME or self.loop_count:
+            return False
+        checkpoint = load_checkpoint(Env.CHECKPOINT_PATH)
+        if not checkpoint:
+            return False
+
+        started = time.perf_counter()
+        truncate_torn_line(self.CUMULATIVE_JSONL)
+        store_size = (
+            os.path.getsize(self.CUMULATIVE_JSONL)
+            if os.path.exists(self.CUMULATIVE_JSONL)
+            else 0
+        )
+        offset = checkpoint.get("jsonlOffset")
+        items = (
+            read_jsonl(self._near_dup_checkpoint_path())
+            if self.near_duplicates is not None
+            else []
+        )
+        incremental = (
+            offset is not None
+            and offset <= store_size
+            and "runningStats" in checkpoint
+            and (self.near_duplicates is None or bool(items) or not offset)
+        )
+
+        if incremental:
+            self.running_stats = RunningStats.from_state(checkpoint["runningStats"])
+            pending = checkpoint.get("streamedPending", [])
+            if items:
+                self.near_duplicates.restore(items)
+                self._near_dup_exported = len(items)
+        else:
+            # Older checkpoint, replaced store or missing sidecar: rebuild from the whole store
+            offset, pending = 0, []
+        self._history_offset = offset
+
+        if offset and not self.scraped_post_hashes.persistent:
+            # In-memory dedup set, fingerprints of older posts come from the store
+            for post in read_jsonl(self.CUMULATIVE_JSONL, 0, offset):
+                self.scraped_post_hashes.add(self._create_post_hash(post))
+
+        self.loop_count = checkpoint.get("loopCount", 0)
+        self.near_duplicates_merged = checkpoint.get("nearDuplicatesMerged", 0)
+        self._checkpoint_loop = self.loop_count
+        self._checkpoint_keys = dict.fromkeys(checkpoint.get("knownPostKeys", []))
+
+        # Posts saved after the checkpoint was written, or streamed before it
+        tail = self._latest_records(pending + read_jsonl(self.CUMULATIVE_JSONL, offset))
+        self._accept_posts(tail)
+        tail_hashes = []
+        unlogged = []
+        for post in tail:
+            content_hash = self._create_post_hash(post)
+            tail_hashes.append(content_hash)
+            # Persistent dedup stores may already hold some of these, log the rest
+            if content_hash not in self.scraped_post_hashes:
+                self.scraped_post_hashes.add(content_hash)
+                unlogged.append(content_hash)
+            if self.near_duplicates is not None:
+                self._near_dup_ids[content_hash] = self.near_duplicates.add(
+                    post.get("text", "")
+                )
+        self.scraped_post_hashes.persist(unlogged)
+
+        # Fold the tail into a fresh checkpoint so the next start reads nothing twice
+        self._save_checkpoint(posts=tail, post_hashes=tail_hashes)
+        self.known_post_keys = dict(self._checkpoint_keys)
+
+        Console.success(
+            f"♻️ Resumed from {Env.CHECKPOINT_PATH}: loop #{self.loop_count}, "
+            f"{self.running_stats.total} posts ({len(tail)} read from the store) "
+            f"in {time.perf_counter() - started:.2f}s"
+        )
+        return True
+
+    def _auto_scroll(self, stop_on_known: bool = False):
+        """Auto-scroll to load more posts
+
+        With stop_on_known, scrolling ends as soon as KNOWN_STOP_RUN consecutive
+        already scraped posts have been loaded.
+        """
         Console.debug("📜 Melakukan auto-scroll untuk memuat lebih banyak post...")
 
         max_posts = Env.MAX_POSTS_TO_SCRAPE
         loaded_posts = 0
         previous_height = 0
         scroll_attempts = 0
+        scroll_steps = 0
         max_scroll_attempts = 25
 
-        while loaded_posts < max_posts and scroll_attempts < max_scroll_attempts:
-            # Scroll to bottom to load more posts
-            self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        scroll_step_js = self._get_script("scroll_step.js")
+        scroll_started = time.perf_counter()
+        step_waits: List[Dict[str, Any]] = []
 
-            # Wait for new content to load after scroll
+        while loaded_posts < max_posts and scroll_attempts < max_scroll_attempts:
+            # Scroll, wait and count posts/height in a single round-trip.
+            # The wait ends when content arrives or the network settles, delay is a cap.
             delay = random.randint(1000, 2000) + Env.SCRAPE_DELAY_MS
+            step_started = time.perf_counter()
             try:
-                # Wait for potential new content to appear
-                self.page.wait_for_function(
-                    f"""() => {{
-                        return new Promise(resolve => {{
-                            let initialCount = document.querySelectorAll('[data-mcomponent="MContainer"]').length;
-                            setTimeout(() => {{
-                                let newCount = document.querySelectorAll('[data-mcomponent="MContainer"]').length;
-                                resolve(true); // Always resolve after delay
-                            }}, {delay});
-                        }});
-                    }}""",
-                    timeout=delay + 2000,
+                step = self.page.evaluate(
+                    scroll_step_js, {"delay": delay, "quietMs": Env.SCROLL_QUIET_MS}
                 )
-            except Exception:
-                # Fallback to time-based delay if wait_for_function fails
-                delay_seconds = delay / 1000
-                time.sleep(min(delay_seconds, 3.0))  # Cap at 3 seconds max
-
-            # Count loaded posts
-            current_posts = self.page.query_selector_all(
-                '[data-mcomponent="MContainer"]:has([data-mcomponent="TextArea"]), '
-                '[data-testid="post_message"], [data-testid="post_text"], '
-                '.userContent, .post-content, [data-nt="NT:TEXT"]'
+            except Exception as error:
+                Console.warning(f"⚠️ Scroll step failed: {error}")
+                break
+            step_ms = (time.perf_counter() - step_started) * 1000
+            scroll_steps += 1
+            step_waits.append({"ms": step["waitedMs"], "reason": step["reason"]})
+
+            new_posts = max(step["postCount"] - loaded_posts, 0)
+            loaded_posts = step["postCount"]
+            Console.debug(
+                f"⏱️ Scroll step {scroll_steps}: {step_ms:.0f} ms (waited {step['waitedMs']} ms, {step['reason']}), +{new_posts} posts"
+                + (f" ({step_ms / new_posts:.0f} ms/post)" if new_posts else "")
             )
-            loaded_posts = len(current_posts)
 
             # Check if we've reached the bottom
-            current_height = self.page.evaluate("document.body.scrollHeight")
+            current_height = step["scrollHeight"]
             if current_height == previous_height:
                 scroll_attempts += 1
             else:
@@ -786,6 +1272,12 @@ class CDPFacebookScraper:
                 f"📊 Post yang sudah dimuat: {loaded_posts}, Scroll attempt: {scroll_attempts}"
             )
 
+            if Env.COLLECT_MODE == "incremental":
+                self._drain_post_collector()
+
+            if stop_on_known and self._reached_known_posts(first_step=scroll_steps == 1):
+                break
+
             # If scrolled 3 times without change, stop
             if scroll_attempts >= 3:
                 Console.info(
@@ -793,9 +1285,217 @@ class CDPFacebookScraper:
                 )
                 break
 
+        self._summarize_scroll(scroll_started, scroll_steps, loaded_posts, step_waits)
+
+    def _summarize_scroll(
+        self,
+        scroll_started: float,
+        scroll_steps: int,
+        loaded_posts: int,
+        step_waits: List[Dict[str, Any]],
+    ) -> None:
+        """Store and log timing of a finished auto-scroll"""
+        scroll_ms = (time.perf_counter() - scroll_started) * 1000
+        wait_reasons: Dict[str, int] = {}
+        for wait in step_waits:
+            wait_reasons[wait["reason"]] = wait_reasons.get(wait["reason"], 0) + 1
+        total_wait_ms = sum(wait["ms"] for wait in step_waits)
+
+        self.last_scroll_stats = {
+            "steps": scroll_steps,
+            "posts": loaded_posts,
+            "totalMs": round(scroll_ms, 1),
+            "msPerPost": round(scroll_ms / loaded_posts, 1) if loaded_posts else None,
+            "waitMs": total_wait_ms,
+            "waitReasons": wait_reasons,
+            "waits": step_waits,
+        }
+        Console.info(
+            f"⏱️ Auto-scroll took {scroll_ms / 1000:.1f}s for {loaded_posts} posts in {scroll_steps} steps"
+            + (f" ({scroll_ms / loaded_posts:.0f} ms/post)" if loaded_posts else "")
+        )
+        if step_waits:
+            Console.debug(
+                f"⏱️ Scroll waits: {total_wait_ms} ms total, avg {total_wait_ms / len(step_waits):.0f} ms/step, reasons {wait_reasons}"
+            )
+
+    def _get_script(self, script_name: str) -> str:
+        """Read a JS script once and serve it from cache afterwards"""
+        if script_name not in self._script_cache:
+            self._script_cache[script_name] = read_js_script(script_name)
+        return self._script_cache[script_name]
+
+    def _get_composed_script(self, script_name: str) -> str:
+        """Build a script with the per-container extractor and post key inlined"""
+        if script_name not in self._script_cache:
+            container_js = read_js_script("extract_container_post_data.js").strip()
+            post_key_js = read_js_script("post_key.js").strip()
+            self._script_cache[script_name] = (
+                read_js_script(script_name)
+                .replace("EXTRACT_CONTAINER_POST_DATA", container_js)
+                .replace("POST_KEY", post_key_js)
+            )
+        return self._script_cache[script_name]
+
+    def _remember_known_posts(self, posts: List[Dict[str, Any]]) -> None:
+        """Record text keys of scraped posts so the page can skip them next loop"""
+        self._remember_keys(self.known_post_keys, posts)
+
+    @staticmethod
+    def _remember_keys(known: Dict[str, None], posts: List[Dict[str, Any]]) -> None:
+        """Add text keys of posts to an ordered key set capped at KNOWN_KEYS_LIMIT"""
+        for post in posts:
+            key = post_text_key(post.get("text", ""))
+            # Re-insert to keep most recently seen keys at the end
+            known.pop(key, None)
+            known[key] = None
+
+        overflow = len(known) - Env.KNOWN_KEYS_LIMIT
+        if overflow > 0:
+            for key in list(known)[:overflow]:
+                del known[key]
+
+    def _known_keys_payload(self) -> List[str]:
+        """Known post keys to push into the page, empty when filtering is disabled"""
+        if not Env.PAGE_KNOWN_FILTER:
+            return []
+        return list(self.known_post_keys)
+
+    def _install_post_collector(self) -> None:
+        """Install MutationObserver collector that buffers new posts in the page"""
+        try:
+            stats = self.page.evaluate(
+                self._get_composed_script("post_collector.js"),
+                {
+                    "maxBuffer": Env.COLLECT_MAX_BUFFER,
+                    "knownKeys": self._known_keys_payload(),
+                },
+            )
+            if stats and stats.get("alreadyInstalled"):
+                Console.debug(
+                    f"👀 Post collector already active ({stats.get('buffered', 0)} buffered)"
+                )
+            else:
+                Console.debug(
+                    f"👀 Post collector installed ({(stats or {}).get('buffered', 0)} posts already in DOM)"
+                )
+        except Exception as error:
+            Console.warning(f"⚠️ Failed to install post collector: {error}")
+
+    def _drain_post_collector(self) -> int:
+        """Drain buffered posts from the in-page collector in batches"""
+        drained = 0
+        try:
+            started = time.perf_counter()
+            drain_js = self._get_script("drain_post_collector.js")
+            while True:
+                result = self.page.evaluate(drain_js, Env.COLLECT_DRAIN_BATCH)
+                if result is None:
+                    # Page navigated or reloaded, collector has to be reinstalled
+                    Console.debug("👀 Post collector missing, reinstalling...")
+                    self._install_post_collector()
+                    result = self.page.evaluate(drain_js, Env.COLLECT_DRAIN_BATCH)
+                    if result is None:
+                        break
+
+                batch_size = self._store_drained_batch(result)
+                drained += batch_size
+                if not batch_size or result.get("remaining", 0) == 0:
+                    break
+
+            self._log_drain(drained, started)
+        except Exception as error:
+            Console.warning(f"⚠️ Failed to drain post collector: {error}")
+        return drained
+
+    def _store_drained_batch(self, result: Dict[str, Any]) -> int:
+        """Keep one drained collector batch, return its size"""
+        batch = result.get("posts", [])
+        self._collected_posts.extend(batch)
+        if result.get("dropped"):
+            Console.warning(
+                f"⚠️ Post collector dropped {result['dropped']} posts (buffer full)"
+            )
+        return len(batch)
+
+    def _log_drain(self, drained: int, started: float) -> None:
+        """Log timing of a collector drain"""
+        if drained:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            Console.debug(
+                f"👀 Drained {drained} new posts in {elapsed_ms:.1f} ms (total collected: {len(self._collected_posts)})"
+            )
+
+    def _reached_known_posts(self, first_step: bool) -> bool:
+        """Check whether the loaded feed already shows a run of known posts"""
+        try:
+            result = self.page.evaluate(
+                self._get_composed_script("known_run.js"),
+                # Known keys are only sent on the first step of each loop
+                {"knownKeys": list(self.known_post_keys) if first_step else None},
+            )
+            max_run = result.get("maxRun", 0) if result else 0
+            if max_run >= Env.KNOWN_STOP_RUN:
+                Console.info(
+                    f"🛑 Found {max_run} known posts in a row after {result.get('posts', 0)} posts, stop scrolling"
+                )
+                return True
+        except Exception as error:
+            Console.warning(f"⚠️ Failed to check known posts: {error}")
+        return False
+
     def _extract_posts_advanced(self) -> List[Dict[str, Any]]:
-        """Extract posts using advanced filtering"""
+        """Extract posts using the configured extraction mode"""
+        if Env.EXTRACT_MODE == "legacy":
+            return self._extract_posts_per_container()
+        return self._extract_posts_batch()
+
+    def _extract_posts_batch(self) -> List[Dict[str, Any]]:
+        """Extract posts from all containers in a single page.evaluate round-trip"""
         try:
+            started = time.perf_counter()
+            result = self.page.evaluate(
+                self._get_composed_script("extract_posts_batch.js"),
+                {"knownKeys": self._known_keys_payload()},
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            return self._read_batch_extraction(result, elapsed_ms)
+
+        except Exception as error:
+            Console.error(f"❌ Error saat batch extract posts: {error}")
+            return []
+
+    def _read_batch_extraction(
+        self, result: Optional[Dict[str, Any]], elapsed_ms: float
+    ) -> List[Dict[str, Any]]:
+        """Log and unpack the result of extract_posts_batch.js"""
+        posts = result.get("posts", []) if result else []
+        container_count = result.get("containerCount", 0) if result else 0
+        errors = result.get("errors", 0) if result else 0
+        skipped_known = result.get("skippedKnown", 0) if result else 0
+
+        for post_data in posts:
+            Console.debug(
+                f"📝 Extracted from valid container {post_data.get('id')}: \"{post_data['text'][:50]}...\" (Author: {post_data.get('author', 'N/A')})"
+            )
+        if errors:
+            Console.warning(f"⚠️ {errors} containers failed during batch extraction")
+
+        if skipped_known:
+            Console.debug(f"⏭️ Skipped {skipped_known} known posts inside the page")
+
+        Console.success(
+            f"✅ Extracted {len(posts)} posts from {container_count} valid containers"
+        )
+        Console.info(
+            f"⏱️ Batch extraction took {elapsed_ms:.1f} ms ({container_count} containers, 1 round-trip)"
+        )
+        return posts
+
+    def _extract_posts_per_container(self) -> List[Dict[str, Any]]:
+        """Extract posts using advanced filtering, one evaluate per container"""
+        try:
+            started = time.perf_counter()
             # Filter elements based on containers
             selector = '[data-mcomponent="MContainer"]'
             container_elements = self.page.query_selector_all(selector)
@@ -805,6 +1505,7 @@ class CDPFacebookScraper:
 
             posts = []
             processed_containers = set()
+            extract_container_js = self._get_script("extract_container_post_data.js")
 
             for i, container in enumerate(container_elements):
                 try:
@@ -815,9 +1516,6 @@ class CDPFacebookScraper:
                     processed_containers.add(container_id)
 
                     # Extract post data from this specific container
-                    extract_container_js = read_js_script(
-                        "extract_container_post_data.js"
-                    )
                     post_data = container.evaluate(extract_container_js, i)
 
                     if post_data and post_data.get("text"):
@@ -829,9 +1527,13 @@ class CDPFacebookScraper:
                 except Exception as error:
                     Console.warning(f"⚠️ Error processing container {i}: {error}")
 
+            elapsed_ms = (time.perf_counter() - started) * 1000
             Console.success(
                 f"✅ Extracted {len(posts)} posts from {len(container_elements)} valid containers"
             )
+            Console.info(
+                f"⏱️ Per-container extraction took {elapsed_ms:.1f} ms ({len(container_elements)} containers)"
+            )
             return posts
 
         except Exception as error:
@@ -840,86 +1542,35 @@ class CDPFacebookScraper:
 
     def _is_noise_content(self, text: str) -> bool:
         """Check if text is noise/UI content"""
-        if not text or not isinstance(text, str):
-            return True
-
-        clean_text = text.strip()
-
-        # Check length - too short is likely noise
-        if len(clean_text) < 10:
-            return True
-
-        # Check against noise patterns
-        for pattern in self.noise_patterns:
-            if pattern.search(clean_text):
-                return True
-
-        return False
+        return self.noise_classifier.is_noise(text)
 
     def _is_real_post_content(self, text: str) -> bool:
         """Check if text is real post content"""
-        if not text or not isinstance(text, str):
-            return False
-
-        clean_text = text.strip()
-
-        # Must be at least 15 characters
-        if len(clean_text) < 15:
-            return False
-
-        # Check if it contains meaningful content patterns
-        for pattern in self.post_content_patterns:
-            if pattern.search(clean_text):
-                return True
-
-        # If no pattern matches, it's not real content
-        return False
+        return self.noise_classifier.is_real(text)
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text"""
-        if not text:
-            return ""
-
-        # Normalize whitespace and remove zero-width characters
-        cleaned = re.sub(r"\s+", " ", text.strip())
-        cleaned = re.sub(r"[\u200B-\u200D\uFEFF]", "", cleaned)
-        cleaned = re.sub(r"[^\S\r\n]+", " ", cleaned)
-
-        return cleaned.strip()
+        return self.noise_classifier.normalize(text)
 
     def _calculate_confidence(self, text: str) -> float:
         """Calculate confidence score for text content"""
-        confidence = 0.0
-
-        # Length bonus
-        if len(text) > 50:
-            confidence += 0.3
-        if len(text) > 100:
-            confidence += 0.2
-
-        # Sentence structure bonus
-        if any(char in text for char in ".!?"):
-            confidence += 0.2
-
-        # Multiple sentences bonus
-        sentences = [s.strip() for s in re.split(r"[.!?]+", text) if len(s.strip()) > 5]
-        if len(sentences) > 1:
-            confidence += 0.2
-
-        # Pattern matching bonus
-        for pattern in self.post_content_patterns:
-            if pattern.search(text):
-                confidence += 0.1
-                break  # Only add bonus once
+        return self.noise_classifier.confidence(text)
 
-        return min(confidence, 1.0)  # Cap at 1.0
+    def _extract_posts_with_advanced_cleaning(
+        self,
+        raw_posts: Optional[List[Dict[str, Any]]] = None,
+        analyze: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Extract posts with advanced cleaning and filtering
 
-    def _extract_posts_with_advanced_cleaning(self) -> List[Dict[str, Any]]:
-        """Extract posts with advanced cleaning and filtering"""
+        Uses already collected raw posts when given, otherwise scans the DOM.
+        With analyze=False posts stay marked needs_analysis for a later stage.
+        """
         try:
             Console.debug("🧹 Starting advanced post extraction with cleaning...")
 
-            raw_posts = self._extract_posts_advanced()
+            if raw_posts is None:
+                raw_posts = self._extract_posts_advanced()
             Console.info(f"📝 Extracted {len(raw_posts)} raw posts")
 
             if not raw_posts:
@@ -927,133 +1578,254 @@ class CDPFacebookScraper:
                 return []
 
             # Clean posts with advanced filtering
-            cleaned_posts = []
-            duplicate_tracker = set()
+            candidates = self._prefilter_raw_posts(raw_posts)
 
-            for i, post in enumerate(raw_posts):
-                original_text = post.get("text", "")
+            # Resolve every author-less post in a single page call
+            self._resolve_missing_authors(candidates)
 
-                # Skip if it's noise content
-                if self._is_noise_content(original_text):
-                    Console.debug(f'⏭️  Skipped noise: "{original_text[:50]}..."')
-                    continue
+            cleaned_posts = self._build_clean_posts(candidates)
 
-                # Check if it's real post content
-                if not self._is_real_post_content(original_text):
-                    Console.debug(f'⏭️  Skipped non-content: "{original_text[:50]}..."')
-                    continue
+            # Batch AI analysis for all posts
+            if analyze and self.ai and cleaned_posts:
+                Console.log("🤖 Starting batch AI sentiment analysis...")
+                self._batch_analyze_sentiment(cleaned_posts)
 
-                # Clean the text
-                clean_text = self._clean_text(original_text)
+            self.cleaned_posts = cleaned_posts
+            Console.success(
+                f"\n🎉 Advanced cleaning complete! Found {len(cleaned_posts)} clean posts out of {len(raw_posts)} raw posts."
+            )
 
-                # Simple duplicate detection based on clean text
-                if clean_text.lower() in duplicate_tracker:
-                    Console.debug(f'⏭️  Skipped duplicate: "{clean_text[:50]}..."')
-                    continue
-                duplicate_tracker.add(clean_text.lower())
-
-                # Enhanced author extraction
-                enhanced_author = post.get("author", "")
-                if not enhanced_author or len(enhanced_author) < 2:
-                    try:
-                        enhanced_author = self._extract_author_for_post(clean_text)
-                    except Exception as error:
-                        Console.warning(
-                            f"⚠️  Could not enhance author for post: {error}"
-                        )
+            return cleaned_posts
 
-                # Skip post if no author found
-                if not enhanced_author or not enhanced_author.strip():
-                    Console.debug(f'⏭️  Skipped no author: "{clean_text[:50]}..."')
+        except Exception as error:
+            Console.error(f"❌ Error in advanced post extraction: {error}")
+            return []
+
+    def _prefilter_raw_posts(
+        self, raw_posts: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Drop noise, non-content and duplicate raw posts, return clean candidates"""
+        candidates = []
+        duplicate_tracker = set()
+        # Near-duplicates inside this batch, ids map to candidates
+        batch_index = (
+            NearDuplicateIndex(Env.NEAR_DUP_THRESHOLD)
+            if Env.NEAR_DUP_THRESHOLD > 0
+            else None
+        )
+        indexed_candidates: Dict[int, Dict[str, Any]] = {}
+
+        # Classify every raw text in one pass (noise, content, clean text, confidence)
+        texts = [post.get("text", "") for post in raw_posts]
+        verdicts = self.noise_classifier.classify_batch(texts)
+
+        for i, (post, original_text, verdict) in enumerate(
+            zip(raw_posts, texts, verdicts)
+        ):
+            # Skip if it's noise content
+            if verdict["noise"]:
+                Console.debug(f'⏭️  Skipped noise: "{original_text[:50]}..."')
+                continue
+
+            # Check if it's real post content
+            if not verdict["real"]:
+                Console.debug(f'⏭️  Skipped non-content: "{original_text[:50]}..."')
+                continue
+
+            clean_text = verdict["text"]
+
+            # Simple duplicate detection based on clean text
+            if clean_text.lower() in duplicate_tracker:
+                Console.debug(f'⏭️  Skipped duplicate: "{clean_text[:50]}..."')
+                continue
+            duplicate_tracker.add(clean_text.lower())
+
+            if batch_index is not None:
+                match, item_id = batch_index.check_and_add(clean_text)
+                if match is not None:
+                    self._merge_near_duplicate(
+                        batch_index, match, indexed_candidates[match], clean_text, verdict
+                    )
                     continue
 
-                # Filter out unwanted selectors from being saved
-                clean_selector = post.get("selector", "")
-                unwanted_selectors = [
-                    'div[data-mcomponent="MContainer"] [data-mcomponent="TextArea"] div[dir="auto"]'
-                ]
+            candidate = {
+                "post": post,
+                "index": i,
+                "text": clean_text,
+                "author": post.get("author", ""),
+                "confidence": verdict["confidence"],
+            }
+            candidates.append(candidate)
+            if batch_index is not None:
+                indexed_candidates[item_id] = candidate
 
-                if any(selector in clean_selector for selector in unwanted_selectors):
-                    clean_selector = ""  # Don't save unwanted selectors
-
-                # Create cleaned post object with AI analysis
-                cleaned_post = {
-                    "id": f"clean_post_{len(cleaned_posts) + 1}",
-                    "originalId": post.get("id"),
-                    "text": clean_text,
-                    "author": enhanced_author,
-                    "timestamp": post.get("timestamp") or datetime.now().isoformat(),
-                    "confidence": self._calculate_confidence(clean_text),
-                    "originalIndex": i,
-                }
+        return candidates
 
-                # Add AI sentiment analysis
-                Console.debug(
-                    f"🤖 AI available: {self.ai is not None}, Text length: {len(clean_text)}"
-                )
-                if self.ai and len(clean_text) > 20:
-                    try:
-                        # Store text for batch analysis later
-                        cleaned_post["needs_analysis"] = True
-                        Console.debug(
-                            f"🤖 Marked post for analysis: {clean_text[:50]}..."
-                        )
-                    except Exception as e:
-                        Console.warning(f"⚠️ Failed to mark for AI analysis: {e}")
-                        cleaned_post.update(
-                            {
-                                "status": "unknown",
-                                "sentiment_score": 0.0,
-                                "emotion": "neutral",
-                                "key_topics": [],
-                            }
-                        )
-                else:
-                    # Add default sentiment for posts not marked for analysis
+    def _merge_near_duplicate(
+        self,
+        index: NearDuplicateIndex,
+        item_id: int,
+        kept: Dict[str, Any],
+        clean_text: str,
+        verdict: Dict[str, Any],
+    ) -> None:
+        """Fold a near-duplicate into the kept candidate, the longer text wins"""
+        self.near_duplicates_merged += 1
+        Console.debug(f'⏭️  Merged near-duplicate: "{clean_text[:50]}..."')
+        # A truncated "See more" copy may have been kept first
+        if len(clean_text) > len(kept["text"]):
+            kept["text"] = clean_text
+            kept["confidence"] = verdict["confidence"]
+            index.replace(item_id, clean_text)
+
+    def _resolve_missing_authors(self, candidates: List[Dict[str, Any]]) -> None:
+        """Fill in authors for candidates without one using the page author index"""
+        missing = self._candidates_without_author(candidates)
+        if not missing:
+            return
+
+        authors = self._extract_authors_bulk([c["text"] for c in missing])
+        self._apply_authors(missing, authors)
+
+    def _candidates_without_author(
+        self, candidates: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Candidates whose container did not yield a usable author"""
+        return [c for c in candidates if not c["author"] or len(c["author"]) < 2]
+
+    def _apply_authors(
+        self, candidates: List[Dict[str, Any]], authors: List[str]
+    ) -> None:
+        """Set resolved authors on candidates, empty results are ignored"""
+        for candidate, author in zip(candidates, authors):
+            if author:
+                candidate["author"] = author
+
+    def _build_clean_posts(
+        self, candidates: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Turn filtered candidates into cleaned post objects marked for AI analysis"""
+        cleaned_posts = []
+
+        for candidate in candidates:
+            post = candidate["post"]
+            clean_text = candidate["text"]
+            enhanced_author = candidate["author"]
+
+            # Skip post if no author found
+            if not enhanced_author or not enhanced_author.strip():
+                Console.debug(f'⏭️  Skipped no author: "{clean_text[:50]}..."')
+                continue
+
+            # Filter out unwanted selectors from being saved
+            clean_selector = post.get("selector", "")
+            unwanted_selectors = [
+                'div[data-mcomponent="MContainer"] [data-mcomponent="TextArea"] div[dir="auto"]'
+            ]
+
+            if any(selector in clean_selector for selector in unwanted_selectors):
+                clean_selector = ""  # Don't save unwanted selectors
+
+            # Create cleaned post object with AI analysis
+            cleaned_post = {
+                "id": f"clean_post_{len(cleaned_posts) + 1}",
+                "originalId": post.get("id"),
+                "text": clean_text,
+                "author": enhanced_author,
+                "timestamp": post.get("timestamp") or datetime.now().isoformat(),
+                "confidence": candidate["confidence"],
+                "originalIndex": candidate["index"],
+            }
+
+            # Add AI sentiment analysis
+            Console.debug(
+                f"🤖 AI available: {self.ai is not None}, Text length: {len(clean_text)}"
+            )
+            if self.ai and len(clean_text) > 20:
+                try:
+                    # Store text for batch analysis later
+                    cleaned_post["needs_analysis"] = True
+                    Console.debug(f"🤖 Marked post for analysis: {clean_text[:50]}...")
+                except Exception as e:
+                    Console.warning(f"⚠️ Failed to mark for AI analysis: {e}")
                     cleaned_post.update(
                         {
-                            "status": "neutral",
+                            "status": "unknown",
                             "sentiment_score": 0.0,
                             "emotion": "neutral",
                             "key_topics": [],
                         }
                     )
-
-                cleaned_posts.append(cleaned_post)
-                Console.success(
-                    f'✅ Added clean post {len(cleaned_posts)}: "{clean_text[:60]}..." (Author: {enhanced_author or "N/A"}) [Confidence: {cleaned_post["confidence"]:.2f}]'
+            else:
+                # Add default sentiment for posts not marked for analysis
+                cleaned_post.update(
+                    {
+                        "status": "neutral",
+                        "sentiment_score": 0.0,
+                        "emotion": "neutral",
+                        "key_topics": [],
+                    }
                 )
 
-            # Batch AI analysis for all posts
-            if self.ai and cleaned_posts:
-                Console.log("🤖 Starting batch AI sentiment analysis...")
-                self._batch_analyze_sentiment(cleaned_posts)
-
-            self.cleaned_posts = cleaned_posts
+            cleaned_posts.append(cleaned_post)
             Console.success(
-                f"\n🎉 Advanced cleaning complete! Found {len(cleaned_posts)} clean posts out of {len(raw_posts)} raw posts."
+                f'✅ Added clean post {len(cleaned_posts)}: "{clean_text[:60]}..." (Author: {enhanced_author or "N/A"}) [Confidence: {cleaned_post["confidence"]:.2f}]'
             )
 
-            return cleaned_posts
+        self._apply_local_sentiment(cleaned_posts)
+        return cleaned_posts
 
-        except Exception as error:
-            Console.error(f"❌ Error in advanced post extraction: {error}")
-            return []
+    def _apply_local_sentiment(self, posts: List[Dict[str, Any]]) -> None:
+        """Fill sentiment for posts the lexicon is confident about"""
+        if not self.local_sentiment or not posts:
+            return
 
-    def _extract_author_for_post(self, post_text: str) -> str:
-        """Extract author for specific post text"""
+        results = self.local_sentiment.analyze_batch([post["text"] for post in posts])
+        handled = 0
+        for post, result in zip(posts, results):
+            confidence = result.pop("confidence")
+            if confidence < Env.LOCAL_SENTIMENT_MIN_CONFIDENCE:
+                continue
+            post.update(result)
+            post["sentiment_source"] = "lexicon"
+            post["sentiment_confidence"] = confidence
+            post.pop("needs_analysis", None)
+            handled += 1
+
+        remaining = sum(1 for post in posts if post.get("needs_analysis"))
+        Console.log(
+            f"⚡ Local sentiment handled {handled}/{len(posts)} posts, {remaining} left for AI"
+        )
+
+    def _extract_authors_bulk(self, post_texts: List[str]) -> List[str]:
+        """Resolve authors for many post texts with a single page.evaluate"""
+        if not post_texts:
+            return []
         try:
-            # Try to find author context for specific post text
-            extract_author_js = read_js_script("extract_author_for_post.js")
-            author_info = self.page.evaluate(extract_author_js, post_text[:100])
+            started = time.perf_counter()
+            authors = self.page.evaluate(
+                self._get_script("resolve_authors_bulk.js"),
+                [text[:100] for text in post_texts],
+            )
+            elapsed_ms = (time.perf_counter() - started) * 1000
 
-            if author_info and isinstance(author_info, str) and author_info.strip():
-                return author_info.strip()
-            return ""
+            resolved = [
+                author.strip() if isinstance(author, str) else ""
+                for author in (authors or [])
+            ]
+            resolved += [""] * (len(post_texts) - len(resolved))
+            Console.debug(
+                f"👤 Resolved {sum(1 for a in resolved if a)}/{len(post_texts)} authors in {elapsed_ms:.1f} ms"
+            )
+            return resolved
 
         except Exception as error:
-            Console.error(f"❌ Error extracting author for post: {error}")
-            return ""
+            Console.error(f"❌ Error extracting authors in bulk: {error}")
+            return [""] * len(post_texts)
+
+    def _extract_author_for_post(self, post_text: str) -> str:
+        """Extract author for specific post text"""
+        return self._extract_authors_bulk([post_text])[0]
 
     def _analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment using Z_AI with prompt from prompt.txt"""
@@ -1143,191 +1915,433 @@ class CDPFacebookScraper:
     def _batch_analyze_sentiment(self, posts: List[Dict[str, Any]]) -> None:
         """Batch analyze sentiment for all posts using chat_multi"""
         try:
-            # Debug: Check AI status
-            Console.debug(f"🤖 AI initialized: {self.ai is not None}")
-            Console.debug(f"🤖 Prompt loaded: {len(self.prompt) > 0}")
-            Console.debug(f"🤖 Total posts received: {len(posts)}")
+            posts_to_analyze = self._posts_needing_analysis(posts)
+            if not posts_to_analyze:
+                return
 
-            # Filter posts that need analysis
-            posts_to_analyze = [p for p in posts if p.get("needs_analysis", False)]
+            # Split so every chunk's answer fits in AI_MAX_TOKENS
+            chunks = self._chunk_posts_for_ai(posts_to_analyze)
+            workers = max(1, min(Env.AI_CONCURRENCY, len(chunks)))
+            Console.log(
+                f"🤖 Analyzing {len(posts_to_analyze)} posts in {len(chunks)} chunks ({workers} concurrent)..."
+            )
 
-            Console.debug(f"🤖 Posts that need analysis: {len(posts_to_analyze)}")
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="ai-chunk"
+            ) as executor:
+                chunk_analyses = list(
+                    executor.map(self._analyze_chunk, range(len(chunks)), chunks)
+                )
 
-            if not posts_to_analyze:
-                Console.debug("🤖 No posts need sentiment analysis")
-                return
+            self._apply_chunk_analyses(posts_to_analyze, chunks, chunk_analyses)
+            self._log_ai_transport_stats()
 
-            Console.log(f"🤖 Analyzing {len(posts_to_analyze)} posts in batch...")
+        except Exception as e:
+            Console.error(f"❌ Batch sentiment analysis failed: {e}")
+            self._mark_analysis_failed(posts)
 
-            # Prepare batch messages for chat_multi
-            messages = [
-                {
-                    "role": "system",
-                    "content": f"{self.prompt}\n\nI will send you multiple texts to analyze. For each text, respond with ONLY the JSON analysis, separated by '---SEPARATOR---'. Do not include explanations or markdown.",
-                }
-            ]
+    def _posts_needing_analysis(
+        self, posts: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Posts marked needs_analysis that the cache could not answer"""
+        # Debug: Check AI status
+        Console.debug(f"🤖 AI initialized: {self.ai is not None}")
+        Console.debug(f"🤖 Prompt loaded: {len(self.prompt) > 0}")
+        Console.debug(f"🤖 Total posts received: {len(posts)}")
 
-            # Add all texts as one user message
-            batch_text = ""
-            for i, post in enumerate(posts_to_analyze):
-                batch_text += f"TEXT {i+1}: {post['text']}\n---SEPARATOR---\n"
+        # Filter posts that need analysis
+        posts_to_analyze = [p for p in posts if p.get("needs_analysis", False)]
 
-            messages.append({"role": "user", "content": batch_text.strip()})
+        Console.debug(f"🤖 Posts that need analysis: {len(posts_to_analyze)}")
 
-            # Get batch analysis
-            response = self.ai.chat_multi(messages)
-            Console.debug(f"🤖 Batch AI Response: {response[:200]}...")
+        # Fill in analyses of texts seen before, only misses go to the API
+        posts_to_analyze = self._apply_cached_analyses(posts_to_analyze)
 
-            # Parse batch response
-            analyses = self._parse_batch_response(response, len(posts_to_analyze))
+        if not posts_to_analyze:
+            Console.debug("🤖 No posts need sentiment analysis")
+        return posts_to_analyze
 
-            # Apply analyses to posts
-            for i, post in enumerate(posts_to_analyze):
-                if i < len(analyses):
-                    analysis = analyses[i]
-                    post.update(analysis)
-                    post.pop("needs_analysis", None)  # Remove the flag
-                    Console.success(
-                        f"🤖 Post {i+1} analyzed: {analysis.get('status', 'unknown')} sentiment ({analysis.get('sentiment_score', 0):.2f})"
-                    )
-                else:
-                    # Fallback for missing analysis
-                    post.update(
-                        {
-                            "status": "neutral",
-                            "sentiment_score": 0.0,
-                            "emotion": "neutral",
-                            "key_topics": [],
-                        }
-                    )
-                    post.pop("needs_analysis", None)
+    def _apply_chunk_analyses(
+        self,
+        posts_to_analyze: List[Dict[str, Any]],
+        chunks: List[List[Dict[str, Any]]],
+        chunk_analyses: List[Optional[List[Optional[Dict[str, Any]]]]],
+    ) -> None:
+        """Merge chunk results back in post order and apply them to the posts"""
+        analyses: List[Optional[Dict[str, Any]]] = []
+        for chunk, chunk_result in zip(chunks, chunk_analyses):
+            if chunk_result is None:
+                # Whole chunk failed, mark its posts as errors
+                chunk_result = [
+                    dict(self._fallback_analysis(), status="error") for _ in chunk
+                ]
+            analyses.extend(chunk_result[: len(chunk)])
+            analyses.extend([None] * (len(chunk) - len(chunk_result)))
+
+        # Apply analyses to posts
+        for i, post in enumerate(posts_to_analyze):
+            if analyses[i] is not None:
+                analysis = analyses[i]
+                post.update(analysis)
+                post.pop("needs_analysis", None)  # Remove the flag
+                # Fallbacks and failed chunks are retried next time, not cached
+                if (
+                    self.ai_cache
+                    and analysis.get("status") != "error"
+                    and analysis != self._fallback_analysis()
+                ):
+                    self.ai_cache.put(post["text"], analysis)
+                Console.success(
+                    f"🤖 Post {i+1} analyzed: {analysis.get('status', 'unknown')} sentiment ({analysis.get('sentiment_score', 0):.2f})"
+                )
+            else:
+                # Fallback for missing analysis
+                post.update(
+                    {
+                        "status": "neutral",
+                        "sentiment_score": 0.0,
+                        "emotion": "neutral",
+                        "key_topics": [],
+                    }
+                )
+                post.pop("needs_analysis", None)
 
-            Console.success(
-                f"🤖 Batch sentiment analysis complete for {len(posts_to_analyze)} posts!"
-            )
+        Console.success(
+            f"🤖 Batch sentiment analysis complete for {len(posts_to_analyze)} posts!"
+        )
 
-            # Show summary of sentiment analysis
-            sentiment_summary = {}
-            for post in posts_to_analyze:
-                status = post.get("status", "unknown")
-                sentiment_summary[status] = sentiment_summary.get(status, 0) + 1
+        # Show summary of sentiment analysis
+        sentiment_summary = {}
+        for post in posts_to_analyze:
+            status = post.get("status", "unknown")
+            sentiment_summary[status] = sentiment_summary.get(status, 0) + 1
+
+        Console.log(f"📊 Sentiment Summary: {dict(sentiment_summary)}")
+
+    def _save_ai_cache(self) -> None:
+        """Queue one AI cache save, a save still waiting in the writer is replaced"""
+        if not self.ai_cache:
+            return
+        self.writer.submit(
+            self.ai_cache.save,
+            key="ai_cache",
+            paths=[self.ai_cache.path] if self.ai_cache.path else [],
+        )
 
-            Console.log(f"📊 Sentiment Summary: {dict(sentiment_summary)}")
+    def _mark_analysis_failed(self, posts: List[Dict[str, Any]]) -> None:
+        """Fallback: apply default analysis to all posts still waiting for one"""
+        for post in posts:
+            if post.get("needs_analysis", False):
+                post.update(
+                    {
+                        "status": "error",
+                        "sentiment_score": 0.0,
+                        "emotion": "neutral",
+                        "key_topics": [],
+                    }
+                )
+                post.pop("needs_analysis", None)
+
+    def _log_ai_transport_stats(self):
+        """Log AI HTTP transport counters"""
+        stats = self.ai.stats()
+        Console.debug(
+            f"🌐 AI transport: {stats['requests']} requests, avg {stats['latencyAvg']}s (max {stats['latencyMax']}s), "
+            f"{stats['retries']} retries, {stats['rejected']} rejected, circuit {stats['circuit']}, "
+            f"rate limited {stats['rateLimitedSeconds']}s"
+        )
 
-        except Exception as e:
-            Console.error(f"❌ Batch sentiment analysis failed: {e}")
-            # Fallback: apply default analysis to all posts
-            for post in posts:
-                if post.get("needs_analysis", False):
-                    post.update(
-                        {
-                            "status": "error",
-                            "sentiment_score": 0.0,
-                            "emotion": "neutral",
-                            "key_topics": [],
-                        }
-                    )
-                    post.pop("needs_analysis", None)
+    def _estimate_tokens(self, text: str) -> int:
+        """Rough token count (about 4 characters per token)"""
+        return len(text) // 4 + 1
 
-    def _parse_batch_response(
-        self, response: str, expected_count: int
-    ) -> List[Dict[str, Any]]:
-        """Parse batch response into individual analyses"""
-        analyses = []
+    def _chunk_posts_for_ai(
+        self, posts: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Split posts into chunks bounded by estimated input and output tokens"""
+        max_posts = max(1, Env.AI_MAX_TOKENS // Env.AI_OUTPUT_TOKENS_PER_POST)
+        input_budget = Env.AI_CHUNK_INPUT_TOKENS - self._estimate_tokens(self.prompt)
+
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+        for post in posts:
+            # Text plus its "TEXT n:" label and separator
+            tokens = self._estimate_tokens(post["text"]) + 8
+            if current and (
+                len(current) >= max_posts or current_tokens + tokens > input_budget
+            ):
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(post)
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+
+    def _analyze_chunk(
+        self, chunk_index: int, posts: List[Dict[str, Any]]
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """
+        Send one chunk to chat_multi, return analyses aligned with posts
+        (None for items still missing) or None when the chunk failed.
+        Missing or unparseable IDs are re-sent in a smaller follow-up request.
+        """
+        items = {str(i + 1): post for i, post in enumerate(posts)}
+        pending = dict(items)
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for attempt in range(1 + Env.AI_MISSING_RETRIES):
+            if not pending:
+                break
+            if attempt:
+                Console.warning(
+                    f"🔁 Re-requesting {len(pending)} missing analyses of chunk {chunk_index + 1}: {', '.join(pending)}"
+                )
+
+            response = self._request_chunk_analyses(chunk_index, pending)
+            if response is None:
+                if attempt == 0:
+                    return None
+                break
+
+            analyses = self._parse_batch_response(response, list(pending))
+            results.update(analyses)
+            pending = {item_id: post for item_id, post in pending.items() if item_id not in analyses}
+
+        return [results.get(item_id) for item_id in items]
+
+    def _build_chunk_messages(
+        self, items: Dict[str, Dict[str, Any]]
+    ) -> List[Dict[str, str]]:
+        """chat_multi messages for ID-keyed items"""
+        # Prepare batch messages for chat_multi
+        messages = [
+            {
+                "role": "system",
+                "content": f"{self.prompt}\n\nI will send you a JSON array of items, each with an \"id\" and a \"text\". Respond with ONLY a JSON array holding one JSON analysis per item, each including the item's \"id\". Do not include explanations or markdown.",
+            }
+        ]
+
+        # Add all items of the chunk as one user message
+        payload = [{"id": item_id, "text": post["text"]} for item_id, post in items.items()]
+        messages.append({"role": "user", "content": json.dumps(payload, ensure_ascii=False)})
+        return messages
+
+    def _request_chunk_analyses(
+        self, chunk_index: int, items: Dict[str, Dict[str, Any]]
+    ) -> Optional[str]:
+        """One chat_multi call for ID-keyed items, returns the raw response or None"""
+        messages = self._build_chunk_messages(items)
+
+        started = time.perf_counter()
+        on_object = None
+        if Env.AI_STREAM:
+            # Hand out each analysis as soon as its JSON object has streamed in
+            def on_object(item: Dict[str, Any]) -> None:
+                self._on_streamed_analysis(chunk_index, items, item, started)
 
         try:
-            # Split by separator
-            parts = response.split("---SEPARATOR---")
+            response, usage = self.ai.chat_multi(
+                messages, with_usage=True, on_object=on_object
+            )
+        except Exception as e:
+            Console.error(f"❌ AI chunk {chunk_index + 1} failed: {e}")
+            return None
+        return self._check_chunk_response(
+            chunk_index, items, response, usage, time.perf_counter() - started
+        )
 
-            for i, part in enumerate(parts):
-                if i >= expected_count:
-                    break
+    def _check_chunk_response(
+        self,
+        chunk_index: int,
+        items: Dict[str, Dict[str, Any]],
+        response: str,
+        usage: Dict[str, Any],
+        elapsed: float,
+    ) -> Optional[str]:
+        """Log latency and token usage of a chunk call, None when it failed"""
+        Console.debug(
+            f"🤖 Chunk {chunk_index + 1}: {len(items)} posts in {elapsed:.2f}s, "
+            f"tokens prompt={usage.get('prompt_tokens', '?')} completion={usage.get('completion_tokens', '?')} "
+            f"(estimated input {sum(self._estimate_tokens(p['text']) for p in items.values())})"
+        )
+        if response.startswith("[ERROR]"):
+            Console.error(f"❌ AI chunk {chunk_index + 1} failed: {response}")
+            return None
 
-                part = part.strip()
-                if not part:
-                    continue
+        Console.debug(f"🤖 Batch AI Response: {response[:200]}...")
+        return response
 
-                try:
-                    # Extract JSON from each part
-                    if "```json" in part:
-                        start_idx = part.find("```json") + 7
-                        end_idx = part.find("```", start_idx)
-                        if end_idx != -1:
-                            json_str = part[start_idx:end_idx].strip()
-                        else:
-                            json_str = part[start_idx:].strip()
-                    else:
-                        json_str = (
-                            part.replace("```json", "").replace("```", "").strip()
-                        )
+    def _apply_cached_analyses(
+        self, posts: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Apply cached analyses, return the posts that still need the API"""
+        if not self.ai_cache:
+            return posts
 
-                    analysis = json.loads(json_str)
+        misses = []
+        for post in posts:
+            analysis = self.ai_cache.get(post["text"])
+            if analysis is None:
+                misses.append(post)
+                continue
+            post.update(analysis)
+            post.pop("needs_analysis", None)
 
-                    # Validate required fields and exclude summary
-                    required_fields = [
-                        "status",
-                        "sentiment_score",
-                        "emotion",
-                        "key_topics",
-                    ]
-                    for field in required_fields:
-                        if field not in analysis:
-                            analysis[field] = self._get_default_value(field)
+        stats = self.ai_cache.stats()
+        Console.debug(
+            f"🗃️ AI cache: {len(posts) - len(misses)} hits, {len(misses)} misses this batch "
+            f"(total hit rate {stats['hitRate']:.0%}, {stats['entries']} entries)"
+        )
+        return misses
 
-                    # Remove summary field if exists
-                    analysis.pop("summary", None)
+    def _fallback_analysis(self) -> Dict[str, Any]:
+        """Default analysis used when an AI answer could not be parsed"""
+        return {
+            "status": "neutral",
+            "sentiment_score": 0.0,
+            "emotion": "neutral",
+            "key_topics": [],
+        }
 
-                    analyses.append(analysis)
+    def _parse_batch_response(
+        self, response: str, expected_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Parse a JSON array / JSON lines batch response into analyses keyed by item ID"""
+        analyses: Dict[str, Dict[str, Any]] = {}
+        expected = set(expected_ids)
 
-                except (json.JSONDecodeError, Exception) as e:
-                    Console.warning(f"⚠️ Failed to parse analysis {i+1}: {e}")
-                    # Add default analysis
-                    analyses.append(
-                        {
-                            "status": "neutral",
-                            "sentiment_score": 0.0,
-                            "emotion": "neutral",
-                            "key_topics": [],
-                        }
-                    )
+        try:
+            for item in self._iter_json_objects(response):
+                item_id = str(item.get("id", ""))
+                if item_id not in expected or item_id in analyses:
+                    continue
+
+                analyses[item_id] = self._normalize_analysis(item)
 
         except Exception as e:
             Console.error(f"❌ Failed to parse batch response: {e}")
 
+        missing = [item_id for item_id in expected_ids if item_id not in analyses]
+        if missing:
+            Console.warning(f"⚠️ No parseable analysis for items: {', '.join(missing)}")
+
         return analyses
 
+    def _on_streamed_analysis(
+        self,
+        chunk_index: int,
+        items: Dict[str, Dict[str, Any]],
+        item: Dict[str, Any],
+        started: float,
+    ) -> None:
+        """Pass one streamed analysis to on_post_analyzed before the chunk finishes"""
+        post = items.get(str(item.get("id", "")))
+        if post is None:
+            return
+        Console.debug(
+            f"📡 Chunk {chunk_index + 1} item {item.get('id')} streamed after {time.perf_counter() - started:.2f}s"
+        )
+        if self.on_post_analyzed:
+            try:
+                self.on_post_analyzed(post, self._normalize_analysis(item))
+            except Exception as e:
+                Console.warning(f"⚠️ on_post_analyzed callback failed: {e}")
+
+    def _normalize_analysis(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Analysis fields of an ID-keyed answer item"""
+        analysis = {key: value for key, value in item.items() if key != "id"}
+
+        # Validate required fields and exclude summary
+        required_fields = [
+            "status",
+            "sentiment_score",
+            "emotion",
+            "key_topics",
+        ]
+        for field in required_fields:
+            if field not in analysis:
+                analysis[field] = self._get_default_value(field)
+
+        # Remove summary field if exists
+        analysis.pop("summary", None)
+
+        return analysis
+
+    def _iter_json_objects(self, response: str):
+        """
+        Yield JSON objects from a response: a JSON array, an object wrapping
+        one, or JSON lines / loose objects (complete ones before a truncation)
+        """
+        text = response.strip()
+        # Extract JSON from markdown code blocks
+        if "```" in text:
+            text = re.search(r"```(?:json)?\s*(.*?)(?:```|$)", text, re.DOTALL).group(1).strip()
+
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            data = None
+
+        if isinstance(data, dict):
+            # A bare analysis (one-item re-request) carries its own id,
+            # otherwise unwrap the first list of objects, e.g. {"results": [...]}
+            if "id" in data:
+                data = [data]
+            else:
+                data = next(
+                    (
+                        value
+                        for value in data.values()
+                        if isinstance(value, list)
+                        and any(isinstance(item, dict) for item in value)
+                    ),
+                    [data],
+                )
+        if isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    yield item
+            return
+
+        # Not valid JSON as a whole, decode every top-level object separately
+        decoder = json.JSONDecoder()
+        position = text.find("{")
+        while position != -1:
+            try:
+                item, end = decoder.raw_decode(text, position)
+            except json.JSONDecodeError:
+                position = text.find("{", position + 1)
+                continue
+            if isinstance(item, dict):
+                yield item
+            position = text.find("{", end)
+
     def _calculate_cleaning_stats(
-        self, cleaned_posts: List[Dict[str, Any]]
+        self,
+        cleaned_posts: List[Dict[str, Any]],
+        running: Optional[RunningStats] = None,
     ) -> Dict[str, Any]:
-        """Calculate cleaning statistics"""
-        total_cleaned = len(cleaned_posts)
-
-        quality_distribution = {
-            "highConfidence": len(
-                [p for p in cleaned_posts if p.get("confidence", 0) >= 0.8]
-            ),
-            "mediumConfidence": len(
-                [p for p in cleaned_posts if 0.5 <= p.get("confidence", 0) < 0.8]
-            ),
-            "lowConfidence": len(
-                [p for p in cleaned_posts if p.get("confidence", 0) < 0.5]
-            ),
-        }
+        """Calculate cleaning statistics
+
+        Pass the accumulator already fed with cleaned_posts (self.running_stats
+        for all_scraped_posts) to build the report without walking the posts.
+        """
+        if running is None:
+            running = RunningStats.from_posts(cleaned_posts)
+        total_cleaned = running.total
+        local_posts = running.local_posts
 
-        top_posts = sorted(
-            cleaned_posts, key=lambda x: x.get("confidence", 0), reverse=True
-        )[:10]
         top_posts_formatted = []
-        for i, post in enumerate(top_posts):
-            text = post.get("text", "")
-            truncated_text = text[:100] + ("..." if len(text) > 100 else "")
+        for i, post in enumerate(running.top_posts()):
             top_posts_formatted.append(
                 {
                     "rank": i + 1,
-                    "confidence": f"{post.get('confidence', 0):.2f}",
-                    "text": truncated_text,
-                    "author": post.get("author", ""),
-                    "timestamp": post.get("timestamp") or datetime.now().isoformat(),
+                    "confidence": f"{post['confidence']:.2f}",
+                    "text": post["text"],
+                    "author": post["author"],
+                    "timestamp": post["timestamp"] or datetime.now().isoformat(),
                 }
             )
 
@@ -1336,38 +2350,17 @@ class CDPFacebookScraper:
                 "cleanedPosts": total_cleaned,
                 "processingDate": datetime.now().isoformat(),
                 "method": "CDP Session (Mobile) + Advanced Cleaning",
+                "nearDuplicatesMerged": self.near_duplicates_merged,
+                "aiCache": self.ai_cache.stats() if self.ai_cache else None,
+                "localSentiment": {
+                    "posts": local_posts,
+                    "share": round(local_posts / total_cleaned, 3) if total_cleaned else 0.0,
+                },
             },
             "topPosts": top_posts_formatted,
-            "qualityDistribution": quality_distribution,
-            "authorStats": self._calculate_author_stats(cleaned_posts),
-        }
-
-    def _calculate_author_stats(self, posts: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate author statistics"""
-        author_counts = {}
-        posts_with_author = 0
-
-        for post in posts:
-            author = post.get("author", "")
-            if author and author.strip():
-                posts_with_author += 1
-                author_counts[author] = author_counts.get(author, 0) + 1
-
-        top_authors = sorted(author_counts.items(), key=lambda x: x[1], reverse=True)[
-            :10
-        ]
-        top_authors_formatted = [
-            {"author": author, "postCount": count} for author, count in top_authors
-        ]
-
-        return {
-            "totalAuthors": len(author_counts),
-            "postsWithAuthor": posts_with_author,
-            "postsWithoutAuthor": len(posts) - posts_with_author,
-            "authorCoverage": (
-                f"{(posts_with_author / len(posts) * 100):.1f}%" if posts else "0.0%"
-            ),
-            "topAuthors": top_authors_formatted,
+            "qualityDistribution": dict(running.quality),
+            "sentimentDistribution": dict(running.sentiment),
+            "authorStats": running.author_stats(),
         }
 
     def save_posts(
@@ -1380,19 +2373,89 @@ class CDPFacebookScraper:
             # Create output directory if not exists
             os.makedirs("output", exist_ok=True)
 
-            stats = self._calculate_cleaning_stats(posts)
+            # all_scraped_posts already has an up-to-date accumulator
+            running = self.running_stats if posts is self._all_posts else None
+            stats = self._calculate_cleaning_stats(posts, running)
             source = (
                 Env.TARGET_PROFILE_URL
                 if hasattr(Env, "TARGET_PROFILE_URL")
                 else "https://m.facebook.com/me"
             )
-            save_to_file(posts, stats, filename, source)
-            Console.success(f"💾 Saved {len(posts)} posts to {filename}")
+            self.writer.submit(
+                save_to_file,
+                [dict(post) for post in posts],
+                stats,
+                filename,
+                source,
+                key=filename,
+                paths=saved_file_paths(filename),
+            )
+            self._save_to_sqlite(posts)
+            self._save_ai_cache()
+            Console.success(f"💾 Queued {len(posts)} posts for {filename}")
         except Exception as error:
             Console.error(f"❌ Error in save_posts: {error}")
 
+    def _save_to_sqlite(
+        self, posts: List[Dict[str, Any]], loop_number: Optional[int] = None
+    ) -> None:
+        """Upsert posts into the SQLite store (one transaction), when enabled"""
+        if not self.sqlite_store or not posts:
+            return
+        try:
+            written = self.sqlite_store.upsert_posts(
+                posts, self._create_post_hash, loop_number
+            )
+            Console.debug(f"🗄️ Upserted {written} posts into {Env.SQLITE_PATH}")
+        except Exception as error:
+            Console.error(f"❌ Error saving posts to SQLite: {error}")
+
+    def export_cumulative(self, filename: Optional[str] = None) -> int:
+        """Write the monolithic cumulative JSON and report from the append-only store
+
+        The cumulative CSV is left alone, it is append-only and owned by the loop.
+        """
+        filename = filename or self.CUMULATIVE_JSON
+        posts = self._latest_records(read_jsonl(self.CUMULATIVE_JSONL))
+        if not posts:
+            Console.warning(f"⚠️ No posts in {self.CUMULATIVE_JSONL}")
+            return 0
+
+        source = (
+            Env.TARGET_PROFILE_URL
+            if hasattr(Env, "TARGET_PROFILE_URL")
+            else "https://m.facebook.com/me"
+        )
+        stats = self._calculate_cleaning_stats(posts)
+        json_filename, _, report_filename = saved_file_paths(filename)
+        try:
+            save_json_snapshot(posts, stats, json_filename, source)
+            save_cleaning_report(stats, report_filename)
+        except Exception as error:
+            Console.error(f"❌ Error exporting cumulative posts: {error}")
+            return 0
+        Console.success(f"💾 Exported {len(posts)} cumulative posts to {filename}")
+        return len(posts)
+
+    def _close_writer(self):
+        """Flush queued saves and log write counters"""
+        self._save_ai_cache()
+        self.writer.close()
+        stats = self.writer.stats()
+        Console.debug(
+            f"💾 Writer: {stats['written']} writes ({stats['coalesced']} coalesced, {stats['failed']} failed), "
+            f"{stats['bytesWritten'] / 1024:.1f} KB, avg {stats['latencyAvg']}s (max {stats['latencyMax']}s)"
+        )
+
     def close(self):
         """Close browser and cleanup"""
+        self._close_pipeline()
+        if self.loop_count:
+            self._save_checkpoint()
+        self._close_writer()
+        self.scraped_post_hashes.close()
+        if self.sqlite_store:
+            self.sqlite_store.close()
         if self.browser:
             try:
                 self.browser.close()
@@ -13,8 +13,38 @@ class Env:
     SLOW_MO_MS: int = int(os.getenv("SLOW_MO_MS", "1000"))
     MAX_POSTS_TO_SCRAPE: int = int(os.getenv("MAX_POSTS_TO_SCRAPE", "50"))
     SCRAPE_DELAY_MS: int = int(os.getenv("SCRAPE_DELAY_MS", "2000"))
+    # Scroll wait ends early once the network has been quiet this long (ms)
+    SCROLL_QUIET_MS: int = int(os.getenv("SCROLL_QUIET_MS", "800"))
     LOOP_INTERVAL: int = int(os.getenv("LOOP_INTERVAL", "30"))
     LOOP_TYPE: str = os.getenv("LOOP_TYPE", "continuous")
+    # "sync" runs CDPFacebookScraper, "async" runs AsyncCDPFacebookScraper
+    ENGINE: str = os.getenv("ENGINE", "sync").lower()
+    # Continuous mode: run analysis and saving on worker threads behind bounded queues
+    PIPELINE_ENABLED: bool = str(os.getenv("PIPELINE_ENABLED", "false")).lower() == "true"
+    PIPELINE_QUEUE_SIZE: int = int(os.getenv("PIPELINE_QUEUE_SIZE", "4"))
+    # "batch" walks all containers in one evaluate, "legacy" uses one evaluate per container
+    EXTRACT_MODE: str = os.getenv("EXTRACT_MODE", "batch").lower()
+    # "incremental" harvests posts with an in-page MutationObserver while scrolling, "scan" rescans the DOM afterwards
+    COLLECT_MODE: str = os.getenv("COLLECT_MODE", "scan").lower()
+    COLLECT_DRAIN_BATCH: int = int(os.getenv("COLLECT_DRAIN_BATCH", "200"))
+    COLLECT_MAX_BUFFER: int = int(os.getenv("COLLECT_MAX_BUFFER", "5000"))
+    # Skip already scraped posts inside the page before they are serialized
+    PAGE_KNOWN_FILTER: bool = str(os.getenv("PAGE_KNOWN_FILTER", "true")).lower() == "true"
+    KNOWN_KEYS_LIMIT: int = int(os.getenv("KNOWN_KEYS_LIMIT", "5000"))
+    # Reload the feed every loop and stop scrolling after a run of already seen posts
+    REFRESH_UNTIL_KNOWN: bool = str(os.getenv("REFRESH_UNTIL_KNOWN", "false")).lower() == "true"
+    KNOWN_STOP_RUN: int = int(os.getenv("KNOWN_STOP_RUN", "5"))
+    # Estimated similarity at which two posts count as the same post, 0 disables near-duplicate merging
+    NEAR_DUP_THRESHOLD: float = float(os.getenv("NEAR_DUP_THRESHOLD", "0.8"))
+    # Fingerprints of saved posts, kept across restarts ("" keeps them in memory only)
+    DEDUP_STORE_PATH: str = os.getenv("DEDUP_STORE_PATH", "output/seen_posts.bin")
+    # Write output files on a background thread instead of the scraping thread
+    BACKGROUND_WRITER: bool = str(os.getenv("BACKGROUND_WRITER", "true")).lower() == "true"
+    # Checkpoint written each loop, continuous mode resumes from it on startup ("" disables)
+    CHECKPOINT_PATH: str = os.getenv("CHECKPOINT_PATH", "output/checkpoint.json")
+    RESUME: bool = str(os.getenv("RESUME", "true")).lower() == "true"
+    # Optional SQLite database for posts, dedup hashes and AI cache ("" disables it)
+    SQLITE_PATH: str = os.getenv("SQLITE_PATH", "")
 
     # Logging configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG").upper()
@@ -25,3 +55,28 @@ class Env:
     AI_MODEL: str = os.getenv("AI_MODEL")
     AI_TEMPERATURE: float = float(os.getenv("AI_TEMPERATURE", "0.6"))
     AI_MAX_TOKENS: int = int(os.getenv("AI_MAX_TOKENS", "1024"))
+    # Score sentiment locally with a lexicon, only posts below this confidence go to the AI
+    LOCAL_SENTIMENT: bool = str(os.getenv("LOCAL_SENTIMENT", "true")).lower() == "true"
+    LOCAL_SENTIMENT_MIN_CONFIDENCE: float = float(os.getenv("LOCAL_SENTIMENT_MIN_CONFIDENCE", "0.75"))
+    # Batch analysis is split into chunks whose answers fit in AI_MAX_TOKENS
+    AI_OUTPUT_TOKENS_PER_POST: int = int(os.getenv("AI_OUTPUT_TOKENS_PER_POST", "96"))
+    AI_CHUNK_INPUT_TOKENS: int = int(os.getenv("AI_CHUNK_INPUT_TOKENS", "3000"))
+    AI_CONCURRENCY: int = int(os.getenv("AI_CONCURRENCY", "3"))
+    # Follow-up requests for items missing from a batch answer
+    AI_MISSING_RETRIES: int = int(os.getenv("AI_MISSING_RETRIES", "1"))
+    # Stream batch answers (SSE) and hand out each analysis as soon as it is complete
+    AI_STREAM: bool = str(os.getenv("AI_STREAM", "false")).lower() == "true"
+    # HTTP transport: timeouts (s), retries with backoff, rate limit (requests/s, 0 = off), circuit breaker
+    AI_CONNECT_TIMEOUT: float = float(os.getenv("AI_CONNECT_TIMEOUT", "10"))
+    AI_READ_TIMEOUT: float = float(os.getenv("AI_READ_TIMEOUT", "120"))
+    AI_MAX_RETRIES: int = int(os.getenv("AI_MAX_RETRIES", "3"))
+    AI_BACKOFF_BASE: float = float(os.getenv("AI_BACKOFF_BASE", "1"))
+    AI_BACKOFF_MAX: float = float(os.getenv("AI_BACKOFF_MAX", "30"))
+    AI_RATE_LIMIT: float = float(os.getenv("AI_RATE_LIMIT", "0"))
+    AI_RATE_BURST: int = int(os.getenv("AI_RATE_BURST", "3"))
+    AI_CIRCUIT_FAILURES: int = int(os.getenv("AI_CIRCUIT_FAILURES", "5"))
+    AI_CIRCUIT_RESET: float = float(os.getenv("AI_CIRCUIT_RESET", "60"))
+    AI_POOL_SIZE: int = int(os.getenv("AI_POOL_SIZE", "10"))
+    # Analyses reused for identical texts across loops and runs ("" keeps them in memory only)
+    AI_CACHE_PATH: str = os.getenv("AI_CACHE_PATH", "output/ai_cache.json")
+    AI_CACHE_MAX_ENTRIES: int = int(os.getenv("AI_CACHE_MAX_ENTRIES", "20000"))
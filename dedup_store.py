@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Dedup Store - Persistent set of post fingerprints
+Sorted array of 64-bit fingerprints in memory, append-only log on disk
+"""
+
+import bisect
+import hashlib
+import os
+from array import array
+from typing import Iterable, Optional, Set
+from console import Console
+
+MERGE_EVERY = 1024  # Pending fingerprints folded into the sorted array at once
+LOAD_CHUNK = 65536  # Log records sorted at once while loading
+
+
+def fingerprint(key: str) -> int:
+    """64-bit fingerprint of a hex digest (md5 from _create_post_hash) or any string"""
+    try:
+        return int(key[:16], 16)
+    except ValueError:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+        return int.from_bytes(digest, "little")
+
+
+def _merge_sorted(base: array, values: Iterable[int]) -> array:
+    """
+    Linear merge of ascending values into the sorted array, dropping duplicates.
+    Runs between insertion points are copied as array slices, so only the
+    merged run ever exists as Python ints.
+    """
+    merged = array("Q")
+    start = 0
+    previous = None
+    for value in values:
+        if value == previous:
+            continue
+        previous = value
+        position = bisect.bisect_left(base, value, start)
+        merged.extend(base[start:position])
+        start = position
+        if position < len(base) and base[position] == value:
+            continue
+        merged.append(value)
+    merged.extend(base[start:])
+    return merged
+
+
+class DedupStore:
+    """
+    Drop-in replacement for the in-memory set of post hashes.
+    8 bytes per post, lookups are a binary search plus a small pending set.
+    add() only marks a post as seen for this run, persist() logs it once saved.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._sorted = array("Q")
+        self._pending: Set[int] = set()
+        self._log = None
+
+        if path:
+            self._load()
+            self._log = open(path, "ab")
+
+    @property
+    def persistent(self) -> bool:
+        """Whether saved fingerprints survive a restart"""
+        return bool(self.path)
+
+    def _load(self) -> None:
+        """Read the log, sort and dedupe it chunk by chunk, rewrite it compacted"""
+        if not os.path.exists(self.path):
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            return
+
+        raw = array("Q")
+        with open(self.path, "rb") as f:
+            data = f.read()
+        # Ignore a partially written trailing record
+        torn = len(data) % raw.itemsize
+        raw.frombytes(data[: len(data) - torn])
+        del data
+
+        for start in range(0, len(raw), LOAD_CHUNK):
+            self._sorted = _merge_sorted(self._sorted, sorted(raw[start : start + LOAD_CHUNK]))
+
+        if len(self._sorted) != len(raw) or torn:
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "wb") as f:
+                self._sorted.tofile(f)
+            os.replace(temp_path, self.path)
+        Console.debug(f"🗂️ Dedup store loaded {len(self._sorted)} fingerprints from {self.path}")
+
+    def _contains_fingerprint(self, value: int) -> bool:
+        if value in self._pending:
+            return True
+        position = bisect.bisect_left(self._sorted, value)
+        return position < len(self._sorted) and self._sorted[position] == value
+
+    def __contains__(self, key: str) -> bool:
+        return self._contains_fingerprint(fingerprint(key))
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._pending)
+
+    def add(self, key: str) -> None:
+        """Mark a post as seen in memory, persist() makes it survive a restart"""
+        value = fingerprint(key)
+        if self._contains_fingerprint(value):
+            return
+        self._pending.add(value)
+        if len(self._pending) >= MERGE_EVERY:
+            self._merge()
+
+    def persist(self, keys: Iterable[str]) -> None:
+        """Append fingerprints of saved posts to the log and flush it"""
+        if not self._log:
+            return
+        values = array("Q", (fingerprint(key) for key in keys))
+        if values:
+            self._log.write(values.tobytes())
+            self._log.flush()
+
+    def _merge(self) -> None:
+        """Fold pending fingerprints into the sorted array"""
+        self._sorted = _merge_sorted(self._sorted, sorted(self._pending))
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Make logged fingerprints durable"""
+        if self._log:
+            self._log.flush()
+
+    def close(self) -> None:
+        if self._log:
+            self._log.close()
+            self._log = None
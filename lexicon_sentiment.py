@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Lexicon Sentiment - Local Indonesian/English sentiment scorer
+Handles negation, intensifiers, slang spelling and emoji, with a confidence
+so only ambiguous posts need the remote model
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+# word -> (weight, emotion)
+LEXICON: Dict[str, Tuple[float, Optional[str]]] = {
+    # Indonesian positive
+    "senang": (2.0, "happy"), "bahagia": (2.5, "happy"), "gembira": (2.0, "happy"),
+    "suka": (1.5, "happy"), "cinta": (2.0, "happy"), "sayang": (1.5, "happy"),
+    "terima": (0.0, None), "kasih": (0.0, None), "makasih": (1.5, "happy"),
+    "terimakasih": (1.5, "happy"), "syukur": (1.5, "happy"), "alhamdulillah": (1.5, "happy"),
+    "bagus": (1.5, "happy"), "baik": (1.0, "happy"), "hebat": (2.0, "excited"),
+    "keren": (2.0, "excited"), "mantap": (2.0, "excited"), "mantul": (2.0, "excited"),
+    "luar": (0.0, None), "biasa": (0.0, None), "indah": (1.5, "happy"),
+    "cantik": (1.5, "happy"), "ganteng": (1.5, "happy"), "lucu": (1.5, "happy"),
+    "seru": (1.5, "excited"), "asik": (1.5, "excited"), "asyik": (1.5, "excited"),
+    "enak": (1.5, "happy"), "sehat": (1.0, "happy"), "sukses": (2.0, "excited"),
+    "berhasil": (1.5, "excited"), "menang": (2.0, "excited"), "selamat": (1.5, "happy"),
+    "semangat": (1.5, "excited"), "bangga": (2.0, "excited"), "puas": (1.5, "happy"),
+    "nyaman": (1.0, "happy"), "damai": (1.0, "happy"), "aman": (0.5, "happy"),
+    "berkah": (1.5, "happy"), "rindu": (0.5, "sad"), "kangen": (0.5, "sad"),
+    "juara": (2.0, "excited"), "top": (1.5, "excited"), "amin": (1.0, "happy"),
+    "aamiin": (1.0, "happy"), "bergabung": (0.5, "happy"), "ramah": (1.0, "happy"),
+    # Indonesian negative
+    "sedih": (-2.0, "sad"), "kecewa": (-2.0, "sad"), "menangis": (-2.0, "sad"),
+    "nangis": (-2.0, "sad"), "duka": (-2.0, "sad"), "berduka": (-2.0, "sad"),
+    "galau": (-1.5, "sad"), "sakit": (-1.5, "sad"), "meninggal": (-2.0, "sad"),
+    "kasihan": (-1.0, "sad"), "sepi": (-1.0, "sad"), "hancur": (-2.0, "sad"),
+    "marah": (-2.0, "angry"), "kesal": (-2.0, "angry"), "kesel": (-2.0, "angry"),
+    "benci": (-2.5, "angry"), "muak": (-2.0, "angry"), "jengkel": (-2.0, "angry"),
+    "emosi": (-1.0, "angry"), "geram": (-2.0, "angry"), "sebel": (-1.5, "angry"),
+    "buruk": (-2.0, "sad"), "jelek": (-1.5, "sad"), "parah": (-1.5, "angry"),
+    "rusak": (-1.5, "angry"), "jarah": (-2.0, "angry"), "dijarah": (-2.0, "angry"),
+    "korupsi": (-2.0, "angry"), "bohong": (-2.0, "angry"), "hoax": (-1.5, "angry"),
+    "bodoh": (-2.0, "angry"), "goblok": (-2.5, "angry"), "tolol": (-2.5, "angry"),
+    "anjir": (-1.0, "angry"), "anjing": (-2.0, "angry"), "bangsat": (-2.5, "angry"),
+    "takut": (-1.5, "sad"), "khawatir": (-1.0, "sad"), "cemas": (-1.0, "sad"),
+    "capek": (-1.0, "sad"), "capai": (0.0, None), "lelah": (-1.0, "sad"),
+    "gagal": (-2.0, "sad"), "kalah": (-1.5, "sad"), "rugi": (-1.5, "sad"),
+    "musibah": (-2.0, "sad"), "bencana": (-2.0, "sad"), "kecelakaan": (-2.0, "sad"),
+    "miris": (-1.5, "sad"), "prihatin": (-1.5, "sad"), "pelakor": (-1.5, "angry"),
+    "waduh": (-0.5, None), "astaga": (-1.0, None), "sial": (-1.5, "angry"),
+    "zalim": (-2.0, "angry"), "jahat": (-2.0, "angry"), "kejam": (-2.0, "angry"),
+    # English positive
+    "happy": (2.0, "happy"), "love": (2.0, "happy"), "like": (1.0, "happy"),
+    "great": (2.0, "excited"), "good": (1.5, "happy"), "nice": (1.5, "happy"),
+    "awesome": (2.5, "excited"), "amazing": (2.5, "excited"), "beautiful": (2.0, "happy"),
+    "thanks": (1.5, "happy"), "thank": (1.5, "happy"), "grateful": (2.0, "happy"),
+    "congrats": (2.0, "excited"), "congratulations": (2.0, "excited"), "best": (2.0, "excited"),
+    "excited": (2.0, "excited"), "fun": (1.5, "excited"), "cool": (1.5, "excited"),
+    "glad": (1.5, "happy"), "welcome": (1.0, "happy"), "blessed": (2.0, "happy"),
+    "proud": (2.0, "excited"), "win": (2.0, "excited"), "cute": (1.5, "happy"),
+    # English negative
+    "sad": (-2.0, "sad"), "hate": (-2.5, "angry"), "angry": (-2.0, "angry"),
+    "bad": (-1.5, "sad"), "terrible": (-2.5, "sad"), "awful": (-2.5, "sad"),
+    "worst": (-2.5, "angry"), "disappointed": (-2.0, "sad"), "sorry": (-1.0, "sad"),
+    "cry": (-1.5, "sad"), "crying": (-1.5, "sad"), "tired": (-1.0, "sad"),
+    "stupid": (-2.0, "angry"), "fake": (-1.5, "angry"), "scam": (-2.0, "angry"),
+    "fail": (-2.0, "sad"), "failed": (-2.0, "sad"), "lost": (-1.5, "sad"),
+    "rip": (-2.0, "sad"), "died": (-2.0, "sad"), "sick": (-1.5, "sad"),
+    "annoying": (-1.5, "angry"), "ugly": (-1.5, "angry"), "shame": (-1.5, "angry"),
+}
+
+# Multi-word cues, matched on adjacent tokens before single words (longest first)
+PHRASES: Dict[Tuple[str, ...], Tuple[float, Optional[str]]] = {
+    ("terima", "kasih"): (2.5, "happy"), ("terima", "kasih", "banyak"): (3.0, "happy"),
+    ("makasih", "banyak"): (2.5, "happy"), ("luar", "biasa"): (2.5, "excited"),
+    ("selamat", "ulang", "tahun"): (2.0, "excited"), ("turut", "berduka"): (-2.5, "sad"),
+    ("turut", "prihatin"): (-2.0, "sad"), ("tidak", "apa", "apa"): (0.5, None),
+    ("thank", "you"): (2.0, "happy"), ("well", "done"): (2.0, "excited"),
+    ("good", "job"): (2.0, "excited"), ("rest", "in", "peace"): (-2.0, "sad"),
+}
+MAX_PHRASE = max(len(phrase) for phrase in PHRASES)
+
+EMOJI: Dict[str, Tuple[float, str]] = {
+    "🥰": (2.0, "happy"), "😍": (2.0, "happy"), "😘": (1.5, "happy"), "😊": (1.5, "happy"),
+    "☺": (1.5, "happy"), "🙂": (1.0, "happy"), "😁": (1.5, "happy"), "😄": (1.5, "happy"),
+    "😃": (1.5, "happy"), "😀": (1.5, "happy"), "😆": (1.5, "happy"), "😂": (0.5, "happy"),
+    "🤣": (0.5, "happy"), "😅": (0.5, None), "❤": (2.0, "happy"), "💕": (2.0, "happy"),
+    "💖": (2.0, "happy"), "💗": (2.0, "happy"), "💯": (1.5, "excited"), "👍": (1.5, "happy"), "👏": (1.5, "excited"),
+    "🙏": (1.0, "happy"), "🎉": (2.0, "excited"), "🥳": (2.0, "excited"), "🔥": (1.5, "excited"),
+    "✨": (1.0, "happy"), "🤩": (2.0, "excited"), "💪": (1.5, "excited"), "🤗": (1.5, "happy"),
+    "😢": (-2.0, "sad"), "😭": (-2.0, "sad"), "😞": (-1.5, "sad"), "😔": (-1.5, "sad"),
+    "😟": (-1.5, "sad"), "😥": (-1.5, "sad"), "💔": (-2.0, "sad"), "🥺": (-1.0, "sad"),
+    "😡": (-2.5, "angry"), "🤬": (-2.5, "angry"), "😠": (-2.0, "angry"), "😤": (-1.5, "angry"),
+    "👎": (-1.5, "angry"), "🙄": (-1.0, "angry"), "😒": (-1.0, "angry"), "🤮": (-2.0, "angry"),
+    "😱": (-1.5, "sad"), "😰": (-1.5, "sad"), "🙈": (-0.5, None), "‼": (0.0, None),
+}
+
+# Flip the sign of the next sentiment word within NEGATION_WINDOW tokens
+NEGATORS = {
+    "tidak", "tak", "bukan", "gak", "ga", "nggak", "ngga", "enggak", "engga", "gk",
+    "tdk", "jangan", "jgn", "belum", "blm", "kurang",
+    "not", "no", "never", "dont", "don't", "isn't", "isnt", "wasn't", "cant", "can't",
+    "won't", "didn't", "didnt", "nor",
+}
+# Boost the cue right after them
+INTENSIFIERS = {
+    "sangat": 1.5, "amat": 1.3, "paling": 1.5,
+    "terlalu": 1.3, "super": 1.5, "sungguh": 1.3, "bener": 1.2, "benar": 1.2,
+    "very": 1.5, "so": 1.3, "really": 1.5, "too": 1.3, "extremely": 1.8, "most": 1.5,
+}
+# Boost the cue right before them (sayang banget, bagus sekali)
+POST_INTENSIFIERS = {"banget": 1.5, "bgt": 1.5, "bngt": 1.5, "sekali": 1.3, "pol": 1.5}
+STOPWORDS = {
+    "yang", "dan", "di", "ke", "dari", "ini", "itu", "untuk", "dengan", "ada", "saya",
+    "aku", "kamu", "anda", "kita", "kami", "mereka", "dia", "akan", "sudah", "udah",
+    "juga", "jadi", "atau", "karena", "pada", "dalam", "bisa", "lagi", "aja", "ajah",
+    "saja", "yg", "dgn", "utk", "nya", "kalau", "kalo", "tapi", "masih", "mau", "apa",
+    "ya", "yah", "sih", "deh", "dong", "kok", "nih", "inih", "tuh", "pun", "oleh",
+    "setelah", "sebelum", "saat", "kepada", "terbaru", "semua", "biar", "lah", "kan",
+    "the", "a", "an", "and", "or", "to", "of", "in", "on", "for", "is", "are", "was",
+    "it", "this", "that", "with", "my", "your", "i", "you", "we", "they", "be", "at",
+}
+# Cues that are as often mocking as happy, they lower the confidence
+AMBIGUOUS = {"😂", "🤣", "😅", "🙈", "wkwk", "wkwkwk", "haha", "hahaha"}
+# Indonesian clitics/particles tried when the plain token is unknown
+SUFFIXES = ("nya", "lah", "kah", "ku", "mu")
+NEGATION_WINDOW = 3
+SCORE_ALPHA = 4.0  # score = s / sqrt(s^2 + alpha)
+
+_TOKEN = re.compile(
+    r"[#@]?[^\W\d_]+(?:'[^\W\d_]+)?|[\U0001F300-\U0001FAFF☀-➿‼]",
+    re.UNICODE,
+)
+_REPEATED = re.compile(r"(\w)\1{2,}")
+
+
+class LexiconSentiment:
+    """
+    In-process sentiment scorer. analyze_batch() returns, per text, the same
+    fields the AI fills (status, sentiment_score, emotion, key_topics) plus
+    a confidence in 0..1.
+    """
+
+    def __init__(self, positive_threshold: float = 0.25):
+        self.positive_threshold = positive_threshold
+
+    def _tokens(self, text: str) -> List[str]:
+        tokens = []
+        for token in _TOKEN.findall(text.lower()):
+            # mantappp -> mantap, sehat2 is already split by the tokenizer
+            tokens.append(_REPEATED.sub(r"\1", token) if len(token) > 3 else token)
+        return tokens
+
+    def _lookup(self, token: str) -> Optional[Tuple[float, Optional[str]]]:
+        entry = EMOJI.get(token) or LEXICON.get(token)
+        if entry is None:
+            for suffix in SUFFIXES:
+                if token.endswith(suffix) and len(token) - len(suffix) > 2:
+                    entry = LEXICON.get(token[: -len(suffix)])
+                    if entry:
+                        break
+        return entry
+
+    def _phrase_at(
+        self, tokens: List[str], i: int
+    ) -> Optional[Tuple[Tuple[float, Optional[str]], int]]:
+        """Longest PHRASES entry starting at tokens[i], with its length"""
+        for length in range(min(MAX_PHRASE, len(tokens) - i), 1, -1):
+            entry = PHRASES.get(tuple(tokens[i : i + length]))
+            if entry:
+                return entry, length
+        return None
+
+    def analyze(self, text: str) -> Dict[str, Any]:
+        tokens = self._tokens(text or "")
+        total = 0.0
+        positive = 0.0
+        negative = 0.0
+        hits = 0
+        negated_hits = 0
+        ambiguous = False
+        emotions: Counter = Counter()
+        negate_until = -1
+        intensity = 1.0
+        previous = None
+        last_hit: Optional[Tuple[int, float, Optional[str]]] = None  # (end index, weight, emotion)
+
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token in NEGATORS and not self._phrase_at(tokens, i):
+                negate_until = i + NEGATION_WINDOW
+                i += 1
+                continue
+            if token in POST_INTENSIFIERS:
+                # Applies to the cue right before it, once
+                if last_hit and last_hit[0] == i - 1:
+                    _, weight, emotion = last_hit
+                    extra = weight * (POST_INTENSIFIERS[token] - 1)
+                    total += extra
+                    if extra > 0:
+                        positive += extra
+                    else:
+                        negative -= extra
+                    if emotion:
+                        emotions[emotion] += abs(extra)
+                    last_hit = None
+                intensity = 1.0
+                i += 1
+                continue
+            if token in INTENSIFIERS:
+                intensity = INTENSIFIERS[token]
+                i += 1
+                continue
+            # Reduplication (sehat sehat) counts once
+            if token == previous:
+                i += 1
+                continue
+            previous = token
+            if token in AMBIGUOUS:
+                ambiguous = True
+
+            start = i
+            phrase = self._phrase_at(tokens, i)
+            if phrase:
+                entry, length = phrase
+                i += length - 1
+            else:
+                entry = self._lookup(token)
+
+            # A pre-intensifier only boosts the token right after it
+            boost, intensity = intensity, 1.0
+            if not entry or not entry[0]:
+                i += 1
+                continue
+
+            weight, emotion = entry
+            weight *= boost
+            if start <= negate_until:
+                weight = -weight * 0.75
+                negated_hits += 1
+                negate_until = -1
+                emotion = None
+            hits += 1
+            total += weight
+            if weight > 0:
+                positive += weight
+            else:
+                negative -= weight
+            if emotion:
+                emotions[emotion] += abs(weight)
+            last_hit = (i, weight, emotion)
+            i += 1
+
+        score = total / math.sqrt(total * total + SCORE_ALPHA) if total else 0.0
+        if score >= self.positive_threshold:
+            status = "positive"
+        elif score <= -self.positive_threshold:
+            status = "negative"
+        else:
+            status = "neutral"
+
+        return {
+            "status": status,
+            "sentiment_score": round(score, 2),
+            "emotion": emotions.most_common(1)[0][0] if emotions and status != "neutral" else "neutral",
+            "key_topics": self._key_topics(tokens),
+            "confidence": self._confidence(
+                negated_hits, positive, negative, len(tokens), text, ambiguous
+            ),
+        }
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Score every text of a batch"""
+        return [self.analyze(text) for text in texts]
+
+    def _confidence(
+        self,
+        negated_hits: int,
+        positive: float,
+        negative: float,
+        token_count: int,
+        text: str,
+        ambiguous: bool,
+    ) -> float:
+        """High when strong cues agree in a short text, zero without any cue"""
+        if not positive and not negative:
+            return 0.0
+        agreement = abs(positive - negative) / (positive + negative)
+        evidence = min(1.0, (positive + negative) / 3)
+        # Long texts tend to mix topics the lexicon cannot see
+        length = min(1.0, 30 / token_count) if token_count > 30 else 1.0
+        confidence = agreement * evidence * length
+        if negated_hits:
+            confidence *= 0.8
+        if "?" in text:
+            confidence *= 0.8
+        if ambiguous:
+            confidence *= 0.5
+        return round(confidence, 2)
+
+    def _key_topics(self, tokens: List[str], limit: int = 3) -> List[str]:
+        hashtags = [t[1:] for t in tokens if t.startswith("#") and len(t) > 2]
+        words = Counter(
+            t
+            for t in tokens
+            if len(t) > 3
+            and t[0] not in "#@"
+            and t.isalpha()
+            and t not in STOPWORDS
+            and t not in LEXICON
+            and t not in NEGATORS
+            and t not in INTENSIFIERS
+            and t not in POST_INTENSIFIERS
+        )
+        topics = list(dict.fromkeys(hashtags))
+        for word, _ in words.most_common():
+            if len(topics) >= limit:
+                break
+            if word not in topics:
+                topics.append(word)
+        return topics[:limit]
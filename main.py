@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import asyncio
 import time
 import sys
 import os
@@ -8,6 +9,52 @@ from console import Console
 import utils
 
 
+def print_login_failure():
+    """Explain why scraping cannot continue after a failed login"""
+    Console.error("❌ Tidak bisa melanjutkan tanpa login")
+    Console.warning("💡 Kemungkinan penyebab:")
+    Console.warning("   - Kredensial Facebook salah")
+    Console.warning("   - Ada captcha atau verifikasi 2FA")
+    Console.warning("   - Facebook mendeteksi aktivitas otomatis")
+    Console.warning("   - Koneksi internet lambat")
+    Console.info(
+        "\n🔍 Cek file login_failed.png atau login_error.png untuk detail lebih lanjut"
+    )
+
+
+def print_preview(feed_posts):
+    """Show the first scraped posts"""
+    Console.success(f"\n📋 Berhasil scrape {len(feed_posts)} status dari beranda/feed")
+    Console.info("\n Preview hasil scraping:")
+    for index, post in enumerate(feed_posts[:5]):
+        Console.log(f"\n--- Post {index + 1} ---")
+        Console.log(f"Author: {post.get('author', 'Unknown')}")
+        text = post.get("text", "")
+        truncated_text = text[:150] + ("..." if len(text) > 150 else "")
+        Console.log(f"Text: {truncated_text}")
+        Console.log(f"Timestamp: {post.get('timestamp', 'Unknown')}")
+        Console.log(f"Selector: {post.get('selector', '')}")
+    if len(feed_posts) > 5:
+        Console.info(f"\n... dan {len(feed_posts) - 5} post lainnya")
+
+
+def print_summary():
+    """Show output files and scraper features"""
+    Console.success("\n✅ Scraping selesai dengan CDP!")
+    Console.info("📁 File hasil scraping:")
+    Console.info("   - facebook_feed_posts_cdp.json (dan .csv)")
+    Console.info("\n🔒 Keunggulan CDP Scraper (Mobile iPhone Portrait):")
+    Console.info("   - Menggunakan m.facebook.com untuk kompatibilitas mobile")
+    Console.info("   - Simulasi perangkat iPhone 8 dengan orientasi portrait")
+    Console.info("   - Viewport 375x667 pixels untuk responsive design")
+    Console.info("   - 📏 Dimensions bar untuk monitoring ukuran real-time")
+    Console.info("   - Anti-deteksi bot yang lebih kuat")
+    Console.info("   - Stealth mode dengan human behavior simulation")
+    Console.info("   - CDP session untuk kontrol browser yang lebih dalam")
+    Console.info("   - Request interception dan modification")
+    Console.info("   - Random delays dan movements")
+
+
 def main():
     """Main function to run the Facebook scraper"""
     scraper = CDPFacebookScraper()
@@ -21,15 +68,7 @@ def main():
         # Login to Facebook with CDP
         login_success = scraper.login()
         if not login_success:
-            Console.error("❌ Tidak bisa melanjutkan tanpa login")
-            Console.warning("💡 Kemungkinan penyebab:")
-            Console.warning("   - Kredensial Facebook salah")
-            Console.warning("   - Ada captcha atau verifikasi 2FA")
-            Console.warning("   - Facebook mendeteksi aktivitas otomatis")
-            Console.warning("   - Koneksi internet lambat")
-            Console.info(
-                "\n🔍 Cek file login_failed.png atau login_error.png untuk detail lebih lanjut"
-            )
+            print_login_failure()
             return
         Console.success(
             "\n🎉 Login berhasil dengan CDP (Mobile iPhone Portrait)! Sekarang akan melakukan scraping...\n"
@@ -51,38 +90,12 @@ def main():
             loop_interval=Env.LOOP_INTERVAL
         )
         if feed_posts:
-            Console.success(
-                f"\n📋 Berhasil scrape {len(feed_posts)} status dari beranda/feed"
-            )
             # Save results
             scraper.save_posts(feed_posts, "facebook_feed_posts_cdp.json")
-            # Show preview
-            Console.info("\n Preview hasil scraping:")
-            for index, post in enumerate(feed_posts[:5]):
-                Console.log(f"\n--- Post {index + 1} ---")
-                Console.log(f"Author: {post.get('author', 'Unknown')}")
-                text = post.get("text", "")
-                truncated_text = text[:150] + ("..." if len(text) > 150 else "")
-                Console.log(f"Text: {truncated_text}")
-                Console.log(f"Timestamp: {post.get('timestamp', 'Unknown')}")
-                Console.log(f"Selector: {post.get('selector', '')}")
-            if len(feed_posts) > 5:
-                Console.info(f"\n... dan {len(feed_posts) - 5} post lainnya")
+            print_preview(feed_posts)
         else:
             Console.error("❌ Tidak ada post yang berhasil di-scrape")
-        Console.success("\n✅ Scraping selesai dengan CDP!")
-        Console.info("📁 File hasil scraping:")
-        Console.info("   - facebook_feed_posts_cdp.json (dan .csv)")
-        Console.info("\n🔒 Keunggulan CDP Scraper (Mobile iPhone Portrait):")
-        Console.info("   - Menggunakan m.facebook.com untuk kompatibilitas mobile")
-        Console.info("   - Simulasi perangkat iPhone 8 dengan orientasi portrait")
-        Console.info("   - Viewport 375x667 pixels untuk responsive design")
-        Console.info("   - 📏 Dimensions bar untuk monitoring ukuran real-time")
-        Console.info("   - Anti-deteksi bot yang lebih kuat")
-        Console.info("   - Stealth mode dengan human behavior simulation")
-        Console.info("   - CDP session untuk kontrol browser yang lebih dalam")
-        Console.info("   - Request interception dan modification")
-        Console.info("   - Random delays dan movements")
+        print_summary()
     except Exception as error:
         Console.error(f"\n❌ Error utama: {error}")
         import traceback
@@ -93,9 +106,64 @@ def main():
         Console.info("\n🔒 CDP Scraper ditutup")
 
 
+def compact():
+    """Export the cumulative JSON snapshot from the append-only store"""
+    scraper = CDPFacebookScraper()
+    try:
+        scraper.export_cumulative()
+    finally:
+        scraper.close()
+
+
+async def async_main():
+    """Async entry point, AI analysis and saving overlap with the next scrape"""
+    from async_cdp_facebook_scraper import AsyncCDPFacebookScraper
+
+    scraper = AsyncCDPFacebookScraper()
+    try:
+        Console.log(
+            "🎯 Facebook Status Scraper - Async CDP Stealth Version (Mobile iPhone Portrait)"
+        )
+        Console.log("================================================\n")
+        await scraper.init()
+        if not await scraper.login():
+            print_login_failure()
+            return
+        Console.success(
+            "\n🎉 Login berhasil dengan CDP (Mobile iPhone Portrait)! Sekarang akan melakukan scraping...\n"
+        )
+        await asyncio.sleep(5)
+
+        Console.debug("🏠 Scraping status dari beranda/feed...")
+        feed_posts = await scraper.scrape_status(
+            target_url="https://m.facebook.com/home.php",
+            continuous=Env.LOOP_TYPE == "continuous",
+            loop_interval=Env.LOOP_INTERVAL,
+        )
+        if feed_posts:
+            await scraper.save_posts(feed_posts, "facebook_feed_posts_cdp.json")
+            print_preview(feed_posts)
+        else:
+            Console.error("❌ Tidak ada post yang berhasil di-scrape")
+        print_summary()
+    except Exception as error:
+        Console.error(f"\n❌ Error utama: {error}")
+        import traceback
+
+        Console.error(f"Stack trace: {traceback.format_exc()}")
+    finally:
+        await scraper.close()
+        Console.info("\n🔒 CDP Scraper ditutup")
+
+
 if __name__ == "__main__":
     try:
-        main()
+        if "--compact" in sys.argv:
+            compact()
+        elif Env.ENGINE == "async":
+            asyncio.run(async_main())
+        else:
+            main()
     except KeyboardInterrupt:
         Console.warning("\n🛑 Scraping dibatalkan oleh user")
     except Exception as e:
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Near Duplicate - MinHash LSH index for posts that are "almost" the same
+Catches truncated ("See more"), emoji/whitespace edited and re-shared copies
+"""
+
+import random
+import re
+import zlib
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+NUM_PERM = 64  # MinHash signature length
+SHINGLE_SIZE = 5  # Character shingles over the canonical text
+PREFIX_CHARS = 48  # Canonical prefix length used to match truncated copies
+
+# Trailing markers Facebook appends to truncated posts
+_TRUNCATION_MARKERS = re.compile(
+    r"(?:\.{3}|…)?\s*(?:see more|lihat selengkapnya|selengkapnya)?\s*$",
+    re.IGNORECASE,
+)
+# Everything that is not a letter or digit (emoji, punctuation, symbols)
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def canonical_text(text: str) -> str:
+    """Lowercased letters/digits separated by single spaces, truncation marker removed"""
+    text = _TRUNCATION_MARKERS.sub("", text or "")
+    return " ".join(_NON_WORD.sub(" ", text.lower()).split())
+
+
+def _optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick bands x rows so the LSH S-curve threshold (1/b)^(1/r) sits at or just
+    below the wanted similarity, candidates are verified on the signature anyway
+    """
+    best = (num_perm, 1)
+    best_threshold = -1.0
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        curve_threshold = (1.0 / bands) ** (1.0 / rows)
+        if best_threshold < curve_threshold <= threshold:
+            best, best_threshold = (bands, rows), curve_threshold
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    MinHash signatures bucketed by LSH bands plus a canonical-prefix index.
+    Lookups only compare against posts sharing a band bucket or prefix,
+    so the cost does not grow with the full history.
+    """
+
+    def __init__(self, threshold: float = 0.8, num_perm: int = NUM_PERM):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _optimal_bands(threshold, num_perm)
+
+        # Same permutations every run so signatures stay comparable
+        rng = random.Random(num_perm)
+        self._permutations = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        ]
+
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [
+            {} for _ in range(self.bands)
+        ]
+        self._prefixes: Dict[str, List[int]] = {}
+        self._signatures: List[Tuple[int, ...]] = []
+        self._texts: List[str] = []  # Canonical texts for prefix verification
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _shingles(self, canonical: str) -> Set[int]:
+        if len(canonical) <= SHINGLE_SIZE:
+            return {zlib.crc32(canonical.encode("utf-8"))}
+        return {
+            zlib.crc32(canonical[i : i + SHINGLE_SIZE].encode("utf-8"))
+            for i in range(len(canonical) - SHINGLE_SIZE + 1)
+        }
+
+    def signature(self, canonical: str) -> Tuple[int, ...]:
+        """MinHash signature of a canonical text"""
+        shingles = self._shingles(canonical)
+        return tuple(
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in shingles)
+            for a, b in self._permutations
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows]
+            for band in range(self.bands)
+        ]
+
+    def _similarity(self, left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        """Estimated Jaccard similarity from two signatures"""
+        return sum(1 for a, b in zip(left, right) if a == b) / self.num_perm
+
+    def _is_truncation(self, canonical: str, item_id: int) -> bool:
+        other = self._texts[item_id]
+        shorter, longer = sorted((canonical, other), key=len)
+        return len(shorter) >= PREFIX_CHARS and longer.startswith(shorter)
+
+    def query(self, text: str) -> Optional[int]:
+        """Id of an indexed near-duplicate of text, or None"""
+        canonical = canonical_text(text)
+        if not canonical:
+            return None
+        return self._query(canonical, self.signature(canonical))
+
+    def _query(self, canonical: str, signature: Tuple[int, ...]) -> Optional[int]:
+        if len(canonical) >= PREFIX_CHARS:
+            for item_id in self._prefixes.get(canonical[:PREFIX_CHARS], []):
+                if self._is_truncation(canonical, item_id):
+                    return item_id
+
+        checked = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            for item_id in self._buckets[band].get(key, []):
+                if item_id in checked:
+                    continue
+                checked.add(item_id)
+                if self._similarity(signature, self._signatures[item_id]) >= self.threshold:
+                    return item_id
+        return None
+
+    def add(self, text: str) -> int:
+        """Index text, returns its id"""
+        canonical = canonical_text(text)
+        return self._add(canonical, self.signature(canonical))
+
+    def _add(self, canonical: str, signature: Tuple[int, ...]) -> int:
+        item_id = len(self._signatures)
+        self._signatures.append(signature)
+        self._texts.append(canonical)
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(item_id)
+        if len(canonical) >= PREFIX_CHARS:
+            self._prefixes.setdefault(canonical[:PREFIX_CHARS], []).append(item_id)
+        return item_id
+
+    def check_and_add(self, text: str) -> Tuple[Optional[int], int]:
+        """
+        Look text up and index it when it is new.
+        :return: (id of the near-duplicate or None, id of text in the index)
+        """
+        canonical = canonical_text(text)
+        if not canonical:
+            return None, -1
+        signature = self.signature(canonical)
+        match = self._query(canonical, signature)
+        if match is not None:
+            return match, match
+        return None, self._add(canonical, signature)
+
+    def export_items(self, item_ids: Iterable[int]) -> List[Dict[str, Any]]:
+        """Canonical text and signature of the given items, for restore()"""
+        return [
+            {"text": self._texts[item_id], "signature": list(self._signatures[item_id])}
+            for item_id in item_ids
+        ]
+
+    def restore(self, items: List[Dict[str, Any]]) -> None:
+        """Re-index exported items without recomputing their signatures"""
+        for item in items:
+            self._add(item["text"], tuple(item["signature"]))
+
+    def replace(self, item_id: int, text: str) -> None:
+        """Point an indexed id at a longer version of the same post"""
+        canonical = canonical_text(text)
+        signature = self.signature(canonical)
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].setdefault(key, [])
+            if item_id not in bucket:
+                bucket.append(item_id)
+        if len(canonical) >= PREFIX_CHARS:
+            bucket = self._prefixes.setdefault(canonical[:PREFIX_CHARS], [])
+            if item_id not in bucket:
+                bucket.append(item_id)
+        self._signatures[item_id] = signature
+        self._texts[item_id] = canonical
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Noise Classifier - Single-pass noise/content/confidence classification
+Built once from the cleaning pattern tables, with a batch API for the cleaning stage
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# Patterns untuk filtering noise/UI elements: (pattern, flags)
+NOISE_PATTERNS: List[Tuple[str, int]] = [
+    # UI elements
+    (r"^(Like|Comment|Share|Follow|More)$", re.IGNORECASE),
+    (r"^\d+[KM]?\s*(Comments?|Like|Share|Follow)$", re.IGNORECASE),
+    (r"^(People You May Know|Suggested for you|See all)$", re.IGNORECASE),
+    (r"^\d+\s*mutual friends?$", re.IGNORECASE),
+    (r"^(Add Friend|Remove|Block|Report)$", re.IGNORECASE),
+    (r"^(What's on your mind\?|Photo|Video|Live)$", re.IGNORECASE),
+    (r"^(Home|Search|Notifications|Menu|Profile)$", re.IGNORECASE),
+    (r"^(News Feed|Stories|Groups|Pages|Events)$", re.IGNORECASE),
+    # Navigation and interaction elements
+    (r"^(󰍸|󰍹|󰍺|󰞋)", 0),  # Facebook reaction icons
+    (r"^[\U0001F300-\U0001F6FF]+$", 0),  # Emoji-only content
+    (r"^\d+$", 0),  # Numbers only (like counts)
+    (r"^\d+[KM]$", 0),  # Like counts (1K, 2M, etc)
+    (r"^(󱘋|🎥|📷|📸|🎵)", 0),  # Media icons
+    # Time stamps and metadata
+    (r"^\d+[hmdHMD]$", 0),  # 1h, 2d, 3m ago
+    (r"^(Just now|Yesterday|Today)$", re.IGNORECASE),
+    (r"^(Sponsored|Promoted|Advertisement)$", re.IGNORECASE),
+    (r"^(Privacy|Public|Friends|Custom)$", re.IGNORECASE),
+    # Translation metadata
+    (r"^Translated from \w+$", re.IGNORECASE),
+    (r"^See translation$", re.IGNORECASE),
+    (r"^Original text$", re.IGNORECASE),
+    # Generic short noise
+    (r"^[\.]{3,}$", 0),  # Three dots or more
+    (r"^[…]+$", 0),  # Ellipsis
+    (r"^[\s\n\r]*$", 0),  # Whitespace only
+]
+
+# Patterns untuk identifying real post content: (pattern, flags)
+POST_CONTENT_PATTERNS: List[Tuple[str, int]] = [
+    # Contains at least 2 words of 3+ letters
+    (r"[a-zA-Z]{3,}.*[a-zA-Z]{3,}", 0),
+    (r"[.!?]{1}", 0),  # Contains sentence endings
+    (r"[,:;]", 0),  # Contains punctuation
+]
+
+MIN_NOISE_FREE_LENGTH = 10  # Shorter text is always noise
+MIN_CONTENT_LENGTH = 15  # Shorter text is never real content
+
+# ^(a|b|c)$, ^(a|b|c) and ^abc$ with plain literal alternatives
+_LITERAL_GROUP = re.compile(r"^\^\(((?:[^()\\\[\]{}*+?.|^$]|\\[?.]|\|)+)\)(\$?)$")
+_LITERAL_PLAIN = re.compile(r"^\^((?:[^()\\\[\]{}*+?.|^$]|\\[?.])+)(\$)$")
+# [abc] or [abc]{1} with plain literal characters
+_CHAR_CLASS = re.compile(r"^\[((?:[^\]\\\-^]|\\[.])+)\](?:\{1\})?$")
+_SENTENCE_SPLIT = re.compile(r"[.!?]+")
+_ZERO_WIDTH = re.compile(r"[\u200B-\u200D\uFEFF]")
+
+
+def _unescape(literal: str) -> str:
+    return re.sub(r"\\(.)", r"\1", literal)
+
+
+class NoiseClassifier:
+    """
+    Classifies texts as noise / real content and scores confidence in one pass.
+    Literal alternations become set lookups, literal prefixes become startswith,
+    character classes become set tests, everything else is one combined regex.
+    """
+
+    def __init__(
+        self,
+        noise_patterns: Optional[List[Tuple[str, int]]] = None,
+        content_patterns: Optional[List[Tuple[str, int]]] = None,
+    ):
+        noise_patterns = NOISE_PATTERNS if noise_patterns is None else noise_patterns
+        content_patterns = (
+            POST_CONTENT_PATTERNS if content_patterns is None else content_patterns
+        )
+
+        # Noise: exact literals (case-folded when IGNORECASE), prefixes, regex rest
+        self._exact_literals = set()
+        self._exact_literals_nocase = set()
+        prefixes: List[str] = []
+        noise_rest: List[Tuple[str, int]] = []
+        for pattern, flags in noise_patterns:
+            match = _LITERAL_GROUP.match(pattern) or _LITERAL_PLAIN.match(pattern)
+            if match and not (flags & ~re.IGNORECASE):
+                alternatives = [_unescape(a) for a in match.group(1).split("|")]
+                if match.group(2):
+                    if flags & re.IGNORECASE:
+                        self._exact_literals_nocase.update(a.lower() for a in alternatives)
+                    else:
+                        self._exact_literals.update(alternatives)
+                    continue
+                if not flags & re.IGNORECASE:
+                    prefixes.extend(alternatives)
+                    continue
+            noise_rest.append((pattern, flags))
+
+        self._prefixes = tuple(prefixes)
+        # Longest literal, longer texts skip the lowercase + lookup entirely
+        self._max_literal_length = max(
+            (len(l) for l in self._exact_literals | self._exact_literals_nocase),
+            default=0,
+        )
+        self._noise_regex = self._combine(noise_rest)
+        # Fully anchored alternations only need to be tried at position 0
+        self._noise_anchored = all(p.startswith("^") for p, _ in noise_rest)
+
+        # Real content: literal character sets first, regex rest
+        self._content_chars = set()
+        content_rest: List[Tuple[str, int]] = []
+        for pattern, flags in content_patterns:
+            match = _CHAR_CLASS.match(pattern)
+            if match and not flags:
+                self._content_chars.update(_unescape(match.group(1)))
+                continue
+            content_rest.append((pattern, flags))
+        self._content_regex = self._combine(content_rest)
+
+    @staticmethod
+    def _combine(patterns: List[Tuple[str, int]]) -> Optional["re.Pattern"]:
+        """One alternation with per-pattern scoped flags"""
+        if not patterns:
+            return None
+        parts = []
+        for pattern, flags in patterns:
+            parts.append(f"(?i:{pattern})" if flags & re.IGNORECASE else f"(?:{pattern})")
+        return re.compile("|".join(parts))
+
+    def normalize(self, text: str) -> str:
+        """Clean and normalize text (whitespace, zero-width characters)"""
+        if not text:
+            return ""
+        # Zero-width characters are never ASCII, skip the regex for plain text
+        if not text.isascii():
+            text = _ZERO_WIDTH.sub("", text)
+        # str.split() collapses the same Unicode whitespace as \s+ and strips
+        return " ".join(text.split())
+
+    def is_noise(self, text: str) -> bool:
+        """Check if text is noise/UI content"""
+        if not text or not isinstance(text, str):
+            return True
+
+        clean_text = text.strip()
+        if len(clean_text) < MIN_NOISE_FREE_LENGTH:
+            return True
+
+        if len(clean_text) <= self._max_literal_length:
+            if clean_text in self._exact_literals:
+                return True
+            if clean_text.lower() in self._exact_literals_nocase:
+                return True
+        if self._prefixes and clean_text.startswith(self._prefixes):
+            return True
+        if not self._noise_regex:
+            return False
+        if self._noise_anchored:
+            return self._noise_regex.match(clean_text) is not None
+        return self._noise_regex.search(clean_text) is not None
+
+    def _has_content_pattern(self, text: str) -> bool:
+        if self._content_chars and not self._content_chars.isdisjoint(text):
+            return True
+        return bool(self._content_regex and self._content_regex.search(text))
+
+    def is_real(self, text: str) -> bool:
+        """Check if text is real post content"""
+        if not text or not isinstance(text, str):
+            return False
+
+        clean_text = text.strip()
+        if len(clean_text) < MIN_CONTENT_LENGTH:
+            return False
+        return self._has_content_pattern(clean_text)
+
+    def confidence(self, text: str, has_pattern: Optional[bool] = None) -> float:
+        """Calculate confidence score for text content"""
+        confidence = 0.0
+
+        # Length bonus
+        if len(text) > 50:
+            confidence += 0.3
+        if len(text) > 100:
+            confidence += 0.2
+
+        # Sentence structure bonus, without endings there is only one sentence
+        if any(char in text for char in ".!?"):
+            confidence += 0.2
+
+            # Multiple sentences bonus
+            sentences = 0
+            for sentence in _SENTENCE_SPLIT.split(text):
+                if len(sentence.strip()) > 5:
+                    sentences += 1
+                    if sentences > 1:
+                        confidence += 0.2
+                        break
+
+        # Pattern matching bonus
+        if has_pattern is None:
+            has_pattern = self._has_content_pattern(text)
+        if has_pattern:
+            confidence += 0.1
+
+        return min(confidence, 1.0)  # Cap at 1.0
+
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Classify a whole list of raw texts in one call.
+        noise/real are judged on the raw text, confidence on the normalized text.
+        """
+        results = []
+        for text in texts:
+            noise = self.is_noise(text)
+            real = not noise and self.is_real(text)
+            clean_text = self.normalize(text) if real else ""
+            results.append(
+                {
+                    "noise": noise,
+                    "real": real,
+                    "text": clean_text,
+                    "confidence": self.confidence(clean_text) if real else 0.0,
+                }
+            )
+        return results
+
+
+class _PerPatternClassifier:
+    """Per-pattern loop as used by the scraper before NoiseClassifier"""
+
+    def __init__(self):
+        self.noise_patterns = [re.compile(p, f) for p, f in NOISE_PATTERNS]
+        self.post_content_patterns = [re.compile(p, f) for p, f in POST_CONTENT_PATTERNS]
+
+    def _is_noise_content(self, text):
+        if not text or not isinstance(text, str):
+            return True
+        clean_text = text.strip()
+        if len(clean_text) < 10:
+            return True
+        for pattern in self.noise_patterns:
+            if pattern.search(clean_text):
+                return True
+        return False
+
+    def _is_real_post_content(self, text):
+        if not text or not isinstance(text, str):
+            return False
+        clean_text = text.strip()
+        if len(clean_text) < 15:
+            return False
+        for pattern in self.post_content_patterns:
+            if pattern.search(clean_text):
+                return True
+        return False
+
+    def _clean_text(self, text):
+        if not text:
+            return ""
+        cleaned = re.sub(r"\s+", " ", text.strip())
+        cleaned = re.sub(r"[\u200B-\u200D\uFEFF]", "", cleaned)
+        cleaned = re.sub(r"[^\S\r\n]+", " ", cleaned)
+        return cleaned.strip()
+
+    def _calculate_confidence(self, text):
+        confidence = 0.0
+        if len(text) > 50:
+            confidence += 0.3
+        if len(text) > 100:
+            confidence += 0.2
+        if any(char in text for char in ".!?"):
+            confidence += 0.2
+        sentences = [s.strip() for s in re.split(r"[.!?]+", text) if len(s.strip()) > 5]
+        if len(sentences) > 1:
+            confidence += 0.2
+        for pattern in self.post_content_patterns:
+            if pattern.search(text):
+                confidence += 0.1
+                break
+        return min(confidence, 1.0)
+
+    def classify_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        results = []
+        for text in texts:
+            noise = self._is_noise_content(text)
+            real = not noise and self._is_real_post_content(text)
+            clean_text = self._clean_text(text) if real else ""
+            results.append(
+                {
+                    "noise": noise,
+                    "real": real,
+                    "text": clean_text,
+                    "confidence": self._calculate_confidence(clean_text) if real else 0.0,
+                }
+            )
+        return results
+
+
+def benchmark(pattern: str = "output/loop_trace/*.json", rounds: int = 200) -> None:
+    """Microbenchmark against the per-pattern loop on texts from loop traces"""
+    import glob
+    import json
+    import timeit
+
+    texts: List[str] = []
+    for filename in sorted(glob.glob(pattern)):
+        if filename.endswith("_cleaning_report.json"):
+            continue
+        with open(filename, "r", encoding="utf-8") as f:
+            texts.extend(post.get("text", "") for post in json.load(f).get("posts", []))
+    # Typical UI noise next to real posts, as seen by the cleaning stage
+    texts += ["Like", "12 Comments", "See translation", "2h", "Suggested for you", "…"]
+    if not texts:
+        print(f"No texts found in {pattern}")
+        return
+
+    classifier = NoiseClassifier()
+    per_pattern = _PerPatternClassifier()
+    legacy = per_pattern.classify_batch(texts)
+    current = classifier.classify_batch(texts)
+    mismatches = sum(
+        1
+        for a, b in zip(legacy, current)
+        if (a["noise"], a["real"], a["text"]) != (b["noise"], b["real"], b["text"])
+        or abs(a["confidence"] - b["confidence"]) > 1e-9
+    )
+
+    legacy_s = timeit.timeit(lambda: per_pattern.classify_batch(texts), number=rounds)
+    current_s = timeit.timeit(lambda: classifier.classify_batch(texts), number=rounds)
+    per_text = rounds * len(texts)
+    print(f"Texts: {len(texts)} x {rounds} rounds, mismatches: {mismatches}")
+    print(f"Per-pattern loop : {legacy_s / per_text * 1e6:8.2f} µs/text")
+    print(f"NoiseClassifier  : {current_s / per_text * 1e6:8.2f} µs/text")
+    print(f"Speedup          : {legacy_s / current_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
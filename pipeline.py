@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Pipeline - Staged producer/consumer processing for scraped batches
+extract -> clean -> analyze -> persist, joined by bounded queues
+"""
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+from console import Console
+
+# Queue sentinel that stops a stage worker
+_STOP = object()
+
+
+class PipelineStage:
+    """
+    One pipeline stage. Threaded stages run their handler on a worker thread
+    fed by a bounded queue; inline stages run on the submitting thread.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Dict[str, Any]], bool],
+        threaded: bool = False,
+        queue_size: int = 4,
+    ):
+        self.name = name
+        self.handler = handler
+        self.threaded = threaded
+        self.next_stage: Optional["PipelineStage"] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "batches": 0,
+            "items": 0,
+            "errors": 0,
+            "busySeconds": 0.0,
+            "blockedSeconds": 0.0,  # Time producers waited on a full queue
+            "backpressureEvents": 0,
+            "maxDepth": 0,
+        }
+        self._queue: Optional[queue.Queue] = None
+        self._worker: Optional[threading.Thread] = None
+        if threaded:
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._worker = threading.Thread(
+                target=self._run_worker, name=f"pipeline-{name}", daemon=True
+            )
+            self._worker.start()
+
+    def submit(self, batch: Dict[str, Any]) -> None:
+        """Hand a batch to this stage, blocks only while the queue is full"""
+        if not self.threaded:
+            self._process(batch)
+            return
+
+        started = time.perf_counter()
+        backpressure = self._queue.full()
+        if backpressure:
+            Console.warning(
+                f"⚠️ Pipeline stage '{self.name}' is full ({self._queue.qsize()} batches), waiting..."
+            )
+        self._queue.put(batch)
+        with self._lock:
+            if backpressure:
+                self._stats["backpressureEvents"] += 1
+                self._stats["blockedSeconds"] += time.perf_counter() - started
+            self._stats["maxDepth"] = max(self._stats["maxDepth"], self._queue.qsize())
+
+    def _process(self, batch: Dict[str, Any]) -> None:
+        """Run the handler and forward the batch when it asks to continue"""
+        started = time.perf_counter()
+        forward = False
+        try:
+            forward = self.handler(batch)
+        except Exception as error:
+            Console.error(f"❌ Pipeline stage '{self.name}' failed: {error}")
+            with self._lock:
+                self._stats["errors"] += 1
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["items"] += len(batch.get("posts") or [])
+            self._stats["busySeconds"] += time.perf_counter() - started
+
+        if forward and self.next_stage:
+            self.next_stage.submit(batch)
+
+    def _run_worker(self) -> None:
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is _STOP:
+                    return
+                self._process(batch)
+            finally:
+                self._queue.task_done()
+
+    def close(self) -> None:
+        """Finish queued batches and stop the worker"""
+        if self.threaded and self._worker.is_alive():
+            self._queue.put(_STOP)
+            self._worker.join()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters of this stage"""
+        with self._lock:
+            stats = dict(self._stats)
+        busy = stats["busySeconds"]
+        stats["throughput"] = round(stats["items"] / busy, 2) if busy > 0 else 0.0
+        stats["busySeconds"] = round(busy, 3)
+        stats["blockedSeconds"] = round(stats["blockedSeconds"], 3)
+        stats["queueDepth"] = self._queue.qsize() if self._queue else 0
+        return stats
+
+
+class ScrapePipeline:
+    """
+    Chain of stages. Batches are dicts with at least "loop" and "posts",
+    each handler mutates the batch and returns True to pass it on.
+    """
+
+    def __init__(self, stages: List[PipelineStage]):
+        self.stages = stages
+        for stage, next_stage in zip(stages, stages[1:]):
+            stage.next_stage = next_stage
+
+    def submit(self, batch: Dict[str, Any]) -> None:
+        """Feed a new batch into the first stage"""
+        self.stages[0].submit(batch)
+
+    def close(self) -> None:
+        """Drain stages in order so every submitted batch is persisted"""
+        for stage in self.stages:
+            stage.close()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage throughput and queue-depth counters"""
+        return {stage.name: stage.snapshot() for stage in self.stages}
+
+    def log_stats(self) -> None:
+        """Log one line per stage"""
+        for name, stats in self.stats().items():
+            Console.debug(
+                f"🧵 Stage {name}: {stats['batches']} batches, {stats['items']} items, "
+                f"{stats['throughput']} items/s, queue {stats['queueDepth']} (max {stats['maxDepth']}), "
+                f"blocked {stats['blockedSeconds']}s, errors {stats['errors']}"
+            )
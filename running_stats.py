@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Running Stats - Online accumulator behind the cleaning report
+Updated once per accepted post, report() does not walk the post history
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Tuple
+
+TOP_N = 10  # Entries in topPosts and topAuthors
+
+
+class RunningStats:
+    """
+    Confidence histogram, sentiment/author counters, a bounded min-heap of the
+    most confident posts and the top authors, all kept up to date by add().
+    Ordering matches a stable sort of the full list: ties keep the earlier post/author.
+    """
+
+    def __init__(self, top_n: int = TOP_N):
+        self.top_n = top_n
+        self.total = 0
+        self.local_posts = 0
+        self.quality = {"highConfidence": 0, "mediumConfidence": 0, "lowConfidence": 0}
+        self.sentiment: Dict[str, int] = {}
+        self.posts_with_author = 0
+        self.author_counts: Dict[str, int] = {}
+        self._author_order: Dict[str, int] = {}  # First-seen index, breaks count ties
+        self._top_authors: List[str] = []  # At most top_n authors with the highest counts
+        # (confidence, -sequence, summary): the root is the entry to drop first
+        self._top_posts: List[Tuple[float, int, Dict[str, Any]]] = []
+
+    @classmethod
+    def from_posts(cls, posts: Iterable[Dict[str, Any]]) -> "RunningStats":
+        stats = cls()
+        stats.add_many(posts)
+        return stats
+
+    def state(self) -> Dict[str, Any]:
+        """JSON-serializable snapshot for the checkpoint, see from_state()"""
+        return {
+            "topN": self.top_n,
+            "total": self.total,
+            "localPosts": self.local_posts,
+            "quality": dict(self.quality),
+            "sentiment": dict(self.sentiment),
+            "postsWithAuthor": self.posts_with_author,
+            # Insertion order is the first-seen order that breaks count ties
+            "authorCounts": dict(self.author_counts),
+            "topAuthors": list(self._top_authors),
+            "topPosts": [list(entry) for entry in self._top_posts],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "RunningStats":
+        """Accumulator restored from state() without walking the posts again"""
+        stats = cls(state.get("topN", TOP_N))
+        stats.total = state["total"]
+        stats.local_posts = state["localPosts"]
+        stats.quality.update(state["quality"])
+        stats.sentiment = dict(state["sentiment"])
+        stats.posts_with_author = state["postsWithAuthor"]
+        stats.author_counts = dict(state["authorCounts"])
+        stats._author_order = {author: i for i, author in enumerate(stats.author_counts)}
+        stats._top_authors = list(state["topAuthors"])
+        # Saved in heap order, so the list is still a valid heap
+        stats._top_posts = [tuple(entry) for entry in state["topPosts"]]
+        return stats
+
+    def add_many(self, posts: Iterable[Dict[str, Any]]) -> None:
+        for post in posts:
+            self.add(post)
+
+    def add(self, post: Dict[str, Any]) -> None:
+        """Account for one accepted post, O(top_n) at most"""
+        sequence = self.total
+        self.total += 1
+        if post.get("sentiment_source") == "lexicon":
+            self.local_posts += 1
+
+        confidence = post.get("confidence", 0)
+        if confidence >= 0.8:
+            self.quality["highConfidence"] += 1
+        elif confidence >= 0.5:
+            self.quality["mediumConfidence"] += 1
+        else:
+            self.quality["lowConfidence"] += 1
+
+        status = post.get("status") or "unknown"
+        self.sentiment[status] = self.sentiment.get(status, 0) + 1
+
+        self._add_top_post(post, confidence, sequence)
+
+        author = post.get("author", "")
+        if author and author.strip():
+            self.posts_with_author += 1
+            self._count_author(author)
+
+    def _add_top_post(self, post: Dict[str, Any], confidence: float, sequence: int) -> None:
+        if len(self._top_posts) >= self.top_n and (confidence, -sequence) <= self._top_posts[0][:2]:
+            return
+        text = post.get("text", "")
+        summary = {
+            "confidence": confidence,
+            "text": text[:100] + ("..." if len(text) > 100 else ""),
+            "author": post.get("author", ""),
+            "timestamp": post.get("timestamp"),
+        }
+        entry = (confidence, -sequence, summary)
+        if len(self._top_posts) < self.top_n:
+            heapq.heappush(self._top_posts, entry)
+        else:
+            heapq.heapreplace(self._top_posts, entry)
+
+    def _author_key(self, author: str) -> Tuple[int, int]:
+        return self.author_counts[author], -self._author_order[author]
+
+    def _count_author(self, author: str) -> None:
+        if author not in self.author_counts:
+            self.author_counts[author] = 0
+            self._author_order[author] = len(self._author_order)
+        self.author_counts[author] += 1
+
+        # Counts only grow, so an outsider enters exactly when it passes the weakest member
+        if author in self._top_authors:
+            return
+        if len(self._top_authors) < self.top_n:
+            self._top_authors.append(author)
+            return
+        weakest = min(self._top_authors, key=self._author_key)
+        if self._author_key(author) > self._author_key(weakest):
+            self._top_authors[self._top_authors.index(weakest)] = author
+
+    def top_posts(self) -> List[Dict[str, Any]]:
+        ranked = sorted(self._top_posts, key=lambda entry: (-entry[0], -entry[1]))
+        return [entry[2] for entry in ranked]
+
+    def author_stats(self) -> Dict[str, Any]:
+        top_authors = sorted(self._top_authors, key=self._author_key, reverse=True)
+        return {
+            "totalAuthors": len(self.author_counts),
+            "postsWithAuthor": self.posts_with_author,
+            "postsWithoutAuthor": self.total - self.posts_with_author,
+            "authorCoverage": (
+                f"{(self.posts_with_author / self.total * 100):.1f}%" if self.total else "0.0%"
+            ),
+            "topAuthors": [
+                {"author": author, "postCount": self.author_counts[author]}
+                for author in top_authors
+            ],
+        }
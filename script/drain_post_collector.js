@@ -0,0 +1,5 @@
+(maxItems) => {
+    // Collector is gone after a navigation/reload, caller must reinstall it
+    if (!window.__fbPostCollector) return null;
+    return window.__fbPostCollector.drain(maxItems);
+}
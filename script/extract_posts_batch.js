@@ -0,0 +1,41 @@
+({ knownKeys }) => {
+    // Per-container extractor, injected from extract_container_post_data.js
+    const extractContainerPostData = EXTRACT_CONTAINER_POST_DATA;
+    // Text key function, injected from post_key.js
+    const postKey = POST_KEY;
+    const known = new Set(knownKeys || []);
+
+    const containers = document.querySelectorAll('[data-mcomponent="MContainer"]');
+    const processedContainers = new Set();
+    const posts = [];
+    let errors = 0;
+    let skippedKnown = 0;
+
+    containers.forEach((containerEl, index) => {
+        // Get container identifier to avoid duplicate processing
+        const containerId = containerEl.id || `container_${index}`;
+        if (processedContainers.has(containerId)) return;
+        processedContainers.add(containerId);
+
+        try {
+            const postData = extractContainerPostData(containerEl, index);
+            if (postData && postData.text) {
+                // Already scraped in an earlier loop, don't serialize it again
+                if (known.size > 0 && known.has(postKey(postData.text))) {
+                    skippedKnown++;
+                    return;
+                }
+                posts.push(postData);
+            }
+        } catch (e) {
+            errors++;
+        }
+    });
+
+    return {
+        containerCount: containers.length,
+        errors: errors,
+        skippedKnown: skippedKnown,
+        posts: posts
+    };
+}
@@ -0,0 +1,42 @@
+({ knownKeys }) => {
+    // Per-container extractor, injected from extract_container_post_data.js
+    const extractContainerPostData = EXTRACT_CONTAINER_POST_DATA;
+    // Text key function, injected from post_key.js
+    const postKey = POST_KEY;
+
+    // Known keys are sent once per loop, later steps reuse the page-side state
+    if (knownKeys || !window.__fbKnownRun) {
+        window.__fbKnownRun = {
+            known: new Set(knownKeys || []),
+            seenTexts: new Set(),
+            scanned: 0,
+            run: 0,
+            maxRun: 0
+        };
+    }
+    const state = window.__fbKnownRun;
+
+    // Only look at containers added since the previous step
+    const containers = document.querySelectorAll('[data-mcomponent="MContainer"]');
+    for (let i = state.scanned; i < containers.length; i++) {
+        let postData = null;
+        try {
+            postData = extractContainerPostData(containers[i], i);
+        } catch (e) {
+            continue;
+        }
+        // Nested containers yield the same text, count each post once
+        if (!postData || !postData.text || state.seenTexts.has(postData.text)) continue;
+        state.seenTexts.add(postData.text);
+
+        if (state.known.has(postKey(postData.text))) {
+            state.run++;
+            state.maxRun = Math.max(state.maxRun, state.run);
+        } else {
+            state.run = 0;
+        }
+    }
+    state.scanned = containers.length;
+
+    return { run: state.run, maxRun: state.maxRun, posts: state.seenTexts.size };
+}
@@ -0,0 +1,114 @@
+({ maxBuffer, knownKeys }) => {
+    // Already installed on this document, keep the existing buffer
+    if (window.__fbPostCollector) {
+        return { ...window.__fbPostCollector.stats(), alreadyInstalled: true };
+    }
+
+    // Per-container extractor, injected from extract_container_post_data.js
+    const extractContainerPostData = EXTRACT_CONTAINER_POST_DATA;
+    // Text key function, injected from post_key.js
+    const postKey = POST_KEY;
+    const known = new Set(knownKeys || []);
+    const containerSelector = '[data-mcomponent="MContainer"]';
+
+    const seenTexts = new Set();
+    const doneContainers = new WeakSet();
+    const pendingContainers = new Set();
+    const buffer = [];
+    let sequence = 0;
+    let dropped = 0;
+    let skippedKnown = 0;
+    let flushScheduled = false;
+
+    const collect = (containerEl) => {
+        if (doneContainers.has(containerEl)) return;
+        let postData = null;
+        try {
+            postData = extractContainerPostData(containerEl, sequence);
+        } catch (e) {
+            return;
+        }
+        // Container without text yet is retried on its next mutation
+        if (!postData || !postData.text) return;
+        doneContainers.add(containerEl);
+
+        // Record each post once, nested containers yield the same text
+        if (seenTexts.has(postData.text)) return;
+        seenTexts.add(postData.text);
+
+        // Already scraped in an earlier loop, don't buffer it again
+        if (known.size > 0 && known.has(postKey(postData.text))) {
+            skippedKnown++;
+            return;
+        }
+        sequence++;
+
+        buffer.push(postData);
+        if (buffer.length > maxBuffer) {
+            buffer.shift();
+            dropped++;
+        }
+    };
+
+    const flush = () => {
+        flushScheduled = false;
+        for (const containerEl of pendingContainers) {
+            if (containerEl.isConnected) collect(containerEl);
+        }
+        pendingContainers.clear();
+    };
+
+    const enqueue = (node) => {
+        if (!node || node.nodeType !== Node.ELEMENT_NODE) return;
+        const owner = node.closest(containerSelector);
+        if (owner) pendingContainers.add(owner);
+        node.querySelectorAll(containerSelector).forEach(el => pendingContainers.add(el));
+    };
+
+    const observer = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            if (mutation.type === 'childList') {
+                mutation.addedNodes.forEach(enqueue);
+            } else if (mutation.target) {
+                enqueue(mutation.target.parentElement);
+            }
+        }
+        // Batch all mutations of this task into a single pass
+        if (!flushScheduled && pendingContainers.size > 0) {
+            flushScheduled = true;
+            queueMicrotask(flush);
+        }
+    });
+
+    window.__fbPostCollector = {
+        drain: (maxItems) => {
+            flush();
+            const posts = buffer.splice(0, maxItems || buffer.length);
+            return {
+                posts: posts,
+                remaining: buffer.length,
+                collected: sequence,
+                dropped: dropped,
+                skippedKnown: skippedKnown
+            };
+        },
+        stats: () => ({
+            buffered: buffer.length,
+            collected: sequence,
+            dropped: dropped,
+            skippedKnown: skippedKnown
+        }),
+        disconnect: () => observer.disconnect()
+    };
+
+    // Posts already in the DOM before the observer started
+    document.querySelectorAll(containerSelector).forEach(collect);
+
+    observer.observe(document.body, {
+        childList: true,
+        subtree: true,
+        characterData: true
+    });
+
+    return { ...window.__fbPostCollector.stats(), alreadyInstalled: false };
+}
@@ -0,0 +1,44 @@
+(searchTexts) => {
+    const normalize = (text) => (text || '').replace(/\s+/g, ' ').trim().slice(0, 100);
+
+    const findAuthor = (textEl) => {
+        let container = textEl.closest('[data-mcomponent="MContainer"]') || textEl.closest('.m');
+
+        // Search up the DOM tree for author
+        for (let i = 0; i < 5; i++) {
+            if (!container) break;
+
+            const authorEl = container.querySelector('span.f2.a[role="link"][data-focusable="true"]');
+            if (authorEl) {
+                return authorEl.textContent?.trim() || '';
+            }
+
+            container = container.parentElement;
+        }
+        return '';
+    };
+
+    // Authors are cached per element: recycled or replaced nodes miss the cache,
+    // a node whose text changed is resolved again
+    const cache = window.__fbAuthorCache || (window.__fbAuthorCache = new WeakMap());
+    const authorOf = (textEl, key) => {
+        const cached = cache.get(textEl);
+        if (cached && cached.key === key) return cached.author;
+        const author = findAuthor(textEl);
+        // No author yet may just mean it has not rendered, look again next call
+        if (author) cache.set(textEl, { key: key, author: author });
+        return author;
+    };
+
+    // Build the text-prefix -> author index from the current DOM on every call
+    const index = new Map();
+    for (const textEl of document.querySelectorAll('span.f1')) {
+        const key = normalize(textEl.textContent);
+        if (!key || index.has(key)) continue;
+        const author = authorOf(textEl, key);
+        // Keep looking at later elements with the same text if no author here
+        if (author) index.set(key, author);
+    }
+
+    return searchTexts.map(text => index.get(normalize(text)) || '');
+}
@@ -0,0 +1,95 @@
+async ({ delay, quietMs }) => {
+    const postSelector =
+        '[data-mcomponent="MContainer"]:has([data-mcomponent="TextArea"]), ' +
+        '[data-testid="post_message"], [data-testid="post_text"], ' +
+        '.userContent, .post-content, [data-nt="NT:TEXT"]';
+    const containerSelector = '[data-mcomponent="MContainer"]';
+
+    // Count in-flight fetch/XHR requests, installed once per page.
+    // Resource timing entries only appear when a request finishes, so they
+    // cannot tell a pending feed request apart from an idle network.
+    if (!window.__scrapeNetwork) {
+        const network = { inflight: 0, lastActivity: performance.now() };
+        const started = () => {
+            network.inflight++;
+            network.lastActivity = performance.now();
+        };
+        const finished = () => {
+            network.inflight = Math.max(0, network.inflight - 1);
+            network.lastActivity = performance.now();
+        };
+
+        const originalFetch = window.fetch;
+        if (originalFetch) {
+            window.fetch = function (...args) {
+                started();
+                try {
+                    return originalFetch.apply(this, args).finally(finished);
+                } catch (e) {
+                    finished();
+                    throw e;
+                }
+            };
+        }
+
+        const originalSend = XMLHttpRequest.prototype.send;
+        XMLHttpRequest.prototype.send = function (...args) {
+            started();
+            this.addEventListener('loadend', finished, { once: true });
+            try {
+                return originalSend.apply(this, args);
+            } catch (e) {
+                finished();
+                throw e;
+            }
+        };
+        window.__scrapeNetwork = network;
+    }
+    const network = window.__scrapeNetwork;
+
+    const initialCount = document.querySelectorAll(containerSelector).length;
+    const started = performance.now();
+    network.lastActivity = Math.max(network.lastActivity, started);
+
+    // Other resources (images, scripts) also count as activity when they finish
+    let networkObserver = null;
+    try {
+        networkObserver = new PerformanceObserver(() => {
+            network.lastActivity = performance.now();
+        });
+        networkObserver.observe({ type: 'resource', buffered: false });
+    } catch (e) {
+        networkObserver = null;
+    }
+
+    // Scroll to bottom to load more posts
+    window.scrollTo(0, document.body.scrollHeight);
+
+    // Wait until new containers arrive or no request has been pending for quietMs,
+    // delay is only a cap (e.g. for a request that never completes)
+    const reason = await new Promise(resolve => {
+        const check = () => {
+            const now = performance.now();
+            if (document.querySelectorAll(containerSelector).length > initialCount) {
+                resolve('content');
+            } else if (network.inflight === 0 && now - network.lastActivity >= quietMs) {
+                resolve('network-idle');
+            } else if (now - started >= delay) {
+                resolve('timeout');
+            } else {
+                setTimeout(check, 100);
+            }
+        };
+        setTimeout(check, 100);
+    });
+
+    if (networkObserver) networkObserver.disconnect();
+
+    // Count without creating element handles on the Python side
+    return {
+        postCount: document.querySelectorAll(postSelector).length,
+        scrollHeight: document.body.scrollHeight,
+        waitedMs: Math.round(performance.now() - started),
+        reason: reason
+    };
+}
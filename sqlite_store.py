@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+SQLite Store - Optional indexed storage for posts, dedup hashes and AI analyses
+One database file in WAL mode, posts are upserted in one transaction per loop
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from AI.ai_cache import AICache
+from console import Console
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    hash TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    author TEXT,
+    timestamp TEXT,
+    url TEXT,
+    status TEXT,
+    sentiment_score REAL,
+    emotion TEXT,
+    key_topics TEXT,
+    loop INTEGER,
+    scraped_at TEXT,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_posts_author ON posts (author);
+CREATE INDEX IF NOT EXISTS idx_posts_timestamp ON posts (timestamp);
+CREATE INDEX IF NOT EXISTS idx_posts_status ON posts (status);
+CREATE INDEX IF NOT EXISTS idx_posts_sentiment ON posts (sentiment_score);
+
+CREATE TABLE IF NOT EXISTS seen_posts (
+    hash TEXT PRIMARY KEY
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS ai_cache (
+    key TEXT PRIMARY KEY,
+    analysis TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ai_cache_used_at ON ai_cache (used_at);
+"""
+
+UPSERT_POST = """
+INSERT INTO posts (
+    hash, text, author, timestamp, url, status, sentiment_score,
+    emotion, key_topics, loop, scraped_at, data
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (hash) DO UPDATE SET
+    text = excluded.text,
+    author = excluded.author,
+    timestamp = excluded.timestamp,
+    url = excluded.url,
+    status = excluded.status,
+    sentiment_score = excluded.sentiment_score,
+    emotion = excluded.emotion,
+    key_topics = excluded.key_topics,
+    loop = COALESCE(posts.loop, excluded.loop),
+    data = excluded.data
+"""
+
+
+class SQLiteStore:
+    """
+    Posts table keyed by the dedup hash, indexed on author, timestamp, status
+    and sentiment_score. The same file serves the dedup set and the AI cache
+    through SQLiteDedupSet and SQLiteAICache.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Saving may run on a worker thread (async engine), access is serialized by the lock
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.RLock()
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+            self.conn.commit()
+        Console.debug(f"🗄️ SQLite store opened: {path}")
+
+    def upsert_posts(
+        self,
+        posts: List[Dict[str, Any]],
+        post_hash: Callable[[Dict[str, Any]], str],
+        loop_number: Optional[int] = None,
+    ) -> int:
+        """Insert or update posts in a single transaction, returns rows written"""
+        scraped_at = datetime.now().isoformat()
+        rows = [
+            (
+                post_hash(post),
+                post.get("text", ""),
+                post.get("author", ""),
+                post.get("timestamp", ""),
+                post.get("url", ""),
+                post.get("status"),
+                post.get("sentiment_score"),
+                post.get("emotion"),
+                json.dumps(post.get("key_topics") or [], ensure_ascii=False),
+                loop_number,
+                scraped_at,
+                json.dumps(post, ensure_ascii=False),
+            )
+            for post in posts
+        ]
+        with self.lock, self.conn:
+            self.conn.executemany(UPSERT_POST, rows)
+        return len(rows)
+
+    def _where(
+        self,
+        author: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+    ):
+        clauses, params = [], []
+        if author is not None:
+            clauses.append("author = ?")
+            params.append(author)
+        if status is not None:
+            clauses.append("status = ?")
+            params.append(status)
+        # Timestamps are ISO strings, so they compare in time order
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+        if min_score is not None:
+            clauses.append("sentiment_score >= ?")
+            params.append(min_score)
+        if max_score is not None:
+            clauses.append("sentiment_score <= ?")
+            params.append(max_score)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query_posts(
+        self,
+        author: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        min_score: Optional[float] = None,
+        max_score: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Posts matching every given filter, newest first.
+        e.g. query_posts(status="negative", since="2025-01-06")
+        """
+        where, params = self._where(author, status, since, until, min_score, max_score)
+        sql = f"SELECT data FROM posts{where} ORDER BY timestamp DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [json.loads(row["data"]) for row in rows]
+
+    def count_posts(self, **filters) -> int:
+        where, params = self._where(**filters)
+        with self.lock:
+            return self.conn.execute(f"SELECT COUNT(*) FROM posts{where}", params).fetchone()[0]
+
+    def status_counts(self) -> Dict[str, int]:
+        """Number of posts per sentiment status"""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT COALESCE(status, 'unknown') AS status, COUNT(*) AS n FROM posts GROUP BY 1"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self) -> None:
+        with self.lock:
+            if self.conn is not None:
+                self.conn.commit()
+                self.conn.close()
+                self.conn = None
+
+
+class SQLiteDedupSet:
+    """
+    Same interface as DedupStore, hashes live in the seen_posts table.
+    add() keeps a hash in memory until persist() stores it with the saved posts.
+    """
+
+    persistent = True
+
+    def __init__(self, store: SQLiteStore):
+        self.store = store
+        self._pending: Set[str] = set()  # Seen this run, not saved yet
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._pending:
+            return True
+        with self.store.lock:
+            row = self.store.conn.execute(
+                "SELECT 1 FROM seen_posts WHERE hash = ?", (key,)
+            ).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        with self.store.lock:
+            saved = self.store.conn.execute("SELECT COUNT(*) FROM seen_posts").fetchone()[0]
+        return saved + len(self._pending)
+
+    def add(self, key: str) -> None:
+        if key not in self:
+            self._pending.add(key)
+
+    def persist(self, keys: Iterable[str]) -> None:
+        """Store hashes of saved posts in one transaction"""
+        keys = list(keys)
+        with self.store.lock, self.store.conn:
+            self.store.conn.executemany(
+                "INSERT OR IGNORE INTO seen_posts (hash) VALUES (?)",
+                [(key,) for key in keys],
+            )
+        self._pending.difference_update(keys)
+
+    def flush(self) -> None:
+        with self.store.lock:
+            self.store.conn.commit()
+
+    def close(self) -> None:
+        # The connection is shared, SQLiteStore.close() releases it
+        if self.store.conn is not None:
+            self.flush()
+
+
+class SQLiteAICache(AICache):
+    """
+    AICache backed by the ai_cache table instead of a JSON file.
+    LRU order is the used_at column, put() is committed by save().
+    """
+
+    def __init__(self, store: SQLiteStore, fingerprint: str, max_entries: int = 20000):
+        super().__init__(None, fingerprint, max_entries)
+        self.store = store
+
+    def get(self, text: str) -> Optional[Dict[str, Any]]:
+        key = self.key(text)
+        with self.store.lock:
+            row = self.store.conn.execute(
+                "SELECT analysis FROM ai_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.store.conn.execute(
+                "UPDATE ai_cache SET used_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self.hits += 1
+            self._dirty = True
+        return json.loads(row["analysis"])
+
+    def put(self, text: str, analysis: Dict[str, Any]):
+        with self.store.lock:
+            self.store.conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, analysis, used_at) VALUES (?, ?, ?)",
+                (self.key(text), json.dumps(analysis, ensure_ascii=False), time.time()),
+            )
+            self._dirty = True
+
+    def save(self):
+        """Evict least-recently-used entries and commit"""
+        with self.store.lock:
+            if not self._dirty:
+                return
+            conn = self.store.conn
+            excess = conn.execute("SELECT COUNT(*) FROM ai_cache").fetchone()[0] - self.max_entries
+            if excess > 0:
+                conn.execute(
+                    "DELETE FROM ai_cache WHERE key IN "
+                    "(SELECT key FROM ai_cache ORDER BY used_at LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+            conn.commit()
+            self._dirty = False
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self.store.lock:
+            stats["entries"] = self.store.conn.execute(
+                "SELECT COUNT(*) FROM ai_cache"
+            ).fetchone()[0]
+        return stats
@@ -1,6 +1,8 @@
 import os
+import re
 import json
 import csv
+from contextlib import contextmanager
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -26,6 +28,42 @@ def read_js_script(script_name: str, script_dir: Optional[str] = None) -> str:
         return ""
 
 
+def post_text_key(text: str) -> str:
+    """
+    Compact key of a post text, identical to script/post_key.js in the page.
+    FNV-1a 32-bit over the UTF-16 code units of the normalized text.
+    :param text: Raw or cleaned post text
+    :return: 8-char hex key
+    """
+    normalized = re.sub(r"[\u200B-\u200D\uFEFF]", "", text or "")
+    normalized = re.sub(r"\s+", " ", normalized).strip().lower()
+
+    data = normalized.encode("utf-16-le")
+    hash_value = 0x811C9DC5
+    for i in range(0, len(data), 2):
+        hash_value ^= data[i] | (data[i + 1] << 8)
+        hash_value = (hash_value * 0x01000193) & 0xFFFFFFFF
+    return f"{hash_value:08x}"
+
+
+@contextmanager
+def atomic_write(filename: str, newline: Optional[str] = None):
+    """
+    Open a temp file next to filename and rename it over filename on success,
+    so a crash or Ctrl-C mid-write never leaves a truncated file behind.
+    """
+    temp_path = f"{filename}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline=newline) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, filename)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
 def save_to_file(
     posts: List[Dict[str, Any]],
     stats: Dict[str, Any],
@@ -34,35 +72,53 @@ def save_to_file(
 ):
     """Save posts to JSON file with statistics"""
     try:
-        # Create output directory if filename contains output path
-        if "/" in filename or "\\" in filename:
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-        data = {
-            "scrapedAt": datetime.now().isoformat(),
-            "totalPosts": len(posts),
-            "source": source,
-            "method": "CDP Session (Mobile) + Advanced Cleaning",
-            "cleaningStats": stats,
-            "posts": posts,
-        }
-
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"💾 Clean data berhasil disimpan ke {filename}")
+        save_json_snapshot(posts, stats, filename, source)
 
+        _, csv_filename, report_filename = saved_file_paths(filename)
         # Also create CSV file for analysis
-        csv_filename = filename.replace(".json", ".csv")
         save_to_csv(posts, csv_filename)
 
         # Save cleaning report
-        report_filename = filename.replace(".json", "_cleaning_report.json")
         save_cleaning_report(stats, report_filename)
 
     except Exception as error:
         print(f"❌ Error saving to file: {error}")
 
 
+def save_json_snapshot(
+    posts: List[Dict[str, Any]],
+    stats: Dict[str, Any],
+    filename: str,
+    source: str = "https://m.facebook.com/me",
+):
+    """Atomically write the posts JSON with metadata, without CSV or report"""
+    # Create output directory if filename contains output path
+    if "/" in filename or "\\" in filename:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+    data = {
+        "scrapedAt": datetime.now().isoformat(),
+        "totalPosts": len(posts),
+        "source": source,
+        "method": "CDP Session (Mobile) + Advanced Cleaning",
+        "cleaningStats": stats,
+        "posts": posts,
+    }
+
+    with atomic_write(filename) as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    print(f"💾 Clean data berhasil disimpan ke {filename}")
+
+
+def saved_file_paths(filename: str) -> List[str]:
+    """JSON, CSV and cleaning report paths written by save_to_file"""
+    return [
+        filename,
+        filename.replace(".json", ".csv"),
+        filename.replace(".json", "_cleaning_report.json"),
+    ]
+
+
 def save_cleaning_report(stats: Dict[str, Any], filename: str):
     """Save cleaning report to file"""
     try:
@@ -70,13 +126,43 @@ def save_cleaning_report(stats: Dict[str, Any], filename: str):
         if "/" in filename or "\\" in filename:
             os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-        with open(filename, "w", encoding="utf-8") as f:
+        with atomic_write(filename) as f:
             json.dump(stats, f, indent=2, ensure_ascii=False)
         print(f"📊 Cleaning report saved to {filename}")
     except Exception as error:
         print(f"❌ Error saving cleaning report: {error}")
 
 
+CSV_HEADER = [
+    "Text",
+    "Timestamp",
+    "Author",
+    "URL",
+    "Status",
+    "Sentiment_Score",
+    "Emotion",
+    "Key_Topics",
+]
+
+
+def _csv_row(post: Dict[str, Any]) -> List[Any]:
+    """One CSV row of a post"""
+    # Convert key_topics list to comma-separated string
+    key_topics_str = (
+        ", ".join(post.get("key_topics", [])) if post.get("key_topics") else ""
+    )
+    return [
+        post.get("text", ""),
+        post.get("timestamp", ""),
+        post.get("author", ""),
+        post.get("url", ""),
+        post.get("status", ""),
+        f"{post.get('sentiment_score', 0):.2f}",
+        post.get("emotion", ""),
+        key_topics_str,
+    ]
+
+
 def save_to_csv(posts: List[Dict[str, Any]], filename: str):
     """Save posts to CSV file with sentiment analysis"""
     try:
@@ -84,42 +170,195 @@ def save_to_csv(posts: List[Dict[str, Any]], filename: str):
         if "/" in filename or "\\" in filename:
             os.makedirs(os.path.dirname(filename), exist_ok=True)
 
-        with open(filename, "w", newline="", encoding="utf-8") as csvfile:
+        with atomic_write(filename, newline="") as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(
-                [
-                    "Text",
-                    "Timestamp",
-                    "Author",
-                    "URL",
-                    "Status",
-                    "Sentiment_Score",
-                    "Emotion",
-                    "Key_Topics",
-                ]
-            )
-
+            writer.writerow(CSV_HEADER)
             for post in posts:
-                # Convert key_topics list to comma-separated string
-                key_topics_str = (
-                    ", ".join(post.get("key_topics", []))
-                    if post.get("key_topics")
-                    else ""
-                )
-
-                writer.writerow(
-                    [
-                        post.get("text", ""),
-                        post.get("timestamp", ""),
-                        post.get("author", ""),
-                        post.get("url", ""),
-                        post.get("status", ""),
-                        f"{post.get('sentiment_score', 0):.2f}",
-                        post.get("emotion", ""),
-                        key_topics_str,
-                    ]
-                )
+                writer.writerow(_csv_row(post))
 
         print(f"📊 Data CSV berhasil disimpan ke {filename}")
     except Exception as error:
         print(f"❌ Error saat menyimpan CSV: {error}")
+
+
+def append_to_csv(posts: List[Dict[str, Any]], filename: str):
+    """Append posts to a CSV file, the header is written only for a new file"""
+    try:
+        if "/" in filename or "\\" in filename:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        truncate_torn_csv_row(filename)
+        new_file = not os.path.exists(filename) or os.path.getsize(filename) == 0
+        with open(filename, "a", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            if new_file:
+                writer.writerow(CSV_HEADER)
+            for post in posts:
+                writer.writerow(_csv_row(post))
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        _CLEAN_CSV_SIZES[filename] = os.path.getsize(filename)
+    except Exception as error:
+        print(f"❌ Error saat menambah CSV: {error}")
+
+
+# Size of CSV files this process last left ending on a complete row
+_CLEAN_CSV_SIZES: Dict[str, int] = {}
+
+
+def truncate_torn_csv_row(filename: str) -> int:
+    """
+    CSV version of truncate_torn_line: a newline inside a quoted field does not
+    end a row, so the file is cut after the last newline preceded by an even
+    number of quotes. Needs one pass over the file, skipped while the size still
+    matches the last append of this process. Returns the bytes removed.
+    """
+    if not os.path.exists(filename):
+        return 0
+    size = os.path.getsize(filename)
+    if size == 0 or _CLEAN_CSV_SIZES.get(filename) == size:
+        return 0
+
+    keep = 0
+    quoted = False
+    with open(filename, "rb+") as f:
+        position = 0
+        while True:
+            chunk = f.read(1 << 20)
+            if not chunk:
+                break
+            # Every other piece between quotes lies outside a quoted field
+            offset = position
+            for piece in chunk.split(b'"'):
+                if not quoted:
+                    newline = piece.rfind(b"\n")
+                    if newline != -1:
+                        keep = offset + newline + 1
+                offset += len(piece) + 1
+                quoted = not quoted
+            # The chunk does not end with a quote, undo the last toggle
+            quoted = not quoted
+            position += len(chunk)
+
+        if keep == size:
+            _CLEAN_CSV_SIZES[filename] = size
+            return 0
+        f.truncate(keep)
+        f.flush()
+        os.fsync(f.fileno())
+    _CLEAN_CSV_SIZES[filename] = keep
+    print(f"⚠️ Removed torn last row of {filename} ({size - keep} bytes)")
+    return size - keep
+
+
+def truncate_torn_line(filename: str) -> int:
+    """
+    Cut a partially written last line (crash mid-append) back to the last newline,
+    so the next append starts on a clean line. Returns the bytes removed.
+    """
+    if not os.path.exists(filename):
+        return 0
+    with open(filename, "rb+") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0
+        f.seek(size - 1)
+        if f.read(1) == b"\n":
+            return 0
+
+        # Scan backwards for the last complete line
+        end = size
+        keep = 0
+        while end > 0:
+            start = max(0, end - 65536)
+            f.seek(start)
+            position = f.read(end - start).rfind(b"\n")
+            if position != -1:
+                keep = start + position + 1
+                break
+            end = start
+        f.truncate(keep)
+        f.flush()
+        os.fsync(f.fileno())
+    print(f"⚠️ Removed torn last line of {filename} ({size - keep} bytes)")
+    return size - keep
+
+
+def append_jsonl(posts: List[Dict[str, Any]], filename: str):
+    """Append posts to a JSON Lines file, one post per line, fsynced per batch"""
+    try:
+        if "/" in filename or "\\" in filename:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        truncate_torn_line(filename)
+        with open(filename, "a", encoding="utf-8") as f:
+            for post in posts:
+                f.write(json.dumps(post, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+    except Exception as error:
+        print(f"❌ Error appending to {filename}: {error}")
+
+
+def save_checkpoint(state: Dict[str, Any], filename: str):
+    """Atomically write the continuous-mode checkpoint"""
+    try:
+        if "/" in filename or "\\" in filename:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        with atomic_write(filename) as f:
+            json.dump(state, f, ensure_ascii=False)
+    except Exception as error:
+        print(f"❌ Error saving checkpoint: {error}")
+
+
+def load_checkpoint(filename: str) -> Optional[Dict[str, Any]]:
+    """Checkpoint written by save_checkpoint, or None"""
+    if not filename or not os.path.exists(filename):
+        return None
+    try:
+        with open(filename, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as error:
+        print(f"⚠️ Checkpoint {filename} unreadable: {error}")
+        return None
+
+
+def save_jsonl(records: List[Dict[str, Any]], filename: str):
+    """Atomically (re)write a JSON Lines file"""
+    try:
+        if "/" in filename or "\\" in filename:
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+        with atomic_write(filename) as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except Exception as error:
+        print(f"❌ Error saving {filename}: {error}")
+
+
+def read_jsonl(
+    filename: str, start: int = 0, end: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Read the posts of a JSON Lines file, or only those in the byte range
+    start..end (offsets recorded by the checkpoint). A torn last line is skipped.
+    """
+    posts = []
+    if not os.path.exists(filename):
+        return posts
+    with open(filename, "rb") as f:
+        f.seek(start)
+        position = start
+        for line in f:
+            position += len(line)
+            if end is not None and position > end:
+                break
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                posts.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"⚠️ Skipped unreadable line in {filename}")
+    return posts
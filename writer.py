@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Background Writer - Runs file saves off the scraping thread
+Save requests are queued in order, a pending rewrite of the same target is replaced
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
+from console import Console
+
+
+class BackgroundWriter:
+    """
+    Single worker thread executing save functions (utils.save_to_file, ...).
+    submit() with a key coalesces: if a job for that key is still queued it is
+    dropped and the newer one is queued at the tail, so it still runs after
+    everything submitted before it. Jobs without a key (appends) are never merged.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._jobs: "OrderedDict[Any, tuple]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "coalesced": 0,  # Queued rewrites replaced by a newer one
+            "failed": 0,
+            "bytesWritten": 0,
+            "latencyTotal": 0.0,
+            "latencyMax": 0.0,
+        }
+        if enabled:
+            self._thread = threading.Thread(
+                target=self._run, name="background-writer", daemon=True
+            )
+            self._thread.start()
+            # Queued saves still reach the disk when the process exits
+            atexit.register(self.close)
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        paths: Iterable[str] = (),
+        append: bool = False,
+    ) -> None:
+        """
+        Queue func(*args). `paths` are the files it writes (for bytesWritten),
+        `append` means they grow instead of being rewritten.
+        """
+        job = (func, args, tuple(paths), append)
+        with self._cond:
+            self._stats["submitted"] += 1
+        if not self.enabled or self._closed:
+            self._execute(job)
+            return
+
+        with self._cond:
+            if key is None:
+                key = object()
+            elif self._jobs.pop(key, None) is not None:
+                self._stats["coalesced"] += 1
+            self._jobs[key] = job
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._jobs and not self._closed:
+                    self._cond.wait()
+                if not self._jobs:
+                    return
+                _, job = self._jobs.popitem(last=False)
+                self._busy = True
+            try:
+                self._execute(job)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _execute(self, job: tuple) -> None:
+        func, args, paths, append = job
+        sizes_before = [self._size(path) for path in paths] if append else []
+        started = time.perf_counter()
+        try:
+            func(*args)
+        except Exception as error:
+            with self._cond:
+                self._stats["failed"] += 1
+            Console.error(f"❌ Background write failed ({func.__name__}): {error}")
+            return
+        latency = time.perf_counter() - started
+
+        sizes_after = [self._size(path) for path in paths]
+        if append:
+            written = sum(max(0, a - b) for a, b in zip(sizes_after, sizes_before))
+        else:
+            written = sum(sizes_after)
+        with self._cond:
+            self._stats["written"] += 1
+            self._stats["bytesWritten"] += written
+            self._stats["latencyTotal"] += latency
+            self._stats["latencyMax"] = max(self._stats["latencyMax"], latency)
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def flush(self) -> None:
+        """Block until every queued save has been written"""
+        if not self._thread:
+            return
+        with self._cond:
+            while self._jobs or self._busy:
+                self._cond.wait()
+
+    def close(self) -> None:
+        """Flush and stop the worker thread"""
+        if self._closed:
+            return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """Write counters, latency in seconds"""
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queued"] = len(self._jobs)
+        stats["latencyAvg"] = (
+            round(stats["latencyTotal"] / stats["written"], 4) if stats["written"] else 0.0
+        )
+        stats["latencyTotal"] = round(stats["latencyTotal"], 4)
+        stats["latencyMax"] = round(stats["latencyMax"], 4)
+        return stats